@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MSR-V 게이트웨이 라우팅 결정 캐시 (SQLite, 워커 프로세스 간 공유)
+- 키: 텍스트 지문 (sha256) + lang + mode + 엔진 버전
+- 각 항목에 코퍼스 태그 기록: 엔진/게이트웨이 소스 + 엔진이 런타임에 읽는
+  샘플 파일 + 임계값 설정의 해시
+  → 모드별로 열 때 버전·코퍼스가 다른 항목은 삭제 (무효화)
+  (샘플/임계값이 태그에 없으면 낡은 route/is_fracture 가 적중으로 나가고,
+   get() 의 Fracture→MINI 검사도 저장된 is_fracture 만 보므로 잡지 못함)
+- 거버넌스: Fracture 트레이스의 MINI 결정은 저장하지도, 내보내지도 않음
+- 조회 시 절약된 지연 = 저장된 계산 시간 - 조회 시간 (부호 유지: 조회가 계산보다
+  느리면 음수로 합산 → 리포트 값은 캐시의 순 절감)
+
+사용:
+    cache = DecisionCache("gateway_cache.sqlite", mode="balanced",
+                          engine_version=__version__, corpus_tag=corpus_fingerprint([...], config))
+    hit = cache.get(text, lang)
+    if hit is None:
+        ... gateway.process(...) ...
+        cache.put(text, lang, route, is_fracture, api_called, compute_ms)
+"""
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+from typing import Dict, List, Any, Iterable, Optional
+
+# 미커밋 쓰기가 이 개수를 넘으면 커밋 (다른 프로세스에 보이게)
+COMMIT_EVERY = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decisions (
+    fingerprint    TEXT NOT NULL,
+    lang           TEXT NOT NULL,
+    mode           TEXT NOT NULL,
+    engine_version TEXT NOT NULL,
+    corpus_tag     TEXT NOT NULL,
+    route          TEXT NOT NULL,
+    is_fracture    INTEGER NOT NULL,
+    api_called     INTEGER NOT NULL,
+    compute_ms     REAL NOT NULL,
+    created_at     REAL NOT NULL,
+    PRIMARY KEY (fingerprint, lang, mode, engine_version)
+)
+"""
+
+
+def text_fingerprint(text: str) -> str:
+    """입력 텍스트 지문 (정규화 없이 그대로: 공백 차이도 라우팅에 영향)"""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def corpus_fingerprint(paths: Iterable[str], config: Any = None) -> str:
+    """결정에 영향을 주는 입력의 해시
+
+    paths: 엔진/게이트웨이 소스, 엔진 샘플 파일 (내용 해시, 없는 파일은 경로만 반영)
+    config: 임계값 등 설정 (JSON 으로 직렬화 가능한 값, 키 정렬 후 해시)
+    """
+    h = hashlib.sha256()
+    if config is not None:
+        h.update(json.dumps(config, sort_keys=True).encode("utf-8") + b"\0")
+    for path in paths:
+        h.update(path.encode("utf-8") + b"\0")
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+        except OSError:
+            h.update(b"<missing>")
+    return h.hexdigest()[:16]
+
+
+class DecisionCache:
+    """모드 하나에 대한 게이트웨이 결정 캐시 (프로세스마다 인스턴스 하나)"""
+
+    def __init__(self, path: str, mode: str, engine_version: str, corpus_tag: str,
+                 invalidate: bool = True):
+        self.path = path
+        self.mode = mode
+        self.engine_version = str(engine_version)
+        self.corpus_tag = corpus_tag
+        self._pending = 0
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0      # Fracture+MINI 항목 (저장/반환 거부)
+        self.saved_ms = 0.0
+        self.hit_ms = 0.0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # 여러 워커가 같은 파일 사용: WAL + 잠금 대기
+        self._conn = sqlite3.connect(path, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        # 워커는 부모가 이미 무효화한 캐시를 열므로 invalidate=False (DELETE 반복 방지)
+        self.invalidated = self._invalidate() if invalidate else 0
+
+    def _invalidate(self) -> int:
+        """이 모드에서 엔진 버전 또는 코퍼스가 바뀐 항목 삭제"""
+        with self._conn:
+            cur = self._conn.execute(
+                "DELETE FROM decisions WHERE mode = ? AND (engine_version != ? OR corpus_tag != ?)",
+                (self.mode, self.engine_version, self.corpus_tag),
+            )
+        return cur.rowcount
+
+    def get(self, text: str, lang: str) -> Optional[Dict[str, Any]]:
+        """캐시된 결정 ({route, is_fracture, api_called}) 또는 None"""
+        start = time.perf_counter()
+        row = self._conn.execute(
+            "SELECT route, is_fracture, api_called, compute_ms FROM decisions "
+            "WHERE fingerprint = ? AND lang = ? AND mode = ? AND engine_version = ? AND corpus_tag = ?",
+            (text_fingerprint(text), lang, self.mode, self.engine_version, self.corpus_tag),
+        ).fetchone()
+        elapsed = (time.perf_counter() - start) * 1000
+
+        if row is None:
+            self.misses += 1
+            return None
+        route, is_fracture, api_called, compute_ms = row
+        if is_fracture and route == "MINI":
+            # 거버넌스 위반 항목은 절대 내보내지 않음 → 엔진으로 재계산
+            self.rejected += 1
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.hit_ms += elapsed
+        self.saved_ms += compute_ms - elapsed
+        return {"route": route, "is_fracture": bool(is_fracture), "api_called": bool(api_called)}
+
+    def put(self, text: str, lang: str, route: str, is_fracture: bool,
+            api_called: bool, compute_ms: float) -> bool:
+        """결정 저장 (Fracture→MINI 결정은 저장하지 않고 False)"""
+        if is_fracture and route == "MINI":
+            self.rejected += 1
+            return False
+        self._conn.execute(
+            "INSERT OR REPLACE INTO decisions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (text_fingerprint(text), lang, self.mode, self.engine_version, self.corpus_tag,
+             route, int(bool(is_fracture)), int(bool(api_called)), float(compute_ms), time.time()),
+        )
+        self._pending += 1
+        if self._pending >= COMMIT_EVERY:
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        if self._pending:
+            self._conn.commit()
+            self._pending = 0
+
+    def clear(self) -> None:
+        """이 모드의 항목 전부 삭제"""
+        with self._conn:
+            self._conn.execute("DELETE FROM decisions WHERE mode = ?", (self.mode,))
+        self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def counters(self) -> Dict[str, Any]:
+        """원시 카운터 (워커별 값을 summarize_counters 로 합산)"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "rejected": self.rejected,
+            "saved_ms": self.saved_ms,
+            "hit_ms": self.hit_ms,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return summarize_counters([self.counters()], self.invalidated)
+
+
+def summarize_counters(counters: List[Dict[str, Any]], invalidated: int = 0) -> Dict[str, Any]:
+    """여러 워커/청크의 카운터 합산 → 리포트용 통계"""
+    total = {k: sum(c[k] for c in counters) for k in ("hits", "misses", "rejected", "saved_ms", "hit_ms")}
+    hits = total["hits"]
+    lookups = hits + total["misses"]
+    return {
+        "hits": hits,
+        "misses": total["misses"],
+        "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        "rejected_fracture_mini": total["rejected"],
+        "invalidated": invalidated,
+        "latency_saved_ms": round(total["saved_ms"], 3),
+        "avg_hit_ms": round(total["hit_ms"] / hits, 4) if hits else 0.0,
+    }
@@ -13,6 +13,7 @@ import sys
 import os
 import json
 import time
+import argparse
 from datetime import datetime
 from typing import Dict, List, Any
 
@@ -24,6 +25,16 @@ ENGINE_PATH = "/home/claude/msrv_v255_unified_patched.py"
 GATEWAY_PATH = "/home/claude/msrv_gateway_v11_patched.py"
 SAMPLES_PATH = "/mnt/user-data/uploads/benchmark_balanced_details.jsonl"
 OUTPUT_DIR = "/home/claude/gateway_benchmark_results"
+# --parquet: 상세 결과 컬럼 저장 모듈 위치 (tools_patched/details_columnar.py)
+TOOLS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tools_patched")
+# --cache: 라우팅 결정 캐시 (SQLite, 워커 프로세스 간 공유)
+CACHE_PATH = os.path.join(OUTPUT_DIR, "gateway_decision_cache.sqlite")
+# 엔진이 런타임에 읽는 샘플 파일 (캐시 코퍼스 태그에 포함, None 이면 엔진의 samples_path)
+ENGINE_SAMPLES_PATH = None
+
+# 지연 퍼센타일/신뢰구간 (엔진 벤치마크와 공용, tools_patched/latency_stats.py)
+sys.path.insert(0, TOOLS_DIR)
+from latency_stats import LatencyRecorder, DEFAULT_BOOTSTRAP, format_stats, median_over_runs, report_notes, trace_path
 
 MODES = ["conservative", "balanced", "aggressive"]
 
@@ -31,7 +42,7 @@ MODES = ["conservative", "balanced", "aggressive"]
 # 엔진 및 게이트웨이 로드
 # ============================================================================
 
-def load_modules():
+def load_modules(verbose: bool = True):
     """엔진과 게이트웨이 모듈 로드"""
     
     # 엔진 로드
@@ -44,7 +55,8 @@ def load_modules():
         gateway_code = f.read().split("if __name__ ==")[0]
         exec(gateway_code, globals())
     
-    print(f"✅ 엔진 버전: {globals().get('__version__', 'unknown')}")
+    if verbose:
+        print(f"✅ 엔진 버전: {globals().get('__version__', 'unknown')}")
 
 # ============================================================================
 # backward-compat 테스트
@@ -108,29 +120,75 @@ def test_backward_compat():
 # 게이트웨이 벤치마크
 # ============================================================================
 
-def run_gateway_benchmark():
-    """게이트웨이 + 엔진 통합 벤치마크"""
-    print("\n" + "=" * 80)
-    print("📊 게이트웨이 통합 벤치마크 (4,200개 샘플)")
-    print("=" * 80)
-    
-    # 샘플 로드
+def load_samples(path: str = None) -> List[tuple]:
+    """샘플을 한 번만 파싱 → (id, text, lang, dataset) 튜플 리스트 (워커와 공유)"""
     samples = []
-    with open(SAMPLES_PATH, "r", encoding="utf-8") as f:
+    with open(path or SAMPLES_PATH, "r", encoding="utf-8") as f:
         for line in f:
             if line.strip():
-                samples.append(json.loads(line))
-    
-    print(f"\n📁 로드된 샘플: {len(samples)}개")
-    
-    results = {}
-    
-    for mode in MODES:
-        print(f"\n{'─' * 60}")
-        print(f"🔧 모드: {mode.upper()}")
-        print("─" * 60)
-        
-        # 엔진 + 게이트웨이 생성
+                s = json.loads(line)
+                samples.append((s.get("id"), s.get("text", ""), s.get("lang", "EN"), s.get("dataset")))
+    return samples
+
+
+def _plain_config(obj: Any) -> Any:
+    """설정 객체 → JSON 직렬화 가능한 값 (코퍼스 태그용)"""
+    if isinstance(obj, dict):
+        return {str(k): _plain_config(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_plain_config(v) for v in obj]
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if hasattr(obj, "__dict__"):
+        return {k: _plain_config(v) for k, v in vars(obj).items() if not callable(v)}
+    return str(obj)
+
+
+def cache_corpus_inputs():
+    """결정 캐시 코퍼스 태그 입력: (파일 목록, 설정)
+
+    파일: 엔진/게이트웨이 소스 + 엔진이 런타임에 읽는 샘플 파일
+    설정: ThresholdConfig 와 엔진의 모드별 임계값 (MODE_THRESHOLDS)
+    """
+    cfg = globals()["ThresholdConfig"]()
+    engine = globals()["MSRVEngineV25"](cfg)
+    paths = [ENGINE_PATH, GATEWAY_PATH]
+    samples_path = ENGINE_SAMPLES_PATH or getattr(engine, "samples_path", None)
+    if samples_path:
+        paths.append(samples_path)
+    else:
+        print("⚠️  엔진 샘플 파일 경로를 알 수 없음 (ENGINE_SAMPLES_PATH 설정 필요) "
+              "→ 샘플 변경은 캐시 무효화에 반영되지 않음")
+    config = {
+        "threshold_config": _plain_config(cfg),
+        "mode_thresholds": _plain_config(getattr(engine, "MODE_THRESHOLDS", None)),
+    }
+    return paths, config
+
+
+# 워커 프로세스 상태: 샘플은 initializer 로 한 번만 전달 (fork 에서는 복사 없이 상속)
+_WORKER: Dict[str, Any] = {"samples": None, "gateways": {}, "caches": {}, "cache": None, "warmup": 0}
+
+
+def _init_worker(samples: List[tuple], cache_cfg: tuple = None, warmup: int = 0):
+    """워커 초기화 (spawn 방식이면 엔진/게이트웨이 모듈을 다시 로드)"""
+    if "MSRVGateway" not in globals():
+        load_modules(verbose=False)
+    _close_worker_caches()
+    _WORKER["samples"] = samples
+    _WORKER["gateways"] = {}
+    _WORKER["cache"] = cache_cfg
+    _WORKER["warmup"] = warmup
+    if cache_cfg:
+        # 풀 워커는 atexit 을 실행하지 않음 → multiprocessing 종료 훅으로 캐시 닫기
+        from multiprocessing import util
+        util.Finalize(None, _close_worker_caches, exitpriority=10)
+
+
+def _mode_gateway(mode: str):
+    """모드별 엔진 + 게이트웨이 (워커마다 한 번 생성 후 청크 간 재사용)"""
+    gateway = _WORKER["gateways"].get(mode)
+    if gateway is None:
         cfg = globals()["ThresholdConfig"]()
         engine = globals()["MSRVEngineV25"](cfg)
         engine.set_mode(mode)
@@ -139,51 +197,215 @@ def run_gateway_benchmark():
             log_level="WARNING",
             engine_mode=mode
         )
-        gateway = globals()["MSRVGateway"](engine, gw_cfg)
+        gateway = _WORKER["gateways"][mode] = globals()["MSRVGateway"](engine, gw_cfg)
         
-        # 통계
-        route_counts = {"MINI": 0, "STANDARD": 0, "PREMIUM": 0}
-        latencies = []
-        sample_results = []
-        
-        # Fracture 안전성 체크
-        fracture_count = 0
-        fracture_mini = 0
-        
-        start_total = time.perf_counter()
+        # 예열: 첫 호출 비용이 측정에 섞이지 않게 처음 N개 샘플을 미리 처리 (결과는 버림)
+        for _, text, lang, _ in _WORKER["samples"][:_WORKER["warmup"]]:
+            gateway.process(text=text, lang=lang, api_type="llm")
+    return gateway
+
+
+def _mode_cache(mode: str):
+    """모드별 결정 캐시 (워커마다 한 번 열어 청크 간 재사용, 무효화는 부모가 이미 수행)"""
+    if not _WORKER["cache"]:
+        return None
+    cache = _WORKER["caches"].get(mode)
+    if cache is None:
+        from gateway_decision_cache import DecisionCache
+        cache_path, engine_version, corpus_tag = _WORKER["cache"]
+        cache = _WORKER["caches"][mode] = DecisionCache(
+            cache_path, mode, engine_version, corpus_tag, invalidate=False)
+    return cache
+
+
+def _close_worker_caches():
+    for cache in _WORKER["caches"].values():
+        cache.close()
+    _WORKER["caches"] = {}
+
+
+def _run_chunk(mode: str, lo: int, hi: int) -> Dict[str, Any]:
+    """samples[lo:hi] 를 한 모드로 처리 → 청크 결과 (부모에서 순서대로 병합)"""
+    gateway = _mode_gateway(mode)
+    samples = _WORKER["samples"]
+    
+    cache = _mode_cache(mode)
+    counters_before = cache.counters() if cache else None
+    
+    # 통계
+    route_counts = {"MINI": 0, "STANDARD": 0, "PREMIUM": 0}
+    latencies = []
+    sample_results = []
+    
+    # Fracture 안전성 체크
+    fracture_count = 0
+    fracture_mini = 0
+    
+    start_chunk = time.perf_counter()
+    
+    for i in range(lo, hi):
+        sample_id, text, lang, dataset = samples[i]
         
-        for i, sample in enumerate(samples):
-            text = sample.get("text", "")
-            lang = sample.get("lang", "EN")
-            
-            start = time.perf_counter()
+        start = time.perf_counter()
+        cached = cache.get(text, lang) if cache else None
+        if cached is not None:
+            route = cached["route"]
+            is_fracture = cached["is_fracture"]
+            api_called = cached["api_called"]
+            path = "cache"
+        else:
+            compute_start = time.perf_counter()
             result = gateway.process(text=text, lang=lang, api_type="llm")
-            elapsed = (time.perf_counter() - start) * 1000
-            
-            latencies.append(elapsed)
+            compute_ms = (time.perf_counter() - compute_start) * 1000
             route = result.route.value
-            route_counts[route] += 1
+            api_called = result.api_called
             
             # 거버넌스 트레이스에서 is_fracture 확인
             gov_trace = result.governance_trace
             route_reason = gov_trace.get("output", {}).get("route_reason", {})
             is_fracture = route_reason.get("is_fracture", False)
+            path = trace_path(gov_trace)
             
-            if is_fracture:
-                fracture_count += 1
-                if route == "MINI":
-                    fracture_mini += 1
-            
-            sample_results.append({
-                "id": sample.get("id"),
-                "route": route,
-                "latency_ms": round(elapsed, 4),
-                "api_called": result.api_called,
-                "is_fracture": is_fracture,
-            })
+            if cache:
+                cache.put(text, lang, route, is_fracture, api_called, compute_ms)
+        elapsed = (time.perf_counter() - start) * 1000
         
-        total_time = time.perf_counter() - start_total
-        total = len(samples)
+        latencies.append(elapsed)
+        route_counts[route] += 1
+        
+        if is_fracture:
+            fracture_count += 1
+            if route == "MINI":
+                fracture_mini += 1
+        
+        sample_results.append({
+            "id": sample_id,
+            "dataset": dataset,
+            "path": path,
+            "route": route,
+            "latency_ms": round(elapsed, 4),
+            "api_called": api_called,
+            "is_fracture": is_fracture,
+            "cache_hit": cached is not None,
+        })
+    
+    chunk = {
+        "mode": mode,
+        "lo": lo,
+        "route_counts": route_counts,
+        "latencies": latencies,
+        "samples": sample_results,
+        "fracture_count": fracture_count,
+        "fracture_mini": fracture_mini,
+        "time_sec": time.perf_counter() - start_chunk,
+    }
+    if cache:
+        # 청크 끝에 커밋 → 다른 워커가 이 청크의 결정을 바로 조회 가능
+        cache.flush()
+        counters = cache.counters()
+        chunk["cache"] = {k: counters[k] - counters_before[k] for k in counters}
+    return chunk
+
+
+def run_gateway_benchmark(cache_path: str = None, cache_reset: bool = False,
+                          workers: int = 1, chunk_size: int = 0,
+                          warmup: int = 0, repeat: int = 1, bootstrap: int = DEFAULT_BOOTSTRAP):
+    """게이트웨이 + 엔진 통합 벤치마크
+
+    cache_path: 결정 캐시 파일 (None 이면 캐시 없이 매번 엔진 호출).
+    키는 텍스트 지문 + lang + mode + 엔진 버전, 엔진/게이트웨이 소스나
+    엔진 샘플 파일, 임계값이 바뀌면 (코퍼스 변경) 해당 모드 항목은 무효화됨.
+
+    workers > 1: (모드, 청크) 작업을 프로세스 풀에서 동시에 실행.
+    청크 결과는 샘플 순서대로 병합 → 라우팅/Fracture 집계는 직렬 실행과 동일.
+
+    warmup: 모드별 게이트웨이를 만들 때 처음 N개 샘플로 예열 (결과는 버림).
+    repeat: 전체 실행을 N회 반복, 샘플별 지연은 중앙값 (캐시와 함께 쓸 수 없음).
+    지연은 전체/데이터셋별/경로별 p50/p90/p99/max 와 부트스트랩 신뢰구간으로 요약.
+    """
+    repeat = max(1, repeat)
+    if cache_path and repeat > 1:
+        raise ValueError("repeat > 1 은 결정 캐시와 함께 쓸 수 없습니다 (두 번째 실행부터 전부 캐시 적중)")
+    print("\n" + "=" * 80)
+    print("📊 게이트웨이 통합 벤치마크 (4,200개 샘플)")
+    print("=" * 80)
+    
+    # 샘플 로드 (한 번만)
+    samples = load_samples()
+    total = len(samples)
+    
+    print(f"\n📁 로드된 샘플: {total}개")
+    
+    results = {}
+    
+    cache_cfg = None
+    invalidated = {}
+    if cache_path:
+        from gateway_decision_cache import DecisionCache, corpus_fingerprint, summarize_counters
+        engine_version = globals().get("__version__", "unknown")
+        corpus_tag = corpus_fingerprint(*cache_corpus_inputs())
+        cache_cfg = (cache_path, engine_version, corpus_tag)
+        print(f"🗄️  결정 캐시: {cache_path} (엔진 {engine_version}, 코퍼스 {corpus_tag})")
+        # 무효화/초기화는 워커 시작 전에 부모에서 한 번만
+        for mode in MODES:
+            with DecisionCache(cache_path, mode, engine_version, corpus_tag) as cache:
+                if cache_reset:
+                    cache.clear()
+                invalidated[mode] = cache.invalidated
+    
+    # (모드, 청크) 작업 목록: 기본 청크 크기는 워커당 작업 ~4개
+    workers = max(1, workers)
+    if chunk_size <= 0:
+        chunk_size = max(1, -(-total * len(MODES) // (workers * 4))) if workers > 1 else max(1, total)
+    tasks = [(mode, lo, min(lo + chunk_size, total)) for mode in MODES for lo in range(0, total, chunk_size)]
+    
+    if warmup > 0 or repeat > 1:
+        print(f"🔥 예열 {min(warmup, total)}개 샘플 (게이트웨이마다), 반복 {repeat}회")
+    
+    start_wall = time.perf_counter()
+    runs = []
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        print(f"⚙️  병렬 실행: 워커 {workers}개, 청크 {chunk_size}개 샘플 × {len(tasks)}개 작업")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(samples, cache_cfg, warmup)) as pool:
+            for _ in range(repeat):
+                runs.append(list(pool.map(_run_chunk, *zip(*tasks))))
+    else:
+        _init_worker(samples, cache_cfg, warmup)
+        try:
+            for _ in range(repeat):
+                runs.append([_run_chunk(*task) for task in tasks])
+        finally:
+            _close_worker_caches()
+    wall_time = time.perf_counter() - start_wall
+    
+    for mode in MODES:
+        # 반복 실행별로 청크를 샘플 순서대로 병합
+        mode_runs = [sorted((c for c in chunks if c["mode"] == mode), key=lambda c: c["lo"]) for chunks in runs]
+        mode_chunks = mode_runs[0]
+        
+        route_counts = {"MINI": 0, "STANDARD": 0, "PREMIUM": 0}
+        sample_results = []
+        for c in mode_chunks:
+            for k, v in c["route_counts"].items():
+                route_counts[k] += v
+            sample_results.extend(c["samples"])
+        # 샘플별 지연: 반복 실행의 중앙값 (라우트/Fracture 집계는 첫 실행 기준, 실행 간 동일)
+        latencies = median_over_runs([[x for c in chunks for x in c["latencies"]] for chunks in mode_runs])
+        fracture_count = sum(c["fracture_count"] for c in mode_chunks)
+        fracture_mini = sum(c["fracture_mini"] for c in mode_chunks)
+        # 모드별 처리 시간 = 청크 처리 시간 합 (직렬 실행 시간에 해당), 반복 시 중앙값
+        run_times = [sum(c["time_sec"] for c in chunks) for chunks in mode_runs]
+        total_time = sorted(run_times)[len(run_times) // 2]
+        
+        recorder = LatencyRecorder()
+        for sample, latency in zip(sample_results, latencies):
+            sample["latency_ms"] = round(latency, 4)
+            recorder.add(latency, sample["dataset"], sample["path"])
+        latency_report = recorder.report(bootstrap)
+        latency_report.update({"warmup": min(warmup, total), "repeat": repeat,
+                               "run_times_sec": [round(t, 3) for t in run_times]})
         
         # 비용 절감 계산
         cost_weights = {"MINI": 2, "STANDARD": 30, "PREMIUM": 100}
@@ -204,15 +426,39 @@ def run_gateway_benchmark():
             "total_time_sec": round(total_time, 3),
             "fracture_count": fracture_count,
             "fracture_mini": fracture_mini,
+            "workers": workers,
+            "latency": latency_report,
             "samples": sample_results,
         }
+        if cache_cfg:
+            results[mode]["cache"] = summarize_counters(
+                [c["cache"] for c in mode_chunks], invalidated.get(mode, 0))
         
+        print(f"\n{'─' * 60}")
+        print(f"🔧 모드: {mode.upper()}")
+        print("─" * 60)
         print(f"   MINI:     {route_counts['MINI']:>5} ({route_pcts['MINI']:>5.1f}%)")
         print(f"   STANDARD: {route_counts['STANDARD']:>5} ({route_pcts['STANDARD']:>5.1f}%)")
         print(f"   PREMIUM:  {route_counts['PREMIUM']:>5} ({route_pcts['PREMIUM']:>5.1f}%)")
         print(f"   비용 절감: {cost_savings:.1f}%")
         print(f"   평균 지연: {avg_latency:.3f}ms")
+        print(f"   ⏱️  지연 분포 ({latency_report['ci_level'] * 100:.0f}% CI, 부트스트랩 {bootstrap}회):")
+        print(f"      {'전체':<12} n={latency_report['overall']['count']:<5} {format_stats(latency_report['overall'])}")
+        for kind in ("by_dataset", "by_path"):
+            for name, stats in latency_report[kind].items():
+                print(f"      {name:<12} n={stats['count']:<5} {format_stats(stats)}")
         print(f"\n   🔒 안전성: Fracture {fracture_count}개 → MINI {fracture_mini}개 {'✅' if fracture_mini == 0 else '⚠️'}")
+        if cache_cfg:
+            c = results[mode]["cache"]
+            if c["invalidated"]:
+                print(f"   ♻️  무효화된 캐시 항목: {c['invalidated']}개 (엔진/코퍼스 변경)")
+            print(f"   🗄️  캐시: 적중 {c['hits']}/{c['hits'] + c['misses']} ({c['hit_ratio'] * 100:.1f}%), "
+                  f"순 절약 {c['latency_saved_ms']:.1f}ms, Fracture→MINI 거부 {c['rejected_fracture_mini']}개")
+    
+    work_time = sum(r["total_time_sec"] for r in results.values())
+    print(f"\n⏱️  전체 실행 시간: {wall_time:.2f}s (모드 처리 시간 합 {work_time:.2f}s, 워커 {workers}개)")
+    for r in results.values():
+        r["wall_time_sec"] = round(wall_time, 3)
     
     return results
 
@@ -220,8 +466,8 @@ def run_gateway_benchmark():
 # 리포트 생성
 # ============================================================================
 
-def generate_reports(results: Dict[str, Any], compat_pass: bool):
-    """리포트 파일 생성"""
+def generate_reports(results: Dict[str, Any], compat_pass: bool, parquet: bool = False):
+    """리포트 파일 생성 (parquet=True: 상세 결과를 Parquet 으로도 저장)"""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
@@ -243,6 +489,15 @@ def generate_reports(results: Dict[str, Any], compat_pass: bool):
             for sample in data["samples"]:
                 f.write(json.dumps(sample, ensure_ascii=False) + "\n")
     
+    # Parquet 상세 (선택)
+    if parquet:
+        sys.path.insert(0, TOOLS_DIR)
+        from details_columnar import ColumnarDetailsWriter, GATEWAY_FIELDS
+        for mode, data in results.items():
+            path = os.path.join(OUTPUT_DIR, f"gateway_{mode}_details.parquet")
+            with ColumnarDetailsWriter(path, GATEWAY_FIELDS) as writer:
+                writer.write_many(data["samples"])
+    
     # 마크다운 리포트
     md_content = f"""# MSR-V Gateway v1.1.1 + Engine v2.5.5-patch-fracture 통합 벤치마크
 
@@ -306,6 +561,44 @@ if "MINI" in route_upper:
     md_content += """
 ---
 
+## ⏱️ 지연 분포
+
+| 모드 | 그룹 | n | p50 (ms) | p90 (ms) | p99 (ms) | max (ms) |
+|------|------|---|----------|----------|----------|----------|
+"""
+    
+    def cell(stats, name):
+        ci = stats.get("ci", {}).get(name)
+        return f"{stats[name]:.3f} [{ci[0]:.3f}, {ci[1]:.3f}]" if ci else f"{stats[name]:.3f}"
+    
+    for mode, r in results.items():
+        latency = r["latency"]
+        groups = [("전체", latency["overall"])]
+        groups += list(latency["by_dataset"].items())
+        groups += [(f"경로: {name}", stats) for name, stats in latency["by_path"].items()]
+        for name, stats in groups:
+            md_content += f"| {mode.upper()} | {name} | {stats['count']} | {cell(stats, 'p50')} | {cell(stats, 'p90')} | {cell(stats, 'p99')} | {stats['max']:.3f} |\n"
+    notes = [f"> ⚠️ {mode.upper()}: {note}\n" for mode, r in results.items() for note in report_notes(r["latency"])]
+    if notes:
+        md_content += "\n" + "".join(notes)
+    
+    if any("cache" in r for r in results.values()):
+        md_content += """
+---
+
+## 🗄️ 결정 캐시
+
+| 모드 | 적중 | 미스 | 적중률 | 순 절약 지연 | 평균 적중 지연 | Fracture→MINI 거부 |
+|------|------|------|--------|------------|---------------|-------------------|
+"""
+        for mode, r in results.items():
+            c = r.get("cache")
+            if c:
+                md_content += f"| {mode.upper()} | {c['hits']} | {c['misses']} | {c['hit_ratio'] * 100:.1f}% | {c['latency_saved_ms']:.1f}ms | {c['avg_hit_ms']:.4f}ms | {c['rejected_fracture_mini']} |\n"
+    
+    md_content += """
+---
+
 ## 🏗️ 아키텍처
 
 ```
@@ -353,6 +646,27 @@ MINI   STANDARD  PREMIUM
 # ============================================================================
 
 if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="MSR-V Gateway 통합 벤치마크")
+    ap.add_argument("--parquet", action="store_true",
+                    help="상세 결과를 Parquet 컬럼 파일로도 저장 (pyarrow 필요)")
+    ap.add_argument("--cache", nargs="?", const=CACHE_PATH, default=None, metavar="PATH",
+                    help=f"라우팅 결정 캐시 사용 (SQLite, 기본: {CACHE_PATH})")
+    ap.add_argument("--cache-reset", action="store_true",
+                    help="시작 전에 모드별 캐시 항목 삭제 (콜드 캐시 측정)")
+    ap.add_argument("--workers", type=int, default=1,
+                    help="(모드, 청크) 작업을 나눠 실행할 프로세스 수 (기본: 1 = 직렬)")
+    ap.add_argument("--chunk-size", type=int, default=0,
+                    help="작업당 샘플 수 (기본: 워커당 작업 ~4개)")
+    ap.add_argument("--warmup", type=int, default=0,
+                    help="측정 전 게이트웨이마다 처음 N개 샘플로 예열 (기본: 0)")
+    ap.add_argument("--repeat", type=int, default=1,
+                    help="전체 실행 반복 횟수, 샘플별 지연은 중앙값 (--cache 와 함께 사용 불가)")
+    ap.add_argument("--bootstrap", type=int, default=DEFAULT_BOOTSTRAP,
+                    help=f"퍼센타일 신뢰구간 부트스트랩 리샘플 수 (기본: {DEFAULT_BOOTSTRAP}, 0 = CI 생략)")
+    args = ap.parse_args()
+    if args.cache and args.repeat > 1:
+        ap.error("--repeat 는 --cache 와 함께 쓸 수 없습니다")
+    
     print("=" * 100)
     print("📊 MSR-V Gateway v1.1.1 + Engine v2.5.5-patch-fracture 통합 벤치마크")
     print("=" * 100)
@@ -364,10 +678,12 @@ if __name__ == "__main__":
     compat_pass = test_backward_compat()
     
     # 게이트웨이 벤치마크
-    results = run_gateway_benchmark()
+    results = run_gateway_benchmark(cache_path=args.cache, cache_reset=args.cache_reset,
+                                    workers=args.workers, chunk_size=args.chunk_size,
+                                    warmup=args.warmup, repeat=args.repeat, bootstrap=args.bootstrap)
     
     # 리포트 생성
-    output_dir = generate_reports(results, compat_pass)
+    output_dir = generate_reports(results, compat_pass, parquet=args.parquet)
     
     # 최종 결과
     print("\n" + "=" * 100)
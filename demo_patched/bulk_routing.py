@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""bulk_routing.py
+
+Vectorized fallback routing for MSRVPublicEngine (requires NumPy).
+
+For offline replay and what-if analysis over many texts. Structural
+features are extracted once per text (the same keyword scan inspect()
+uses) into arrays; need, state4, the Fracture floor, the short-signal cap
+and the route thresholds are then computed for all rows with NumPy
+operations. Every float is produced by the same IEEE-754 double
+operations, in the same order, as the scalar heuristic, so results are
+identical to ``MSRVPublicEngine._route_features`` row by row.
+
+Check against the scalar path:
+    python bulk_routing.py check [--details ../report_patched/benchmark_balanced_details.jsonl]
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+
+STATE4 = ("Harmony", "Alignment", "Divergence", "Fracture")
+ROUTES = ("MINI", "STANDARD", "PREMIUM")
+SHAPES = ("LINE", "TRIANGLE")
+
+# Indexed by state4 code
+_ZS = np.array([0.72, 0.55, 0.60, 0.32])
+
+
+@dataclass(frozen=True)
+class FeatureArrays:
+    """Column form of TextFeatures for a batch of stripped texts"""
+    texts: List[str]
+    langs: List[str]
+    char_len: np.ndarray
+    has_numbers: np.ndarray
+    risky_claim: np.ndarray
+    negation: np.ndarray
+    high_stakes: np.ndarray
+    matched_keywords: List[Dict[str, Tuple[str, ...]]]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+
+@dataclass(frozen=True)
+class RouteArrays:
+    """Per-row routing outputs; state4/route/shape are codes into the tables above"""
+    need: np.ndarray
+    state4: np.ndarray
+    zs: np.ndarray
+    theta: np.ndarray
+    shape: np.ndarray
+    route: np.ndarray
+    is_fracture: np.ndarray
+    short_sig_cap_applied: np.ndarray
+
+
+def extract_features(engine: Any, items: Iterable[Tuple[str, str]]) -> FeatureArrays:
+    """Strip each (text, lang) and extract its features once into arrays"""
+    texts: List[str] = []
+    langs: List[str] = []
+    feats = []
+    for text, lang in items:
+        text_norm = (text or "").strip()
+        texts.append(text_norm)
+        langs.append(lang)
+        feats.append(engine._extract_features(text_norm))
+    n = len(feats)
+    return FeatureArrays(
+        texts=texts,
+        langs=langs,
+        char_len=np.fromiter((f.char_len for f in feats), dtype=np.int64, count=n),
+        has_numbers=np.fromiter((f.has_numbers for f in feats), dtype=bool, count=n),
+        risky_claim=np.fromiter((f.risky_claim for f in feats), dtype=bool, count=n),
+        negation=np.fromiter((f.negation for f in feats), dtype=bool, count=n),
+        high_stakes=np.fromiter((f.high_stakes for f in feats), dtype=bool, count=n),
+        matched_keywords=[f.matched_keywords for f in feats],
+    )
+
+
+def route_arrays(features: FeatureArrays, mode: str, thresholds: Optional[Dict[str, float]] = None) -> RouteArrays:
+    """Vectorized _route_features for every row.
+
+    ``thresholds`` (mini_base / standard_base) defaults to the engine's
+    table for ``mode``; pass other values for what-if sweeps.
+    """
+    if thresholds is None:
+        from engine import MSRVPublicEngine
+        thresholds = MSRVPublicEngine.MODE_THRESHOLDS[mode]
+    mini_base = thresholds["mini_base"]
+    standard_base = thresholds["standard_base"]
+
+    risky = features.risky_claim
+    negation = features.negation
+    high_stakes = features.high_stakes
+
+    need = 0.35 + np.where(features.has_numbers, 0.15, 0.0) + np.where(risky, 0.15, 0.0) + np.where(negation, 0.10, 0.0)
+    need = np.minimum(need, 1.0)
+
+    # Fracture = risky + negation; otherwise Alignment / Divergence / Harmony
+    state4 = np.where(negation & risky, 3, np.where(risky, 1, np.where(negation, 2, 0))).astype(np.uint8)
+    is_fracture = state4 == 3
+
+    if mode == "conservative":
+        # MINI disabled in conservative mode
+        short_cap = np.zeros(len(features), dtype=bool)
+        route = np.where(need <= standard_base, 1, 2)
+    else:
+        # high_stakes blocks MINI; the short-signal cap is only for safe, short inputs
+        need = np.where(high_stakes & ~is_fracture, np.maximum(need, mini_base + 0.01), need)
+        short_cap = (features.char_len < 30) & ~high_stakes & ~is_fracture
+        need = np.where(short_cap & (need > mini_base), mini_base, need)
+        route = np.where(need <= mini_base, 0, np.where(need <= standard_base, 1, 2))
+
+    # Fracture floor: need >= 0.65 and always PREMIUM
+    need = np.where(is_fracture, np.maximum(need, 0.65), need)
+    route = np.where(is_fracture, 2, route).astype(np.uint8)
+
+    return RouteArrays(
+        need=need,
+        state4=state4,
+        zs=_ZS[state4],
+        theta=np.where(risky, 0.35, 0.18),
+        shape=(features.has_numbers | risky).astype(np.uint8),
+        route=route,
+        is_fracture=is_fracture,
+        short_sig_cap_applied=short_cap,
+    )
+
+
+def pack_traces(engine: Any, features: FeatureArrays, routed: RouteArrays, mode: str) -> List[Any]:
+    """RouteResult per row, equal to the scalar fallback's output"""
+    notes = engine.FALLBACK_NOTES.format(mode=mode)
+    columns = zip(
+        features.texts, features.langs, features.matched_keywords,
+        routed.route.tolist(), routed.state4.tolist(), routed.zs.tolist(), routed.theta.tolist(),
+        routed.shape.tolist(), routed.need.tolist(), routed.is_fracture.tolist(),
+        routed.short_sig_cap_applied.tolist(),
+    )
+    return [
+        engine._pack(
+            text=text, lang=lang, route=ROUTES[route], state4=STATE4[state4], zs=zs,
+            theta=theta, shape=SHAPES[shape], need=need,
+            is_fracture=is_fracture, short_sig_cap_applied=short_cap,
+            notes=notes, mode=mode, matched_keywords=keywords,
+        )
+        for text, lang, keywords, route, state4, zs, theta, shape, need, is_fracture, short_cap in columns
+    ]
+
+
+def _load_details(path: str) -> List[Tuple[str, str]]:
+    items = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                items.append((row.get("text", ""), row.get("lang", "EN")))
+    return items
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Vectorized MSR-V fallback routing")
+    sub = ap.add_subparsers(dest="command", required=True)
+    c = sub.add_parser("check", help="Compare bulk and scalar fallback routing on a details JSONL")
+    here = os.path.dirname(os.path.abspath(__file__))
+    c.add_argument("--details", default=os.path.join(here, "..", "report_patched", "benchmark_balanced_details.jsonl"))
+    c.add_argument("--repeat", type=int, default=1, help="Replicate the corpus N times (timing only)")
+    args = ap.parse_args()
+
+    from engine import MSRVPublicEngine
+
+    eng = MSRVPublicEngine()
+    items = _load_details(args.details) * max(1, args.repeat)
+    mismatches = 0
+    for mode in MSRVPublicEngine.MODE_THRESHOLDS:
+        t0 = time.perf_counter()
+        scalar = [eng._fallback_heuristic((text or "").strip(), lang, mode) for text, lang in items]
+        t1 = time.perf_counter()
+        features = extract_features(eng, items)
+        t2 = time.perf_counter()
+        routed = route_arrays(features, mode)
+        t3 = time.perf_counter()
+        bulk = pack_traces(eng, features, routed, mode)
+        t4 = time.perf_counter()
+        bad = sum(1 for a, b in zip(scalar, bulk) if a != b)
+        mismatches += bad
+        print(
+            f"{mode:<12} rows={len(items)} mismatches={bad} "
+            f"scalar={(t1 - t0) * 1e3:.1f}ms features={(t2 - t1) * 1e3:.1f}ms "
+            f"route_arrays={(t3 - t2) * 1e3:.2f}ms pack={(t4 - t3) * 1e3:.1f}ms"
+        )
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
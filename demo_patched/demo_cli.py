@@ -4,7 +4,139 @@
 
 import argparse
 import json
-from engine import MSRVPublicEngine
+import queue
+import sys
+import threading
+from collections import deque
+from engine import VERBOSITY_LEVELS, MSRVPublicEngine
+
+
+# ============================================================================
+# --stream: long-lived JSONL sidecar (one request per stdin line)
+# ============================================================================
+
+_STREAM_ENGINE = None
+
+
+def _init_stream_worker():
+    global _STREAM_ENGINE
+    _STREAM_ENGINE = MSRVPublicEngine()
+
+
+def _stream_batch(lines, default_mode, eng=None, verbosity="full"):
+    """Results (in input order) for a batch of JSONL request lines"""
+    eng = eng or _STREAM_ENGINE
+    results = [None] * len(lines)
+    by_mode = {}
+    for idx, line in enumerate(lines):
+        try:
+            req = json.loads(line)
+        except ValueError as e:
+            results[idx] = {"error": f"invalid JSON: {e}"}
+            continue
+        if not isinstance(req, dict) or not isinstance(req.get("text"), str):
+            results[idx] = {"error": "request needs a 'text' string"}
+            continue
+        lang = req.get("lang")
+        if lang is not None and not isinstance(lang, str):
+            results[idx] = {"id": req.get("id"), "error": "'lang' must be a string"}
+            continue
+        mode = req.get("mode") or default_mode
+        if not isinstance(mode, str) or mode not in MSRVPublicEngine.MODE_THRESHOLDS:
+            results[idx] = {"id": req.get("id"), "error": f"Invalid mode: {mode}"}
+            continue
+        by_mode.setdefault(mode, []).append((idx, req))
+
+    for mode, group in by_mode.items():
+        items = [(req["text"], req.get("lang") or "EN") for _, req in group]
+        try:
+            # inspect_many is lazy: consume it here so failures are caught
+            outs = list(eng.inspect_many(items, mode=mode, verbosity=verbosity))
+        except Exception as e:
+            # Keep the sidecar alive: the failure becomes a result for each line
+            for idx, req in group:
+                results[idx] = {"id": req.get("id"), "error": f"{type(e).__name__}: {e}"}
+            continue
+        for (idx, req), out in zip(group, outs):
+            if verbosity == "route_only":
+                out = out.compact()
+            results[idx] = {"id": req["id"], **out} if "id" in req else out
+    return results
+
+
+def _take_lines(q, size, block):
+    """Up to size queued lines; blocks only for the first one if block=True"""
+    lines = []
+    try:
+        lines.append(q.get(block=block))
+        while len(lines) < size and lines[-1] is not None:
+            lines.append(q.get_nowait())
+    except queue.Empty:
+        pass
+    return lines
+
+
+def run_stream(mode, batch_size=1, workers=1, verbosity="full"):
+    """Read JSONL requests from stdin, write one compact JSONL result per line.
+
+    Lines already waiting on stdin are grouped into micro-batches of up to
+    batch_size; nothing waits for a batch to fill. With workers > 1 batches
+    run in a process pool and results are still written in input order.
+    """
+    sys.stdin.reconfigure(encoding="utf-8")
+    sys.stdout.reconfigure(encoding="utf-8")
+
+    eng = MSRVPublicEngine(mode=mode) if workers <= 1 else None
+    pool = None
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Start the workers before the stdin reader thread exists: forked
+        # children close their inherited sys.stdin, which would deadlock on
+        # the lock held by a blocked reader.
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_stream_worker)
+        pool.submit(int).result()
+
+    q = queue.Queue(maxsize=max(1024, batch_size * 4))
+
+    def reader():
+        for line in sys.stdin:
+            if line.strip():
+                q.put(line)
+        q.put(None)
+
+    threading.Thread(target=reader, daemon=True).start()
+
+    def emit(results):
+        for r in results:
+            sys.stdout.write(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n")
+            sys.stdout.flush()
+
+    pending = deque()
+    window = 2 * workers
+    eof = False
+    try:
+        while not eof or pending:
+            lines = []
+            if not eof:
+                lines = _take_lines(q, batch_size, block=not pending)
+                if lines and lines[-1] is None:
+                    eof = True
+                    lines.pop()
+                if lines and pool is None:
+                    emit(_stream_batch(lines, mode, eng, verbosity))
+                elif lines:
+                    pending.append(pool.submit(_stream_batch, lines, mode, None, verbosity))
+            # Wait for the oldest batch only when there is nothing else to do
+            if pending and not pending[0].done() and (eof or not lines or len(pending) >= window):
+                pending[0].result()
+            while pending and pending[0].done():
+                emit(pending.popleft().result())
+    except BrokenPipeError:
+        pass
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
 
 
 def main():
@@ -16,8 +148,18 @@ def main():
     ap.add_argument("--interactive", action="store_true", help="Interactive loop mode")
     ap.add_argument("--info", action="store_true", help="Show mode information")
     ap.add_argument("--governance", action="store_true", help="Show governance rules")
+    ap.add_argument("--stream", action="store_true",
+                    help="JSONL sidecar: read {text, lang, mode?, id?} lines from stdin, write results to stdout")
+    ap.add_argument("--batch-size", type=int, default=1, help="--stream: max lines per micro-batch")
+    ap.add_argument("--workers", type=int, default=1, help="--stream: engine worker processes")
+    ap.add_argument("--verbosity", default="full", choices=list(VERBOSITY_LEVELS),
+                    help="--stream: route_only (flat routing fields), standard or full traces")
     args = ap.parse_args()
 
+    if args.stream:
+        run_stream(args.mode, batch_size=max(1, args.batch_size), workers=args.workers, verbosity=args.verbosity)
+        return
+
     eng = MSRVPublicEngine(mode=args.mode)
 
     if args.info:
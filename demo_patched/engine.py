@@ -17,15 +17,28 @@ Changes in v2.5.5:
 - Route naming: BYPASS→MINI, LITE→STANDARD, FULL→PREMIUM
 - 3-Mode system: CONSERVATIVE, BALANCED, AGGRESSIVE
 - Runtime mode switching support
+
+Thread safety: the mode is a per-call argument (the engine mode is only
+the default), the corpus is an immutable snapshot, and the result cache
+and profiler are guarded by locks, so one engine can serve all modes
+from a thread pool.
 """
 
 from __future__ import annotations
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 from enum import Enum
 import json
 import os
-import difflib
+import re
+import threading
+import time
+
+from sample_corpus import CorpusSnapshot, SampleWatcher, sample_key
+from sample_store import MappedSampleStore, is_sample_store
+from sample_table import SampleTable
+from stage_profiler import StageProfiler
 
 
 class EngineMode(Enum):
@@ -55,6 +68,164 @@ class MSRVResult:
     notes: Optional[str] = None
 
 
+# inspect() result levels: the compact RouteResult, or its dict trace
+# without / with the per-request diagnostics
+VERBOSITY_LEVELS = ("route_only", "standard", "full")
+
+
+class RouteResult(NamedTuple):
+    """Fixed-layout routing decision, returned as is at verbosity="route_only".
+
+    Strings are references to the input or matched sample, never copies.
+    Cached results are shared between callers, so treat the record (and
+    matched_keywords) as read-only; trace() builds a fresh dict each time.
+    """
+    route: str
+    state4: str
+    zs: Optional[float]
+    theta: Optional[float]
+    shape: Optional[str]
+    need: Optional[float]
+    is_fracture: bool
+    short_sig_cap_applied: bool
+    mode: str
+    text: str
+    lang: str
+    notes: str
+    # Sample match label ("exact" / "fuzzy:0.93"); None for the heuristic
+    match: Optional[str] = None
+    matched_keywords: Optional[Dict[str, Tuple[str, ...]]] = None
+    nearest_text: Optional[str] = None
+    profile: Optional[Dict[str, Any]] = None
+
+    def trace(self, verbosity: str = "full") -> Dict[str, Any]:
+        """Dict trace; "standard" leaves out matched keywords and the nearest sample text"""
+        full = verbosity == "full"
+        route_reason = {
+            "need": self.need,
+            "is_fracture": self.is_fracture,
+            "short_sig_cap_applied": self.short_sig_cap_applied,
+            "mode": self.mode,
+            "governance": "Fracture→MINI blocked" if self.is_fracture else "normal",
+        }
+        if full and self.matched_keywords is not None:
+            # Keyword hits behind the fallback features (heuristic path only)
+            route_reason["matched_keywords"] = {k: list(v) for k, v in self.matched_keywords.items()}
+        notes = self.notes
+        if self.match:
+            notes += f" | match={self.match} | mode={self.mode}"
+        meta = {
+            "engine": "MSRV-Public-Demo-v2.5.5-patch",
+            "mode": self.mode,
+            "proprietary_core": False,
+            "fracture_governance": True,  # PATCH: Governance flag
+            "notes": notes,
+        }
+        if full and self.nearest_text is not None:
+            meta["nearest_text"] = self.nearest_text
+        if self.profile is not None:
+            meta["profile"] = self.profile
+        return {
+            "input": {"text": self.text, "lang": self.lang},
+            "output": {
+                "route": self.route,
+                "state4": self.state4,
+                "Zs": self.zs,
+                "theta": self.theta,
+                "shape": self.shape,
+                "need": self.need,
+                "route_reason": route_reason,
+            },
+            "meta": meta,
+        }
+
+    def compact(self) -> Dict[str, Any]:
+        """Flat dict of the routing fields, for serializing route_only results"""
+        return {
+            "route": self.route,
+            "state4": self.state4,
+            "Zs": self.zs,
+            "theta": self.theta,
+            "shape": self.shape,
+            "need": self.need,
+            "is_fracture": self.is_fracture,
+            "short_sig_cap_applied": self.short_sig_cap_applied,
+            "mode": self.mode,
+            "match": self.match,
+        }
+
+
+class TextFeatures(NamedTuple):
+    """Mode-independent structural features read by the fallback heuristic"""
+    char_len: int
+    has_numbers: bool
+    risky_claim: bool
+    negation: bool
+    high_stakes: bool
+    matched_keywords: Dict[str, Tuple[str, ...]]
+
+
+class KeywordMatcher:
+    """Single-pass substring matcher for the fallback keyword features.
+
+    All keywords are compiled into one alternation (longest first), so a
+    single regex traversal of the text reports every feature hit. A match
+    also credits every keyword contained in it ("법적" implies "법"), and the
+    rare keywords that can only be hidden by a partially overlapping match
+    ("kill" + "law" in "killaw") are re-checked directly, so the result is
+    exactly the set of keywords that occur as substrings.
+    """
+
+    def __init__(self, features: Dict[str, Tuple[str, ...]]):
+        self.features = features
+        owners: Dict[str, List[str]] = {}
+        for feature, keywords in features.items():
+            for kw in keywords:
+                owners.setdefault(kw, []).append(feature)
+        keywords = sorted(owners, key=len, reverse=True)
+        self._pattern = re.compile("|".join(re.escape(kw) for kw in keywords))
+        self._contained = {kw: tuple(k for k in keywords if k in kw) for kw in keywords}
+        # kw -> keywords whose prefix is a proper suffix of kw (can be skipped over)
+        self._overlapped = {
+            kw: tuple(
+                k for k in keywords
+                if k not in kw and any(k.startswith(kw[i:]) for i in range(1, len(kw)))
+            )
+            for kw in keywords
+        }
+
+    def scan(self, lower: str) -> Dict[str, Tuple[str, ...]]:
+        """Return {feature: matched keywords} for an already-lowercased text"""
+        found = set()
+        recheck = set()
+        for kw in set(self._pattern.findall(lower)):
+            found.update(self._contained[kw])
+            recheck.update(self._overlapped[kw])
+        for kw in recheck - found:
+            if kw in lower:
+                found.add(kw)
+        return {
+            feature: tuple(kw for kw in keywords if kw in found)
+            for feature, keywords in self.features.items()
+        }
+
+
+def _profile_meta(path: str, stages: Dict[str, float], fuzzy_stats: Dict[str, int]) -> Dict[str, Any]:
+    """meta.profile entry: path taken, stage times (ms), fuzzy candidate counts"""
+    return {
+        "path": path,
+        "stages_ms": {stage: round(seconds * 1e3, 4) for stage, seconds in stages.items()},
+        "fuzzy_candidates": fuzzy_stats.get("candidates", 0),
+        "fuzzy_scored": fuzzy_stats.get("scored", 0),
+        "fuzzy_pruned": fuzzy_stats.get("pruned", 0),
+    }
+
+
+def _emit(result: RouteResult, verbosity: str) -> Any:
+    """A result at the requested verbosity (the record itself for route_only)"""
+    return result if verbosity == "route_only" else result.trace(verbosity)
+
+
 class MSRVPublicEngine:
     """Public demo engine with 3-mode support and Fracture governance"""
     
@@ -64,61 +235,245 @@ class MSRVPublicEngine:
         "balanced": {"mini_base": 0.25, "standard_base": 0.55},
         "aggressive": {"mini_base": 0.35, "standard_base": 0.55},
     }
+
+    # Minimum SequenceMatcher ratio for a fuzzy sample match
+    FUZZY_THRESHOLD = 0.72
+
+    # meta.notes of fallback traces
+    FALLBACK_NOTES = "Public fallback heuristic (mode={mode}). Fracture governance enforced."
+
+    # Fallback keyword features, matched as substrings of the lowercased text
+    KEYWORD_MATCHER = KeywordMatcher({
+        "risky_claim": ("100%", "guarantee", "cure", "always", "never", "perfect", "죽", "kill", "법적", "소송"),
+        "negation": ("not", "never", "no ", "아니다", "않", "못", "없"),
+        "high_stakes": ("법", "의료", "금융", "law", "medical", "financial", "contract", "계약"),
+    })
     
-    def __init__(self, samples_path: str = None, mode: str = "balanced"):
+    def __init__(
+        self, samples_path: str = None, mode: str = "balanced",
+        fuzzy_index: str = "charindex", verify_fuzzy: bool = False,
+        cache_size: int = 0, profile: bool = False,
+    ):
+        if samples_path is None:
+            samples_path = self._default_samples_path()
+        self.samples_path = samples_path
+        self._fuzzy_kind = fuzzy_index
+        self._verify_fuzzy = verify_fuzzy
+        # Samples + indexes, replaced as a whole (never mutated) on reload
+        self._snapshot = CorpusSnapshot.build([], fuzzy_index, verify_fuzzy)
+        self._reload_lock = threading.Lock()
+        self._mode = "balanced"
+        self.set_mode(mode)
+
+        # Opt-in LRU result cache keyed by (text, lang, mode); 0 disables it
+        self._cache_size = max(0, int(cache_size))
+        self._cache: "OrderedDict[Tuple[str, str, str], RouteResult]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+        self._cache_lock = threading.Lock()
+
+        # Opt-in per-stage instrumentation; None keeps the hot path untimed
+        self._profiler: Optional[StageProfiler] = StageProfiler() if profile else None
+
+        self.load_samples(samples_path)
+
+    @property
+    def mode(self) -> str:
+        """Default mode for calls that do not pass one"""
+        return self._mode
+
+    def _check_mode(self, mode: Optional[str]) -> str:
+        """Validated mode, or the default mode if None"""
+        if mode is None:
+            return self._mode
+        if mode not in self.MODE_THRESHOLDS:
+            raise ValueError(f"Invalid mode: {mode}. Use: conservative, balanced, aggressive")
+        return mode
+
+    @staticmethod
+    def _check_verbosity(verbosity: str) -> str:
+        if verbosity not in VERBOSITY_LEVELS:
+            raise ValueError(f"Invalid verbosity: {verbosity}. Use: {', '.join(VERBOSITY_LEVELS)}")
+        return verbosity
+
+    @property
+    def samples(self) -> Sequence[Dict[str, Any]]:
+        return self._snapshot.live_samples()
+
+    @samples.setter
+    def samples(self, samples: Sequence[Dict[str, Any]]) -> None:
+        """Replace the sample list and rebuild the lookup indexes"""
+        self._snapshot = CorpusSnapshot.build(samples, self._fuzzy_kind, self._verify_fuzzy)
+        self.clear_cache()
+
+    @staticmethod
+    def _default_samples_path() -> str:
+        """Bundled samples: the compiled .msrvbin store if it is up to date, else JSON"""
+        json_path = os.path.join(os.path.dirname(__file__), "public_samples.json")
+        bin_path = os.path.splitext(json_path)[0] + ".msrvbin"
+        if os.path.exists(bin_path) and (
+            not os.path.exists(json_path) or os.path.getmtime(bin_path) >= os.path.getmtime(json_path)
+        ):
+            return bin_path
+        return json_path
+
+    def load_samples(self, samples_path: Optional[str] = None) -> None:
+        """(Re)load samples from disk; indexes are rebuilt on every load.
+
+        Binary stores built by ``sample_store.py build`` are memory-mapped
+        (already normalized); anything else is parsed as JSON.
+        """
         if samples_path is None:
-            samples_path = os.path.join(os.path.dirname(__file__), "public_samples.json")
+            samples_path = self.samples_path
         self.samples_path = samples_path
-        self.samples: List[Dict[str, Any]] = []
-        self._mode = mode
+        with self._reload_lock:
+            self.samples = self._read_samples(samples_path)
 
+    def _read_samples(self, samples_path: str) -> Sequence[Dict[str, Any]]:
+        if is_sample_store(samples_path):
+            return MappedSampleStore(samples_path)
         if os.path.exists(samples_path):
             with open(samples_path, "r", encoding="utf-8") as f:
                 raw = json.load(f)
-            self.samples = self._normalize_samples(raw)
+            return self._normalize_samples(raw)
+        return []
 
-    @property
-    def mode(self) -> str:
-        return self._mode
+    def reload(self, samples_path: Optional[str] = None) -> Dict[str, Any]:
+        """Hot-reload the sample file, applying only what changed.
+
+        Samples are matched by id (or lang + text when they have none); the
+        added, changed and removed ones are applied through apply_delta().
+        Binary stores, and files whose sample keys repeat, fall back to a
+        full rebuild. Returns a summary of what was applied.
+        """
+        if samples_path is None:
+            samples_path = self.samples_path
+        with self._reload_lock:
+            self.samples_path = samples_path
+            snapshot = self._snapshot
+            old_keys = None if is_sample_store(samples_path) else snapshot.key_positions()
+            new_samples = self._read_samples(samples_path)
+
+            new_keys = set()
+            if old_keys is not None:
+                for s in new_samples:
+                    key = sample_key(s)
+                    if key in new_keys:
+                        old_keys = None
+                        break
+                    new_keys.add(key)
+            if old_keys is None:
+                self.samples = new_samples
+                return {"full_rebuild": True, "samples": len(self._snapshot)}
+
+            upserts = [
+                s for s in new_samples
+                if sample_key(s) not in old_keys or snapshot.samples[old_keys[sample_key(s)]] != s
+            ]
+            removed = [key for key in old_keys if key not in new_keys]
+            return self._apply_delta(upserts, removed)
+
+    def apply_delta(
+        self, upserts: Iterable[Dict[str, Any]] = (), removed: Iterable[Any] = (),
+    ) -> Dict[str, Any]:
+        """Add or replace samples (matched by id, else lang + text) and remove others.
+
+        ``removed`` takes sample ids, or ("text", LANG, text) keys for samples
+        without one. Only the delta is indexed; the new snapshot is swapped
+        in atomically, and cached results are dropped only for the languages
+        the delta touched.
+        """
+        removed_keys = [key if isinstance(key, tuple) else ("id", key) for key in removed]
+        upserts = self._normalize_samples(list(upserts))
+        with self._reload_lock:
+            return self._apply_delta(upserts, removed_keys)
+
+    def _apply_delta(self, upserts: List[Dict[str, Any]], removed: List[Any]) -> Dict[str, Any]:
+        """Build the next snapshot and swap it in; the caller holds the reload lock"""
+        old = self._snapshot
+        new, info = old.with_delta(upserts, removed)
+        self._snapshot = new
+        self._invalidate_cache(old, new, info["langs"])
+        return {
+            "added": info["added"], "changed": info["changed"], "removed": info["removed"],
+            "full_rebuild": info["compacted"], "samples": len(new),
+        }
+
+    def watch_samples(
+        self, interval: float = 2.0, on_reload: Optional[Any] = None,
+    ) -> SampleWatcher:
+        """Start a polling watcher that calls reload() when the sample file changes"""
+        return SampleWatcher(self, interval=interval, on_reload=on_reload).start()
     
     def set_mode(self, mode: str) -> None:
-        """Switch engine mode at runtime"""
-        if mode not in self.MODE_THRESHOLDS:
-            raise ValueError(f"Invalid mode: {mode}. Use: conservative, balanced, aggressive")
-        self._mode = mode
+        """Switch the default mode at runtime.
 
-    def _normalize_samples(self, raw: Any) -> List[Dict[str, Any]]:
-        """Normalize loaded samples into a flat list[dict]."""
-        flat: List[Dict[str, Any]] = []
+        Calls that pass ``mode=`` are unaffected; prefer that on engines
+        shared between threads. Cached results are keyed by mode and stay
+        valid.
+        """
+        if mode is None:
+            raise ValueError("Invalid mode: None. Use: conservative, balanced, aggressive")
+        self._mode = self._check_mode(mode)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Result cache counters (all zero when caching is disabled)"""
+        with self._cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "evictions": self._cache_evictions,
+                "size": len(self._cache),
+                "max_size": self._cache_size,
+            }
 
-        def walk(x: Any) -> None:
-            if isinstance(x, dict):
-                flat.append(x)
-                return
+    def clear_cache(self) -> None:
+        """Drop all cached results (counters are kept)"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def enable_profiling(self, enabled: bool = True) -> None:
+        """Turn per-stage timing on or off (turning it on starts empty histograms)"""
+        if not enabled:
+            self._profiler = None
+        elif self._profiler is None:
+            self._profiler = StageProfiler()
+
+    def profile_stats(self) -> Dict[str, Any]:
+        """Exported stage histograms ({} when profiling is disabled)"""
+        profiler = self._profiler
+        return profiler.export() if profiler is not None else {}
+
+    def reset_profile(self) -> None:
+        profiler = self._profiler
+        if profiler is not None:
+            profiler.reset()
+
+    def _normalize_samples(self, raw: Any) -> SampleTable:
+        """Normalize loaded samples (dicts in arbitrarily nested lists) into a SampleTable in one pass."""
+        table = SampleTable()
+        stack = [raw]
+        while stack:
+            x = stack.pop()
             if isinstance(x, list):
-                for y in x:
-                    walk(y)
-                return
-
-        walk(raw)
-
-        cleaned: List[Dict[str, Any]] = []
-        for s in flat:
-            if "text" not in s:
-                continue
-            if "lang" not in s:
-                s["lang"] = "EN"
-            # Convert old route names to new
-            if "route" in s:
-                s["route"] = self._convert_route(s["route"])
-            
-            # PATCH: Enforce Fracture → STANDARD/PREMIUM rule in samples
-            if s.get("state4") == "Fracture" and s.get("route") == "MINI":
-                s["route"] = "STANDARD"
-            
-            cleaned.append(s)
-
-        return cleaned
+                stack.extend(reversed(x))
+            elif isinstance(x, dict) and "text" in x:
+                table.append(self._normalize_sample(x))
+        return table
+
+    def _normalize_sample(self, s: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in defaults and current route names (in place)"""
+        if "lang" not in s:
+            s["lang"] = "EN"
+        # Convert old route names to new
+        if "route" in s:
+            s["route"] = self._convert_route(s["route"])
+
+        # PATCH: Enforce Fracture → STANDARD/PREMIUM rule in samples
+        if s.get("state4") == "Fracture" and s.get("route") == "MINI":
+            s["route"] = "STANDARD"
+        return s
 
     def _convert_route(self, route: str) -> str:
         """Convert old route names to new naming"""
@@ -133,65 +488,311 @@ class MSRVPublicEngine:
             return route_upper
         return "STANDARD"
 
-    def inspect(self, text: str, lang: str = "EN") -> Dict[str, Any]:
+    def inspect(
+        self, text: str, lang: str = "EN", mode: Optional[str] = None, verbosity: str = "full",
+    ) -> Any:
         """Return a deterministic 'governance trace' for the given text.
 
         Strategy:
         1) exact match in shipped samples
         2) fuzzy nearest neighbor among shipped samples
         3) fallback heuristic that respects current mode AND Fracture governance
+
+        With ``cache_size > 0`` results are memoized per (text, lang, mode);
+        callers always receive their own trace dict.
+
+        With ``profile=True`` the trace also carries ``meta.profile``: the
+        path taken, per-stage times in ms and the fuzzy candidate counts.
+
+        ``mode`` applies to this call only (default: the engine mode), so
+        concurrent calls in different modes never affect each other.
+
+        ``verbosity``: "full" (default) is the complete trace dict;
+        "standard" drops route_reason.matched_keywords and meta.nearest_text;
+        "route_only" returns the compact RouteResult without building any
+        dict (call its trace() later if needed).
+        """
+        verbosity = self._check_verbosity(verbosity)
+        return _emit(self._inspect_cached(text, lang, self._check_mode(mode)), verbosity)
+
+    def inspect_many(
+        self, items: Iterable[Tuple[str, str]], mode: Optional[str] = None,
+        batch_size: int = 256, verbosity: str = "full",
+    ) -> Iterator[Any]:
+        """Inspect an iterable of (text, lang) pairs, yielding traces in input order.
+
+        Items are consumed lazily in batches of ``batch_size``. Within a
+        batch, identical (text, lang) pairs are inspected only once and the
+        unique inputs are processed grouped by language, so each language's
+        fuzzy index is resolved once. ``mode`` overrides the engine mode for
+        this call only; the engine's own mode is left untouched. ``verbosity``
+        is as for inspect().
         """
+        mode = self._check_mode(mode)
+        verbosity = self._check_verbosity(verbosity)
+
+        batch: List[Tuple[str, str]] = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield from self._inspect_batch(batch, mode, verbosity)
+                batch = []
+        if batch:
+            yield from self._inspect_batch(batch, mode, verbosity)
+
+    def _inspect_batch(self, batch: List[Tuple[str, str]], mode: str, verbosity: str) -> Iterator[Any]:
+        """Deduplicate and language-group one batch, then emit in input order"""
+        by_lang: Dict[str, List[Tuple[str, str]]] = {}
+        for key in dict.fromkeys(batch):
+            by_lang.setdefault((key[1] or "").upper(), []).append(key)
+
+        snapshot = self._snapshot
+        results: Dict[Tuple[str, str], RouteResult] = {}
+        for lang_key, keys in by_lang.items():
+            fuzzy = snapshot.fuzzy_index_for(lang_key)
+            for text, lang in keys:
+                results[(text, lang)] = self._inspect_cached(text, lang, mode, fuzzy, snapshot)
+
+        # Duplicates get their own dict, so callers can mutate freely
+        for key in batch:
+            yield _emit(results[key], verbosity)
+
+    def _inspect_cached(
+        self, text: str, lang: str, mode: str, fuzzy: Any = None, snapshot: Optional[CorpusSnapshot] = None,
+    ) -> RouteResult:
+        """inspect() through the optional result cache"""
+        if snapshot is None:
+            snapshot = self._snapshot
+        if not self._cache_size:
+            return self._inspect(text, lang, mode, fuzzy, snapshot)
+
+        key = (text, lang, mode)
+        profiler = self._profiler
+        start = time.perf_counter() if profiler is not None else 0.0
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+        if cached is not None:
+            # Results are immutable records: hits are returned without copying
+            if profiler is not None:
+                elapsed = time.perf_counter() - start
+                stages = {"cache": elapsed, "total": elapsed}
+                profiler.record("cache", stages)
+                cached = cached._replace(profile=_profile_meta("cache", stages, {}))
+            return cached
+
+        # Computed without the lock; concurrent misses on one key may both compute
+        out = self._inspect(text, lang, mode, fuzzy, snapshot)
+        with self._cache_lock:
+            # A reload may have swapped the corpus meanwhile: don't cache stale results
+            if self._snapshot is snapshot:
+                self._cache[key] = out
+                self._cache.move_to_end(key)
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+                    self._cache_evictions += 1
+        return out
+
+    def _invalidate_cache(self, old: CorpusSnapshot, new: CorpusSnapshot, langs: Iterable[str]) -> None:
+        """Drop cached results that a corpus change from old to new can affect.
+
+        A trace depends only on its own language's samples when that
+        language has any; otherwise it used the all-samples fallback.
+        """
+        langs = set(langs)
+        if not langs:
+            return
+        with self._cache_lock:
+            for key in list(self._cache):
+                lang_key = (key[1] or "").upper()
+                if lang_key in langs or lang_key not in old.lang_counts or lang_key not in new.lang_counts:
+                    del self._cache[key]
+
+    def _inspect(
+        self, text: str, lang: str, mode: str, fuzzy: Any = None, snapshot: Optional[CorpusSnapshot] = None,
+    ) -> RouteResult:
+        """Uncached inspect() implementation for an explicit mode"""
+        if snapshot is None:
+            snapshot = self._snapshot
+        profiler = self._profiler
+        if profiler is not None:
+            return self._inspect_profiled(text, lang, mode, fuzzy, snapshot, profiler)
+
         text_norm = (text or "").strip()
         if not text_norm:
-            return self._pack(
-                text, lang,
-                route="MINI", state4="Harmony", zs=0.95,
-                theta=0.0, shape="POINT", need=0.0,
-                is_fracture=False, short_sig_cap_applied=False,
-                notes="Empty input -> MINI"
-            )
+            return self._empty_trace(text, lang, mode)
 
-        # exact match
-        for s in self.samples:
-            if s.get("lang", "").upper() == lang.upper() and (s.get("text", "").strip() == text_norm):
-                return self._from_sample(s, match="exact")
-
-        # fuzzy match (same language first)
-        candidates = [s for s in self.samples if s.get("lang", "").upper() == lang.upper()]
-        if not candidates:
-            candidates = self.samples
-
-        best: Optional[Dict[str, Any]] = None
-        best_score = 0.0
-        for s in candidates:
-            t = (s.get("text", "") or "").strip()
-            if not t:
-                continue
-            score = difflib.SequenceMatcher(a=text_norm, b=t).ratio()
-            if score > best_score:
-                best_score = score
-                best = s
-
-        if best is not None and best_score >= 0.72:
-            out = self._from_sample(best, match=f"fuzzy:{best_score:.2f}")
-            out["meta"]["nearest_text"] = best.get("text", "")
-            return out
+        hit = self._match(text_norm, lang, snapshot, fuzzy)
+        if hit is not None:
+            return self._from_match(hit, mode, snapshot)
 
         # Mode-aware conservative fallback with Fracture governance
-        return self._fallback_heuristic(text_norm, lang)
+        return self._fallback_heuristic(text_norm, lang, mode)
+
+    def _inspect_profiled(
+        self, text: str, lang: str, mode: str, fuzzy: Any, snapshot: CorpusSnapshot,
+        profiler: StageProfiler,
+    ) -> RouteResult:
+        """_inspect() with each stage timed, recorded and attached as meta.profile"""
+        clock = time.perf_counter
+        start = clock()
+        stages: Dict[str, float] = {}
+        fuzzy_stats: Dict[str, int] = {}
+
+        text_norm = (text or "").strip()
+        if not text_norm:
+            path = "empty"
+            out = self._empty_trace(text, lang, mode)
+        else:
+            t = clock()
+            hit = self._match_exact(text_norm, lang, snapshot)
+            stages["exact"] = clock() - t
+            if hit is None:
+                t = clock()
+                hit = self._match_fuzzy(text_norm, lang, snapshot, fuzzy, fuzzy_stats)
+                stages["fuzzy"] = clock() - t
+            if hit is not None:
+                path = "exact" if hit[1] == "exact" else "fuzzy"
+                out = self._from_match(hit, mode, snapshot)
+            else:
+                path = "heuristic"
+                t = clock()
+                out = self._fallback_heuristic(text_norm, lang, mode)
+                stages["heuristic"] = clock() - t
 
-    def _fallback_heuristic(self, text: str, lang: str) -> Dict[str, Any]:
+        stages["total"] = clock() - start
+        profiler.record(path, stages, fuzzy_stats.get("scored"), fuzzy_stats.get("pruned"))
+        return out._replace(profile=_profile_meta(path, stages, fuzzy_stats))
+
+    def _empty_trace(self, text: str, lang: str, mode: str) -> RouteResult:
+        return self._pack(
+            text, lang,
+            route="MINI", state4="Harmony", zs=0.95,
+            theta=0.0, shape="POINT", need=0.0,
+            is_fracture=False, short_sig_cap_applied=False,
+            notes="Empty input -> MINI", mode=mode
+        )
+
+    def inspect_modes(
+        self, text: str, lang: str = "EN", modes: Optional[Iterable[str]] = None,
+        verbosity: str = "full",
+    ) -> Dict[str, Any]:
+        """Inspect once and return one trace per mode (all modes by default).
+
+        Sample matching and the fallback's structural features do not depend
+        on the mode, so they are computed a single time; only the routing
+        step runs per mode. Each trace equals ``inspect()`` in that mode.
+        This path bypasses the result cache.
+        """
+        modes = list(self.MODE_THRESHOLDS) if modes is None else [self._check_mode(m) for m in modes]
+        verbosity = self._check_verbosity(verbosity)
+
+        snapshot = self._snapshot
+        text_norm = (text or "").strip()
+        if not text_norm:
+            results = {mode: self._inspect(text, lang, mode, snapshot=snapshot) for mode in modes}
+        else:
+            hit = self._match(text_norm, lang, snapshot)
+            if hit is not None:
+                results = {mode: self._from_match(hit, mode, snapshot) for mode in modes}
+            else:
+                features = self._extract_features(text_norm)
+                results = {mode: self._route_features(text_norm, lang, features, mode) for mode in modes}
+        return {mode: _emit(result, verbosity) for mode, result in results.items()}
+
+    def _match(
+        self, text_norm: str, lang: str, snapshot: CorpusSnapshot, fuzzy: Any = None,
+    ) -> Optional[Tuple[int, str]]:
+        """Find the sample for a stripped text: (sample position, match label)"""
+        hit = self._match_exact(text_norm, lang, snapshot)
+        if hit is not None:
+            return hit
+        return self._match_fuzzy(text_norm, lang, snapshot, fuzzy)
+
+    def _match_exact(self, text_norm: str, lang: str, snapshot: CorpusSnapshot) -> Optional[Tuple[int, str]]:
+        """Exact match, O(1) via the prebuilt index"""
+        pos = snapshot.match_exact(text_norm, lang)
+        if pos is not None:
+            return pos, "exact"
+        return None
+
+    def _match_fuzzy(
+        self, text_norm: str, lang: str, snapshot: CorpusSnapshot, fuzzy: Any = None,
+        stats: Optional[Dict[str, int]] = None,
+    ) -> Optional[Tuple[int, str]]:
+        """Fuzzy match (same language first), pruned by the fuzzy index"""
+        if fuzzy is None:
+            fuzzy = snapshot.fuzzy_index_for(lang)
+        pos, best_score = fuzzy.best_match(text_norm, self.FUZZY_THRESHOLD, stats)
+        if pos is not None and best_score >= self.FUZZY_THRESHOLD:
+            return pos, f"fuzzy:{best_score:.2f}"
+        return None
+
+    def _from_match(self, hit: Tuple[int, str], mode: str, snapshot: CorpusSnapshot) -> RouteResult:
+        pos, match = hit
+        sample = snapshot.sample(pos)
+        nearest_text = None if match == "exact" else sample.get("text", "")
+        return self._from_sample(sample, match=match, mode=mode, nearest_text=nearest_text)
+
+    def fallback_many(
+        self, items: Iterable[Tuple[str, str]], mode: Optional[str] = None, verbosity: str = "full",
+    ) -> List[Any]:
+        """Fallback-heuristic traces for many (text, lang) pairs, vectorized with NumPy.
+
+        Skips sample matching: each trace equals what inspect() returns when
+        no sample matches, and empty or whitespace-only texts get inspect()'s
+        empty-input trace. Features are extracted once per text and routing
+        runs as array operations (see bulk_routing.py). Requires NumPy.
+        """
+        from bulk_routing import extract_features, pack_traces, route_arrays
+
+        mode = self._check_mode(mode)
+        verbosity = self._check_verbosity(verbosity)
+        items = list(items)
+        results: List[Any] = [None] * len(items)
+        rows = []
+        for i, (text, lang) in enumerate(items):
+            if (text or "").strip():
+                rows.append(i)
+            else:
+                results[i] = self._empty_trace(text, lang, mode)
+        features = extract_features(self, (items[i] for i in rows))
+        routed = pack_traces(self, features, route_arrays(features, mode, self.MODE_THRESHOLDS[mode]), mode)
+        for i, result in zip(rows, routed):
+            results[i] = result
+        return [_emit(result, verbosity) for result in results]
+
+    def _fallback_heuristic(self, text: str, lang: str, mode: str) -> RouteResult:
         """Apply mode-aware fallback heuristic with Fracture governance"""
-        thresholds = self.MODE_THRESHOLDS[self._mode]
+        return self._route_features(text, lang, self._extract_features(text), mode)
+
+    def _extract_features(self, text: str) -> TextFeatures:
+        """Compute the mode-independent structural features of a stripped text"""
+        hits = self.KEYWORD_MATCHER.scan(text.lower())
+        return TextFeatures(
+            char_len=len(text),
+            has_numbers=any(ch.isdigit() for ch in text),
+            risky_claim=bool(hits["risky_claim"]),
+            negation=bool(hits["negation"]),
+            high_stakes=bool(hits["high_stakes"]),
+            matched_keywords=hits,
+        )
+
+    def _route_features(self, text: str, lang: str, features: TextFeatures, mode: str) -> RouteResult:
+        """Mode-aware routing of precomputed features with Fracture governance"""
+        thresholds = self.MODE_THRESHOLDS[mode]
         mini_base = thresholds["mini_base"]
         standard_base = thresholds["standard_base"]
-        
-        lower = text.lower()
-        char_len = len(text)
-        has_numbers = any(ch.isdigit() for ch in text)
-        risky_claim = any(k in lower for k in ["100%", "guarantee", "cure", "always", "never", "perfect", "죽", "kill", "법적", "소송"])
-        negation = any(k in lower for k in ["not", "never", "no "]) or any(k in text for k in ["아니다", "않", "못", "없"])
-        high_stakes = any(k in lower for k in ["법", "의료", "금융", "law", "medical", "financial", "contract", "계약"])
+
+        char_len = features.char_len
+        has_numbers = features.has_numbers
+        risky_claim = features.risky_claim
+        negation = features.negation
+        high_stakes = features.high_stakes
 
         # Calculate need score
         need = 0.35 + (0.15 if has_numbers else 0.0) + (0.15 if risky_claim else 0.0) + (0.10 if negation else 0.0)
@@ -228,7 +829,7 @@ class MSRVPublicEngine:
             route = "PREMIUM"
         else:
             # Mode-aware routing for non-Fracture
-            if self._mode == "conservative":
+            if mode == "conservative":
                 # MINI disabled in conservative mode
                 if need <= standard_base:
                     route = "STANDARD"
@@ -260,10 +861,13 @@ class MSRVPublicEngine:
             text=text, lang=lang, route=route, state4=state4, zs=zs, 
             theta=theta, shape=shape, need=need,
             is_fracture=is_fracture, short_sig_cap_applied=short_sig_cap_applied,
-            notes=f"Public fallback heuristic (mode={self._mode}). Fracture governance enforced."
+            notes=self.FALLBACK_NOTES.format(mode=mode),
+            mode=mode, matched_keywords=features.matched_keywords
         )
 
-    def _from_sample(self, s: Dict[str, Any], match: str) -> Dict[str, Any]:
+    def _from_sample(
+        self, s: Dict[str, Any], match: str, mode: str, nearest_text: Optional[str] = None,
+    ) -> RouteResult:
         route = self._convert_route(s.get("route", "STANDARD"))
         state4 = s.get("state4") or "Harmony"
         is_fracture = (state4 == "Fracture")
@@ -273,7 +877,7 @@ class MSRVPublicEngine:
             route = "STANDARD"
         
         # Apply mode constraint (conservative disables MINI)
-        if self._mode == "conservative" and route == "MINI":
+        if mode == "conservative" and route == "MINI":
             route = "STANDARD"
         
         return self._pack(
@@ -287,47 +891,32 @@ class MSRVPublicEngine:
             need=s.get("need"),
             is_fracture=is_fracture,
             short_sig_cap_applied=False,
-            notes=(s.get("notes") or "") + (f" | match={match} | mode={self._mode}" if match else "")
+            notes=s.get("notes") or "",
+            mode=mode,
+            match=match,
+            nearest_text=nearest_text,
         )
 
     def _pack(
         self, text: str, lang: str, route: str, state4: str,
         zs: Optional[float], theta: Optional[float], shape: Optional[str],
         need: Optional[float], is_fracture: bool, short_sig_cap_applied: bool,
-        notes: str
-    ) -> Dict[str, Any]:
-        """Pack result with route_reason for white-box tracing"""
-        return {
-            "input": {"text": text, "lang": lang},
-            "output": {
-                "route": route,
-                "state4": state4,
-                "Zs": zs,
-                "theta": theta,
-                "shape": shape,
-                "need": need,
-                "route_reason": {
-                    "need": need,
-                    "is_fracture": is_fracture,
-                    "short_sig_cap_applied": short_sig_cap_applied,
-                    "mode": self._mode,
-                    "governance": "Fracture→MINI blocked" if is_fracture else "normal",
-                }
-            },
-            "meta": {
-                "engine": "MSRV-Public-Demo-v2.5.5-patch",
-                "mode": self._mode,
-                "proprietary_core": False,
-                "fracture_governance": True,  # PATCH: Governance flag
-                "notes": notes,
-            }
-        }
+        notes: str, mode: str, match: Optional[str] = None,
+        matched_keywords: Optional[Dict[str, Tuple[str, ...]]] = None,
+        nearest_text: Optional[str] = None,
+    ) -> RouteResult:
+        """Pack result; route_reason for white-box tracing is built by RouteResult.trace()"""
+        return RouteResult(
+            route, state4, zs, theta, shape, need, is_fracture, short_sig_cap_applied,
+            mode, text, lang, notes, match, matched_keywords, nearest_text,
+        )
     
-    def get_mode_info(self) -> Dict[str, Any]:
-        """Get information about current mode"""
+    def get_mode_info(self, mode: Optional[str] = None) -> Dict[str, Any]:
+        """Get information about a mode (default: the engine mode)"""
+        mode = self._check_mode(mode)
         return {
-            "current_mode": self._mode,
-            "thresholds": self.MODE_THRESHOLDS[self._mode],
+            "current_mode": mode,
+            "thresholds": self.MODE_THRESHOLDS[mode],
             "modes_available": list(self.MODE_THRESHOLDS.keys()),
             "mode_descriptions": {
                 "conservative": "MINI disabled, maximum safety for pilot/trust-building",
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""fuzzy_index.py
+
+Candidate-pruning indexes for the fuzzy nearest-neighbour step of
+MSRVPublicEngine.inspect().
+
+All indexes return exactly what the original brute-force scan returned:
+the first candidate (in sample order) with the highest
+difflib.SequenceMatcher(a=query, b=candidate).ratio(), for every match
+whose score reaches ``min_score``. Pruning only uses true upper bounds of
+ratio(), so no qualifying match can be skipped:
+
+- length bound:  2 * min(la, lb) / (la + lb)        (real_quick_ratio)
+- char bound:    2 * sum(min(count_a, count_b)) / (la + lb)  (quick_ratio)
+- LCS bound:     2 * LCS(a, b) / (la + lb)
+  (difflib's matching blocks form a common subsequence, so their total
+  size never exceeds the longest common subsequence)
+
+``best_match(..., stats={})`` also reports how many entries were
+considered (``candidates``), fully scored with ratio() (``scored``) and
+skipped without scoring (``pruned``).
+
+Full scoring reuses a SequenceMatcher prepared per candidate (its b2j
+tables are built once at index time); queries work on a shallow copy, so
+indexes stay safe to share between threads.
+
+Indexes are never modified once built. ``with_changes(removed, added)``
+returns a new index that shares the prepared data of unchanged entries:
+removed entries become tombstones and added entries are appended, so
+only the delta is prepared. Since entries can then be out of sample
+order, ties are always resolved by sample position.
+"""
+
+from __future__ import annotations
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import copy
+
+if TYPE_CHECKING:
+    import difflib
+
+
+# (sample position, stripped text)
+Entry = Tuple[int, str]
+# (sample position or None, score)
+Match = Tuple[Optional[int], float]
+
+
+class FuzzyIndexMismatch(RuntimeError):
+    """Raised in verification mode when an index disagrees with brute force"""
+
+
+# difflib is imported on first use: engines that only ever hit exact
+# matches never build a fuzzy index, and startup skips it
+
+def _ratio(query: str, text: str) -> float:
+    from difflib import SequenceMatcher
+    return SequenceMatcher(a=query, b=text).ratio()
+
+
+def _prepared_matcher(text: str) -> difflib.SequenceMatcher:
+    """Matcher with b=text already indexed; a is set per query"""
+    from difflib import SequenceMatcher
+    return SequenceMatcher(None, "", text)
+
+
+def _prepared_ratio(matcher: difflib.SequenceMatcher, query: str) -> float:
+    """Same value as _ratio(query, matcher.b), without re-indexing b"""
+    m = copy.copy(matcher)
+    m.set_seq1(query)
+    return m.ratio()
+
+
+def _char_masks(text: str) -> Dict[str, int]:
+    """Per-character bitmasks of positions in text (for bit-parallel LCS)"""
+    masks: Dict[str, int] = {}
+    for i, ch in enumerate(text):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    return masks
+
+
+def _lcs_length(query: str, masks: Dict[str, int], m: int) -> int:
+    """Longest common subsequence length, bit-parallel (Hyyrö 2004)"""
+    full = (1 << m) - 1
+    v = full
+    for ch in query:
+        u = v & masks.get(ch, 0)
+        v = ((v + u) | (v - u)) & full
+    return m - bin(v).count("1")
+
+
+class _DeltaIndex:
+    """Per-entry data in parallel lists, updated through tombstones.
+
+    ``_columns`` names the lists, ``_prepare`` computes one entry's values
+    and ``_tombstone`` holds the values left behind by a removed entry
+    (entry None, length 0).
+    """
+
+    _columns: Tuple[str, ...] = ("entries",)
+    _tombstone: Tuple[Any, ...] = (None,)
+
+    def _init_columns(self, entries: Iterable[Entry]) -> None:
+        for name in self._columns:
+            setattr(self, name, [])
+        self._e_of: Dict[int, int] = {}
+        for entry in entries:
+            self._append(entry)
+
+    def _prepare(self, entry: Entry) -> Tuple[Any, ...]:
+        return (entry,)
+
+    def _append(self, entry: Entry) -> int:
+        e = len(self.entries)
+        for name, value in zip(self._columns, self._prepare(entry)):
+            getattr(self, name).append(value)
+        self._e_of[entry[0]] = e
+        return e
+
+    def _update(self, removed: Iterable[int], added: Sequence[Entry]) -> None:
+        for pos in removed:
+            e = self._e_of.pop(pos, None)
+            if e is not None:
+                for name, value in zip(self._columns, self._tombstone):
+                    getattr(self, name)[e] = value
+        for entry in added:
+            self._append(entry)
+
+    def with_changes(self, removed: Iterable[int], added: Sequence[Entry]):
+        """New index without the removed sample positions, plus added entries.
+
+        A position may appear in both to replace its entry.
+        """
+        new = copy.copy(self)
+        for name in self._columns:
+            setattr(new, name, list(getattr(self, name)))
+        new._e_of = dict(self._e_of)
+        new._update(removed, added)
+        return new
+
+    def __len__(self) -> int:
+        return len(self._e_of)
+
+
+class BruteForceIndex(_DeltaIndex):
+    """Reference implementation: score every candidate (the original scan)"""
+
+    name = "brute"
+
+    def __init__(self, entries: Sequence[Entry]):
+        self._init_columns(entries)
+
+    def best_match(self, query: str, min_score: float = 0.0, stats: Optional[Dict[str, Any]] = None) -> Match:
+        if stats is not None:
+            stats["candidates"] = stats["scored"] = len(self._e_of)
+            stats["pruned"] = 0
+        best: Optional[int] = None
+        best_score = 0.0
+        for entry in self.entries:
+            if entry is None:
+                continue
+            pos, text = entry
+            score = _ratio(query, text)
+            if score > best_score or (score == best_score and best is not None and pos < best):
+                best_score = score
+                best = pos
+        return best, best_score
+
+
+class PrunedScanIndex(_DeltaIndex):
+    """Linear scan in sample order with cheap upper bounds before ratio().
+
+    Each candidate is checked against the length bound (real_quick_ratio)
+    and then the character bound (quick_ratio); the full ratio() only runs
+    when the bound can still reach ``min_score`` and beat the current best.
+    """
+
+    name = "pruned"
+    _columns = ("entries", "_lengths", "_counts", "_matchers")
+    _tombstone = (None, 0, None, None)
+
+    def __init__(self, entries: Sequence[Entry]):
+        self._init_columns(entries)
+
+    def _prepare(self, entry: Entry) -> Tuple[Any, ...]:
+        text = entry[1]
+        return entry, len(text), Counter(text), _prepared_matcher(text)
+
+    def best_match(self, query: str, min_score: float = 0.0, stats: Optional[Dict[str, Any]] = None) -> Match:
+        la = len(query)
+        query_counts = Counter(query).items()
+        entries = self.entries
+        best_e: Optional[int] = None
+        best_pos = -1
+        best_score = 0.0
+        scored = 0
+        for e, lb in enumerate(self._lengths):
+            if not lb:  # tombstone
+                continue
+            # A bound equal to the best only matters for an earlier sample (ties)
+            bound = 2.0 * min(la, lb) / (la + lb)
+            if bound < min_score or bound < best_score or (bound == best_score and entries[e][0] > best_pos):
+                continue
+            counts = self._counts[e]
+            matches = 0
+            for ch, qa in query_counts:
+                cb = counts.get(ch)
+                if cb:
+                    matches += qa if qa < cb else cb
+            bound = 2.0 * matches / (la + lb)
+            if bound < min_score or bound < best_score or (bound == best_score and entries[e][0] > best_pos):
+                continue
+            score = _prepared_ratio(self._matchers[e], query)
+            scored += 1
+            pos = entries[e][0]
+            if score > best_score or (score == best_score and best_e is not None and pos < best_pos):
+                best_score = score
+                best_e = e
+                best_pos = pos
+
+        if stats is not None:
+            stats["candidates"] = len(self._e_of)
+            stats["scored"] = scored
+            stats["pruned"] = len(self._e_of) - scored
+        if best_e is None:
+            return None, 0.0
+        return self.entries[best_e][0], best_score
+
+
+class CharProfileIndex(_DeltaIndex):
+    """Character inverted lists + length filtering.
+
+    Candidates are collected from per-character posting lists, bounded by
+    quick_ratio, and only the shortlist whose bound can still reach
+    ``min_score`` (and the current best) is checked against the tighter LCS
+    bound and finally scored with the full ratio().
+    """
+
+    name = "charindex"
+    _columns = ("entries", "_lengths", "_masks", "_matchers")
+    _tombstone = (None, 0, None, None)
+
+    def __init__(self, entries: Sequence[Entry]):
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._init_columns([])
+        self._update((), entries)
+
+    def _prepare(self, entry: Entry) -> Tuple[Any, ...]:
+        text = entry[1]
+        return entry, len(text), _char_masks(text), _prepared_matcher(text)
+
+    def _update(self, removed: Iterable[int], added: Sequence[Entry]) -> None:
+        # Tombstoned entries stay in the posting lists and are skipped by
+        # their zero length; only lists of characters in added texts are
+        # copied, so older snapshots keep their own lists.
+        super()._update(removed, ())
+        new_postings: Dict[str, List[Tuple[int, int]]] = {}
+        for entry in added:
+            e = self._append(entry)
+            for ch, count in Counter(entry[1]).items():
+                new_postings.setdefault(ch, []).append((e, count))
+        postings = dict(self._postings)
+        for ch, items in new_postings.items():
+            postings[ch] = postings.get(ch, []) + items
+        self._postings = postings
+
+    def best_match(self, query: str, min_score: float = 0.0, stats: Optional[Dict[str, Any]] = None) -> Match:
+        la = len(query)
+        overlap: Dict[int, int] = {}
+        for ch, qa in Counter(query).items():
+            for e, cb in self._postings.get(ch, ()):
+                overlap[e] = overlap.get(e, 0) + (qa if qa < cb else cb)
+
+        shortlist: List[Tuple[float, int]] = []
+        lengths = self._lengths
+        for e, matches in overlap.items():
+            lb = lengths[e]
+            if not lb:  # tombstone
+                continue
+            # real_quick_ratio bound first, then quick_ratio bound
+            if 2.0 * min(la, lb) / (la + lb) < min_score:
+                continue
+            bound = 2.0 * matches / (la + lb)
+            if bound >= min_score:
+                shortlist.append((-bound, e))
+        shortlist.sort()
+
+        best_e: Optional[int] = None
+        best_score = 0.0
+        scored = 0
+        for neg_bound, e in shortlist:
+            if -neg_bound < best_score:
+                break
+            lb = lengths[e]
+            lcs_bound = 2.0 * _lcs_length(query, self._masks[e], lb) / (la + lb)
+            if lcs_bound < min_score or lcs_bound < best_score:
+                continue
+            score = _prepared_ratio(self._matchers[e], query)
+            scored += 1
+            # Ties keep the earliest sample, like the linear scan
+            if score > best_score or (
+                score == best_score and best_e is not None and self.entries[e][0] < self.entries[best_e][0]
+            ):
+                best_score = score
+                best_e = e
+
+        if stats is not None:
+            stats["candidates"] = len(overlap)
+            stats["scored"] = scored
+            stats["pruned"] = len(self._e_of) - scored
+        if best_e is None:
+            return None, 0.0
+        return self.entries[best_e][0], best_score
+
+
+class VerifyingIndex:
+    """Run an index next to the brute-force scan and fail on any mismatch"""
+
+    name = "verify"
+
+    def __init__(self, entries: Sequence[Entry], index_cls: Callable[[Sequence[Entry]], object] = CharProfileIndex):
+        self.index = index_cls(entries)
+        self.reference = BruteForceIndex(entries)
+
+    def with_changes(self, removed: Iterable[int], added: Sequence[Entry]) -> "VerifyingIndex":
+        removed = list(removed)
+        new = copy.copy(self)
+        new.index = self.index.with_changes(removed, added)
+        new.reference = self.reference.with_changes(removed, added)
+        return new
+
+    def __len__(self) -> int:
+        return len(self.reference)
+
+    def best_match(self, query: str, min_score: float = 0.0, stats: Optional[Dict[str, Any]] = None) -> Match:
+        got = self.index.best_match(query, min_score, stats)
+        want = self.reference.best_match(query, min_score)
+        if _qualified(want, min_score) != _qualified(got, min_score):
+            raise FuzzyIndexMismatch(
+                f"{self.index.name} returned {got}, brute force returned {want} for {query!r}"
+            )
+        return got
+
+
+def _qualified(match: Match, min_score: float) -> Match:
+    """Only matches reaching min_score are part of the index contract"""
+    pos, score = match
+    if pos is None or score < min_score:
+        return None, 0.0
+    return pos, score
+
+
+FUZZY_INDEXES: Dict[str, Callable[[Sequence[Entry]], object]] = {
+    BruteForceIndex.name: BruteForceIndex,
+    PrunedScanIndex.name: PrunedScanIndex,
+    CharProfileIndex.name: CharProfileIndex,
+    VerifyingIndex.name: VerifyingIndex,
+}
+
+
+def make_fuzzy_index(kind, entries: Sequence[Entry], verify: bool = False):
+    """Build a fuzzy index by registry name (or factory callable)"""
+    if isinstance(kind, str):
+        if kind not in FUZZY_INDEXES:
+            raise ValueError(f"Invalid fuzzy index: {kind}. Use: {', '.join(FUZZY_INDEXES)}")
+        factory = FUZZY_INDEXES[kind]
+    else:
+        factory = kind
+    if verify and factory is not VerifyingIndex:
+        return VerifyingIndex(entries, index_cls=factory)
+    return factory(entries)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Async HTTP routing service for MSR-V Public Demo v2.5.5-patch.
+
+Serves MSRVPublicEngine routing decisions over HTTP/1.1 (keep-alive) using
+only the standard library:
+
+    GET  /healthz
+    GET  /mode_info?mode=balanced
+    POST /inspect        {"text": "...", "lang": "EN", "mode": "balanced", "verbosity": "full"}
+    POST /inspect_many   {"items": [{"text": "...", "lang": "EN"}, ...], "mode": "...", "verbosity": "..."}
+
+``verbosity`` is route_only (flat routing fields), standard or full (default).
+
+CPU-bound inspection (fuzzy matching) runs in a process pool with one engine
+per worker. Each request is bounded by a timeout (504), and once
+``max_pending`` jobs are in the pool (including ones whose request already
+timed out but are still running) new requests are rejected with 503 and a
+Retry-After header instead of queueing without limit.
+
+Run:
+    python http_service.py --port 8080 --workers 4
+"""
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+import argparse
+import asyncio
+import json
+import os
+
+from engine import VERBOSITY_LEVELS, MSRVPublicEngine
+
+
+MAX_BODY_BYTES = 8 * 1024 * 1024
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 503: "Service Unavailable", 504: "Gateway Timeout",
+}
+
+
+# ============================================================================
+# Worker process side
+# ============================================================================
+
+_WORKER_ENGINE: Optional[MSRVPublicEngine] = None
+
+
+def _init_worker(samples_path: Optional[str], cache_size: int) -> None:
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = MSRVPublicEngine(samples_path=samples_path, cache_size=cache_size)
+
+
+def _job_inspect(text: str, lang: str, mode: str, verbosity: str) -> Dict[str, Any]:
+    out = _WORKER_ENGINE.inspect(text, lang, mode=mode, verbosity=verbosity)
+    return out.compact() if verbosity == "route_only" else out
+
+
+def _job_inspect_many(items: List[Tuple[str, str]], mode: str, verbosity: str) -> List[Dict[str, Any]]:
+    results = _WORKER_ENGINE.inspect_many(items, mode=mode, verbosity=verbosity)
+    if verbosity == "route_only":
+        return [r.compact() for r in results]
+    return list(results)
+
+
+# ============================================================================
+# HTTP service
+# ============================================================================
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class RoutingService:
+    """asyncio HTTP front end over a process pool of engines"""
+
+    def __init__(
+        self, workers: int = 2, timeout: float = 5.0, max_pending: int = 256,
+        max_batch: int = 1000, samples_path: Optional[str] = None, cache_size: int = 0,
+    ):
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker, initargs=(samples_path, cache_size),
+        )
+        # Local engine only answers get_mode_info (no inspection in the event loop)
+        self._info_engine = MSRVPublicEngine(samples_path=samples_path)
+        self._pending = 0
+        self.stats = {"requests": 0, "rejected": 0, "timeouts": 0, "errors": 0}
+
+    def close(self) -> None:
+        self._pool.shutdown(cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, target, headers, body = request
+                status, payload, extra = await self._dispatch(method, target, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._write_response(writer, status, payload, extra, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except HTTPError as e:
+            await self._write_response(writer, e.status, {"error": e.message}, {}, False)
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, _version = line.decode("latin-1").split()
+        except ValueError:
+            raise HTTPError(400, "Malformed request line")
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        raw_length = headers.get("content-length", "0") or "0"
+        if not raw_length.isdigit():
+            raise HTTPError(400, "Content-Length must be a non-negative integer")
+        length = int(raw_length)
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(413, "Request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target, headers, body
+
+    async def _write_response(
+        self, writer: asyncio.StreamWriter, status: int, payload: Any,
+        extra: Dict[str, str], keep_alive: bool,
+    ) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = [
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        head += [f"{k}: {v}" for k, v in extra.items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Any, Dict[str, str]]:
+        self.stats["requests"] += 1
+        url = urlsplit(target)
+        routes = {
+            "/healthz": ("GET", self._healthz),
+            "/mode_info": ("GET", self._mode_info),
+            "/inspect": ("POST", self._inspect),
+            "/inspect_many": ("POST", self._inspect_many),
+        }
+        if url.path not in routes:
+            return 404, {"error": f"Unknown path: {url.path}"}, {}
+        allowed, handler = routes[url.path]
+        if method != allowed:
+            return 405, {"error": f"Use {allowed} for {url.path}"}, {"Allow": allowed}
+
+        try:
+            if method == "POST":
+                try:
+                    data = json.loads(body or b"{}")
+                except ValueError:
+                    raise HTTPError(400, "Body must be valid JSON")
+                if not isinstance(data, dict):
+                    raise HTTPError(400, "Body must be a JSON object")
+            else:
+                data = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            return 200, await handler(data), {}
+        except HTTPError as e:
+            if e.status == 503:
+                self.stats["rejected"] += 1
+                return e.status, {"error": e.message}, {"Retry-After": "1"}
+            if e.status == 504:
+                self.stats["timeouts"] += 1
+            return e.status, {"error": e.message}, {}
+        except Exception as e:  # engine failure: report, keep serving
+            self.stats["errors"] += 1
+            return 500, {"error": f"{type(e).__name__}: {e}"}, {}
+
+    def _mode(self, data: Dict[str, Any]) -> str:
+        mode = data.get("mode") or self._info_engine.mode
+        if not isinstance(mode, str) or mode not in MSRVPublicEngine.MODE_THRESHOLDS:
+            raise HTTPError(400, f"Invalid mode: {mode}. Use: conservative, balanced, aggressive")
+        return mode
+
+    def _verbosity(self, data: Dict[str, Any]) -> str:
+        verbosity = data.get("verbosity") or "full"
+        if not isinstance(verbosity, str) or verbosity not in VERBOSITY_LEVELS:
+            raise HTTPError(400, f"Invalid verbosity: {verbosity}. Use: {', '.join(VERBOSITY_LEVELS)}")
+        return verbosity
+
+    @staticmethod
+    def _lang(lang: Any) -> str:
+        if lang is None or lang == "":
+            return "EN"
+        if not isinstance(lang, str):
+            raise HTTPError(400, "'lang' must be a string")
+        return lang
+
+    async def _offload(self, fn, *args) -> Any:
+        """Run a job in the worker pool with backpressure and a timeout"""
+        if self._pending >= self.max_pending:
+            raise HTTPError(503, "Too many pending requests")
+        loop = asyncio.get_running_loop()
+        future = self._pool.submit(fn, *args)
+        # A job counts against max_pending until the worker is done with it,
+        # not until we stop waiting: a timed-out job keeps its worker busy.
+        self._pending += 1
+        future.add_done_callback(lambda _f: self._release(loop))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            raise HTTPError(504, f"Inspection exceeded {self.timeout}s")
+
+    def _release(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Done callback of a pool job (runs on the pool's thread)"""
+        def release():
+            self._pending -= 1
+        try:
+            loop.call_soon_threadsafe(release)
+        except RuntimeError:  # loop already closed (shutdown)
+            pass
+
+    # ------------------------------------------------------------------
+    # Endpoints
+    # ------------------------------------------------------------------
+
+    async def _healthz(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {"status": "ok", "pending": self._pending, "workers": self.workers, **self.stats}
+
+    async def _mode_info(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return self._info_engine.get_mode_info(self._mode(data))
+
+    async def _inspect(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        text = data.get("text")
+        if not isinstance(text, str):
+            raise HTTPError(400, "'text' (string) is required")
+        lang = self._lang(data.get("lang"))
+        return await self._offload(_job_inspect, text, lang, self._mode(data), self._verbosity(data))
+
+    async def _inspect_many(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        raw = data.get("items")
+        if not isinstance(raw, list):
+            raise HTTPError(400, "'items' (list) is required")
+        if len(raw) > self.max_batch:
+            raise HTTPError(413, f"At most {self.max_batch} items per batch")
+        items: List[Tuple[str, str]] = []
+        for item in raw:
+            if isinstance(item, dict) and isinstance(item.get("text"), str):
+                items.append((item["text"], self._lang(item.get("lang"))))
+            elif isinstance(item, (list, tuple)) and item and isinstance(item[0], str):
+                items.append((item[0], self._lang(item[1] if len(item) > 1 else None)))
+            else:
+                raise HTTPError(400, "Each item needs a 'text' string")
+        results = await self._offload(_job_inspect_many, items, self._mode(data), self._verbosity(data))
+        return {"results": results}
+
+
+async def serve(service: RoutingService, host: str, port: int) -> None:
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    addrs = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"MSR-V routing service on {addrs} (workers={service.workers}, timeout={service.timeout}s)")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="MSR-V Public Demo async HTTP routing service")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8080)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Engine worker processes")
+    ap.add_argument("--timeout", type=float, default=5.0, help="Per-request timeout in seconds")
+    ap.add_argument("--max-pending", type=int, default=256, help="In-flight requests before 503")
+    ap.add_argument("--max-batch", type=int, default=1000, help="Max items per /inspect_many call")
+    ap.add_argument("--cache-size", type=int, default=0, help="Per-worker result cache size")
+    ap.add_argument("--samples", default=None, help="Sample file (default: bundled samples)")
+    args = ap.parse_args()
+
+    service = RoutingService(
+        workers=args.workers, timeout=args.timeout, max_pending=args.max_pending,
+        max_batch=args.max_batch, samples_path=args.samples, cache_size=args.cache_size,
+    )
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Load generator for the MSR-V async HTTP routing service.
+
+Replays bundled sample texts against /inspect (or /inspect_many batches)
+over keep-alive connections and reports throughput and latency
+percentiles (p50/p90/p99/max) plus status-code counts.
+
+Run (with http_service.py listening on localhost:8080):
+    python load_generator.py --concurrency 32 --requests 2000
+    python load_generator.py --batch 64 --duration 10
+"""
+
+from __future__ import annotations
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import time
+
+
+def load_texts(path: str) -> List[Tuple[str, str]]:
+    """(text, lang) pairs from a JSON sample list or a JSONL file"""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = json.load(f)
+    return [(r["text"], r.get("lang", "EN")) for r in rows if r.get("text")]
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Linearly interpolated percentile of an already sorted sequence.
+
+    Same definition as tools_patched/latency_stats.percentile (and numpy's
+    default), so load-test numbers compare directly with benchmark summaries.
+    """
+    n = len(sorted_values)
+    if n == 0:
+        return 0.0
+    pos = (n - 1) * pct / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, n - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+class Client:
+    """One keep-alive HTTP/1.1 connection"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def post(self, path: str, payload: Dict) -> int:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"POST {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+        )
+        try:
+            self._writer.write(head.encode("latin-1") + body)
+            await self._writer.drain()
+            status_line = await self._reader.readline()
+            if not status_line:
+                raise ConnectionError("connection closed")
+            status = int(status_line.split()[1])
+            length, close = 0, False
+            while True:
+                line = await self._reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                name = name.strip().lower()
+                if name == "content-length":
+                    length = int(value)
+                elif name == "connection" and value.strip().lower() == "close":
+                    close = True
+            await self._reader.readexactly(length)
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError):
+            self.close()
+            raise
+        if close:
+            self.close()
+        return status
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+
+async def run_load(
+    host: str, port: int, texts: List[Tuple[str, str]], concurrency: int,
+    total: Optional[int], duration: Optional[float], batch: int, mode: Optional[str],
+) -> Dict:
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    source = itertools.cycle(texts)
+    issued = 0
+    deadline = time.perf_counter() + duration if duration else None
+
+    def next_payload() -> Optional[Tuple[str, Dict]]:
+        nonlocal issued
+        if total is not None and issued >= total:
+            return None
+        if deadline is not None and time.perf_counter() >= deadline:
+            return None
+        issued += 1
+        if batch > 1:
+            items = [{"text": t, "lang": l} for t, l in itertools.islice(source, batch)]
+            payload = {"items": items}
+            path = "/inspect_many"
+        else:
+            t, l = next(source)
+            payload = {"text": t, "lang": l}
+            path = "/inspect"
+        if mode:
+            payload["mode"] = mode
+        return path, payload
+
+    async def worker() -> None:
+        client = Client(host, port)
+        try:
+            while True:
+                job = next_payload()
+                if job is None:
+                    return
+                t0 = time.perf_counter()
+                try:
+                    status = await client.post(*job)
+                except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError):
+                    status = "conn_error"
+                latencies.append(time.perf_counter() - t0)
+                statuses[status] += 1
+        finally:
+            client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    ok = statuses.get(200, 0)
+    return {
+        "requests": len(latencies),
+        "items_per_request": batch,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "throughput_items_per_s": round(ok * batch / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p90": round(percentile(latencies, 90) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+            "max": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        },
+        "status": {str(k): v for k, v in sorted(statuses.items(), key=lambda kv: str(kv[0]))},
+    }
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    ap = argparse.ArgumentParser(description="Load generator for http_service.py")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8080)
+    ap.add_argument("--concurrency", type=int, default=16, help="Concurrent keep-alive connections")
+    ap.add_argument("--requests", type=int, default=None, help="Total requests (default: 1000 unless --duration)")
+    ap.add_argument("--duration", type=float, default=None, help="Run for this many seconds")
+    ap.add_argument("--batch", type=int, default=1, help="Items per request; >1 uses /inspect_many")
+    ap.add_argument("--mode", default=None, help="Engine mode sent with each request")
+    ap.add_argument("--input", default=os.path.join(here, "public_samples.json"), help="JSON or JSONL texts")
+    ap.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = ap.parse_args()
+
+    total = args.requests if args.requests is not None or args.duration else 1000
+    texts = load_texts(args.input)
+    if not texts:
+        ap.error(f"No texts found in {args.input}")
+
+    report = asyncio.run(run_load(
+        args.host, args.port, texts, args.concurrency, total, args.duration, args.batch, args.mode,
+    ))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    lat = report["latency_ms"]
+    print(f"📊 {report['requests']} requests in {report['elapsed_s']}s "
+          f"(concurrency={args.concurrency}, batch={args.batch})")
+    print(f"   Throughput: {report['throughput_rps']} req/s, {report['throughput_items_per_s']} items/s")
+    print(f"   Latency: p50={lat['p50']}ms p90={lat['p90']}ms p99={lat['p99']}ms max={lat['max']}ms")
+    print(f"   Status: {report['status']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""sample_corpus.py
+
+Immutable corpus snapshots for MSRVPublicEngine, with delta updates and
+an optional polling file watcher.
+
+A CorpusSnapshot bundles the samples with everything derived from them
+(exact-match index, per-language fuzzy indexes). A published snapshot is
+never modified: inspect() reads the engine's current snapshot once and
+uses it for the whole call, and reloading builds a new snapshot and swaps
+the reference, so concurrent calls always see one consistent corpus.
+
+``with_delta()`` derives a new snapshot from an old one. Changed samples
+are replaced at their position, removed ones leave a tombstone and new
+ones are appended, so every other sample keeps its position and prepared
+index entries; only the delta is parsed and indexed (the top-level
+containers are shallow-copied). Once tombstones outnumber live samples,
+the snapshot is compacted with a full rebuild.
+
+A delta gives the same results as a full reload of the resulting file,
+except that added samples rank after existing ones on exact duplicates
+and fuzzy ties, and reordering samples in the file is not picked up.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+import os
+import threading
+
+from fuzzy_index import Entry, make_fuzzy_index
+from sample_store import MappedSampleStore
+from sample_table import SampleTable
+
+
+SampleKey = Tuple[Any, ...]
+
+# Never compact below this many tombstones
+MIN_COMPACT_DEAD = 64
+
+
+def exact_key(text: Any, lang: Any) -> Tuple[str, str]:
+    """Key used by the exact-match index: (LANG, stripped text)"""
+    return (str(lang or "").upper(), (text or "").strip())
+
+
+def sample_key(sample: Dict[str, Any]) -> SampleKey:
+    """Identity used to diff corpora: the sample id, else (LANG, stripped text)"""
+    if sample.get("id") is not None:
+        return ("id", sample["id"])
+    return ("text",) + exact_key(sample.get("text", ""), sample.get("lang", ""))
+
+
+def _iter_text_lang(samples: Sequence[Optional[Dict[str, Any]]]) -> Iterator[Tuple[Any, Any]]:
+    """(text, lang) per sample position, without building sample dicts"""
+    if isinstance(samples, (MappedSampleStore, SampleTable)):
+        return samples.iter_text_lang()
+    return ((s.get("text", ""), s.get("lang", "")) if s is not None else (None, None) for s in samples)
+
+
+class CorpusSnapshot:
+    """Samples plus their lookup indexes; treat as read-only once built"""
+
+    def __init__(
+        self, samples: Sequence[Optional[Dict[str, Any]]],
+        exact_index: Dict[Tuple[str, str], Tuple[int, ...]],
+        fuzzy_by_lang: Dict[str, Any], lang_counts: Dict[str, int],
+        fuzzy_kind: Any, verify: bool, dead: int = 0, fuzzy_all: Any = None,
+    ):
+        self.samples = samples
+        # (LANG, text) -> sample positions in order; the first one wins
+        self.exact_index = exact_index
+        # LANG -> fuzzy index; a language missing here is built on first use
+        self.fuzzy_by_lang = fuzzy_by_lang
+        self.lang_counts = lang_counts
+        self.fuzzy_kind = fuzzy_kind
+        self.verify = verify
+        self.dead = dead
+        # Built on first use; a racing duplicate build is harmless
+        self._fuzzy_all = fuzzy_all
+        self._keys: Optional[Dict[SampleKey, int]] = None
+        self._keys_unique = True
+
+    @classmethod
+    def build(cls, samples: Sequence[Dict[str, Any]], fuzzy_kind: Any = "charindex", verify: bool = False) -> "CorpusSnapshot":
+        """Index a complete sample sequence.
+
+        The first sample wins on duplicate exact keys, matching the order of
+        the former linear scan. Fuzzy indexes are left to fuzzy_index_for(),
+        so exact-only traffic never pays for them.
+        """
+        exact: Dict[Tuple[str, str], Tuple[int, ...]] = {}
+        counts: Dict[str, int] = {}
+        for i, (text, lang) in enumerate(_iter_text_lang(samples)):
+            key = exact_key(text, lang)
+            exact[key] = exact.get(key, ()) + (i,)
+            counts[key[0]] = counts.get(key[0], 0) + 1
+        return cls(samples, exact, {}, counts, fuzzy_kind, verify)
+
+    def __len__(self) -> int:
+        return len(self.samples) - self.dead
+
+    def live_samples(self) -> Sequence[Dict[str, Any]]:
+        """Samples without tombstones (the sequence itself if there are none)"""
+        if not self.dead:
+            return self.samples
+        return [s for s in self.samples if s is not None]
+
+    def sample(self, pos: int) -> Any:
+        """Sample at pos for field reads (.get); a row view for sample tables"""
+        if isinstance(self.samples, SampleTable):
+            return self.samples.row(pos)
+        return self.samples[pos]
+
+    def match_exact(self, text_norm: str, lang: str) -> Optional[int]:
+        positions = self.exact_index.get(exact_key(text_norm, lang))
+        return positions[0] if positions else None
+
+    def fuzzy_index_for(self, lang: str) -> Any:
+        """Same-language fuzzy index, or one over all samples as a fallback.
+
+        Both are built on first use, with entries in sample order.
+        """
+        lang_key = (lang or "").upper()
+        index = self.fuzzy_by_lang.get(lang_key)
+        if index is not None:
+            return index
+        if lang_key in self.lang_counts:
+            entries = []
+            for i, (text, sample_lang) in enumerate(_iter_text_lang(self.samples)):
+                if text is None:
+                    continue
+                key = exact_key(text, sample_lang)
+                if key[0] == lang_key and key[1]:
+                    entries.append((i, key[1]))
+            index = make_fuzzy_index(self.fuzzy_kind, entries, verify=self.verify)
+            self.fuzzy_by_lang[lang_key] = index
+            return index
+        if self._fuzzy_all is None:
+            entries = [
+                (i, (text or "").strip())
+                for i, (text, _) in enumerate(_iter_text_lang(self.samples))
+                if (text or "").strip()
+            ]
+            self._fuzzy_all = make_fuzzy_index(self.fuzzy_kind, entries, verify=self.verify)
+        return self._fuzzy_all
+
+    def key_positions(self) -> Optional[Dict[SampleKey, int]]:
+        """sample_key -> position of live samples, or None if keys repeat"""
+        if self._keys is None and self._keys_unique:
+            keys: Dict[SampleKey, int] = {}
+            for i, s in enumerate(self.samples):
+                if s is None:
+                    continue
+                key = sample_key(s)
+                if key in keys:
+                    self._keys_unique = False
+                    return None
+                keys[key] = i
+            self._keys = keys
+        return self._keys
+
+    def with_delta(
+        self, upserts: Sequence[Dict[str, Any]] = (), removed: Iterable[SampleKey] = (),
+    ) -> Tuple["CorpusSnapshot", Dict[str, Any]]:
+        """New snapshot with samples upserted (by sample_key) and removed.
+
+        Returns the snapshot and a summary: counts of added, changed and
+        removed samples, whether it was compacted, and ``langs``, the LANG
+        keys whose samples changed. Raises ValueError if the current
+        samples have duplicate keys.
+        """
+        old_keys = self.key_positions()
+        if old_keys is None:
+            raise ValueError("Sample keys (id, or lang + text) are not unique; use a full reload")
+
+        # Copy-on-write; other sample sequences are converted to a table
+        samples = self.samples.copy() if isinstance(self.samples, SampleTable) else SampleTable(self.samples)
+        keys = dict(old_keys)
+        exact = dict(self.exact_index)
+        counts = dict(self.lang_counts)
+        dead = self.dead
+        removed_by_lang: Dict[str, Set[int]] = {}
+        added_by_lang: Dict[str, List[Entry]] = {}
+        added_all: List[Entry] = []
+        touched: Set[str] = set()
+        info: Dict[str, Any] = {"added": 0, "changed": 0, "removed": 0, "compacted": False, "langs": touched}
+
+        def unindex_sample(pos: int, s: Any) -> None:
+            key = exact_key(s.get("text", ""), s.get("lang", ""))
+            rest = tuple(p for p in exact[key] if p != pos)
+            if rest:
+                exact[key] = rest
+            else:
+                del exact[key]
+            lang_key, text_key = key
+            counts[lang_key] -= 1
+            if not counts[lang_key]:
+                del counts[lang_key]
+            if text_key:
+                removed_by_lang.setdefault(lang_key, set()).add(pos)
+            touched.add(lang_key)
+
+        def index_sample(pos: int, s: Dict[str, Any]) -> None:
+            key = exact_key(s.get("text", ""), s.get("lang", ""))
+            exact[key] = tuple(sorted(exact.get(key, ()) + (pos,)))
+            lang_key, text_key = key
+            counts[lang_key] = counts.get(lang_key, 0) + 1
+            if text_key:
+                added_by_lang.setdefault(lang_key, []).append((pos, text_key))
+                added_all.append((pos, text_key))
+            touched.add(lang_key)
+
+        for key in removed:
+            pos = keys.pop(key, None)
+            if pos is not None:
+                unindex_sample(pos, samples.row(pos))
+                samples[pos] = None
+                dead += 1
+                info["removed"] += 1
+
+        # The last upsert of a key wins
+        for key, s in {sample_key(s): s for s in upserts}.items():
+            pos = keys.get(key)
+            if pos is not None:
+                unindex_sample(pos, samples.row(pos))
+                info["changed"] += 1
+            else:
+                pos = len(samples)
+                samples.append(None)
+                keys[key] = pos
+                info["added"] += 1
+            samples[pos] = s
+            index_sample(pos, s)
+
+        if dead > max(MIN_COMPACT_DEAD, len(samples) - dead):
+            live = SampleTable(s for s in samples if s is not None)
+            info["compacted"] = True
+            return CorpusSnapshot.build(live, self.fuzzy_kind, self.verify), info
+
+        # Indexes not built yet stay lazy; the copy is taken in one step
+        # because readers may be adding built ones concurrently
+        fuzzy = {lang: index for lang, index in dict(self.fuzzy_by_lang).items() if lang in counts}
+        for lang in touched:
+            index = fuzzy.get(lang)
+            if index is not None:
+                fuzzy[lang] = index.with_changes(removed_by_lang.get(lang, ()), added_by_lang.get(lang, []))
+
+        fuzzy_all = self._fuzzy_all
+        if fuzzy_all is not None:
+            all_removed = set().union(*removed_by_lang.values()) if removed_by_lang else set()
+            fuzzy_all = fuzzy_all.with_changes(all_removed, added_all)
+
+        snapshot = CorpusSnapshot(
+            samples, exact, fuzzy, counts, self.fuzzy_kind, self.verify, dead=dead, fuzzy_all=fuzzy_all,
+        )
+        snapshot._keys = keys
+        return snapshot, info
+
+
+class SampleWatcher:
+    """Poll a sample file and hot-reload the engine when it changes.
+
+    The file's (mtime, size) is checked every ``interval`` seconds on a
+    daemon thread; a change calls ``engine.reload(path)``. Errors (e.g. a
+    half-written file) are kept in ``last_error`` and the reload is retried
+    on the next poll.
+    """
+
+    def __init__(
+        self, engine: Any, path: Optional[str] = None, interval: float = 2.0,
+        on_reload: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.engine = engine
+        self.path = path or engine.samples_path
+        self.interval = interval
+        self.on_reload = on_reload
+        self.last_error: Optional[BaseException] = None
+        self._signature = self._stat()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def check(self) -> Optional[Dict[str, Any]]:
+        """Reload now if the file changed since the last check"""
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return None
+        try:
+            summary = self.engine.reload(self.path)
+        except Exception as e:
+            self.last_error = e
+            return None
+        self._signature = signature
+        self.last_error = None
+        if self.on_reload is not None:
+            self.on_reload(summary)
+        return summary
+
+    def start(self) -> "SampleWatcher":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="msrv-sample-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
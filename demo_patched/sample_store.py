@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""sample_store.py
+
+Compact binary sample store for MSRVPublicEngine (``.msrvbin``).
+
+Layout (all sections 8-byte aligned, native byte order recorded in header):
+
+    b"MSRVBIN1" | u32 header_len | header JSON | sections...
+
+- enum columns (lang, route, state4, shape): one uint8 code per sample,
+  code tables in the header, 255 = missing
+- float columns (zs, theta, need): float64, NaN = missing
+- string columns (text, id, notes, category, extra): uint32 offsets
+  (count + 1) into one contiguous UTF-8 buffer, plus a uint8 presence
+  flag per sample; ``extra`` holds any other keys as JSON, and so do
+  values whose type does not fit their column (an int id, an int zs,
+  an explicit None), so they read back unchanged
+
+Samples are normalized (route names converted, Fracture→MINI blocked) at
+build time, so the engine can use the store as-is. Files are opened with
+mmap: nothing is parsed up front, and worker processes share the pages.
+
+Build:
+    python sample_store.py build [--input public_samples.json] [--output public_samples.msrvbin]
+"""
+
+from __future__ import annotations
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+
+
+MAGIC = b"MSRVBIN1"
+MISSING = 255
+
+ENUM_COLUMNS = ("lang", "route", "state4", "shape")
+FLOAT_COLUMNS = ("zs", "theta", "need")
+STRING_COLUMNS = ("text", "id", "notes", "category")
+KNOWN_KEYS = frozenset(ENUM_COLUMNS + FLOAT_COLUMNS + STRING_COLUMNS)
+
+
+def is_sample_store(path: str) -> bool:
+    """True if path is a binary sample store"""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _fits(col: str, value: Any) -> bool:
+    """True if value can be stored in its typed column and read back unchanged"""
+    if col in FLOAT_COLUMNS:
+        return type(value) is float and value == value
+    return type(value) is str
+
+
+def _split_sample(s: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """(column values, extra): unknown keys and values of the wrong type
+    (an int id, an int zs, an explicit None) go to extra as JSON"""
+    columns: Dict[str, Any] = {}
+    extra: Dict[str, Any] = {}
+    for key, value in s.items():
+        if key in KNOWN_KEYS and _fits(key, value):
+            columns[key] = value
+        else:
+            extra[key] = value
+    return columns, extra
+
+
+def write_sample_store(samples: Sequence[Dict[str, Any]], path: str) -> None:
+    """Write normalized samples to a binary store (atomically via rename)"""
+    count = len(samples)
+    sections: List[Tuple[str, bytes]] = []
+    enums: Dict[str, List[str]] = {}
+    split = [_split_sample(s) for s in samples]
+
+    for col in ENUM_COLUMNS:
+        table: Dict[str, int] = {}
+        codes = array("B")
+        for s, _ in split:
+            value = s.get(col)
+            if value is None:
+                codes.append(MISSING)
+                continue
+            if value not in table:
+                if len(table) >= MISSING:
+                    raise ValueError(f"Too many distinct values for enum column {col}")
+                table[value] = len(table)
+            codes.append(table[value])
+        enums[col] = list(table)
+        sections.append((col, codes.tobytes()))
+
+    for col in FLOAT_COLUMNS:
+        values = array("d", (s.get(col, math.nan) for s, _ in split))
+        sections.append((col, values.tobytes()))
+
+    for col in STRING_COLUMNS + ("extra",):
+        offsets = array("I", [0])
+        present = array("B")
+        blob = bytearray()
+        for s, rest in split:
+            if col == "extra":
+                value = json.dumps(rest, ensure_ascii=False) if rest else None
+            else:
+                value = s.get(col)
+            present.append(0 if value is None else 1)
+            if value is not None:
+                blob += value.encode("utf-8")
+            offsets.append(len(blob))
+        sections.append((col + ".offsets", offsets.tobytes()))
+        sections.append((col + ".present", present.tobytes()))
+        sections.append((col + ".data", bytes(blob)))
+
+    # Lay out sections after the header; header size depends on offsets,
+    # so iterate until the (padded) header length is stable.
+    header_len = 0
+    while True:
+        pos = _align(len(MAGIC) + 4 + header_len)
+        layout = {}
+        for name, data in sections:
+            layout[name] = [pos, len(data)]
+            pos = _align(pos + len(data))
+        header = json.dumps({
+            "version": 1,
+            "count": count,
+            "byteorder": sys.byteorder,
+            "enums": enums,
+            "sections": layout,
+        }, ensure_ascii=False).encode("utf-8")
+        if len(header) <= header_len:
+            header = header.ljust(header_len)
+            break
+        header_len = _align(len(header))
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", header_len))
+        f.write(header)
+        for name, data in sections:
+            f.seek(layout[name][0])
+            f.write(data)
+    os.replace(tmp, path)
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+class MappedSampleStore(Sequence):
+    """Read-only, mmap-backed view of a binary sample store.
+
+    Indexing returns a fresh sample dict; ``text()``/``lang()`` and
+    ``iter_text_lang()`` read single columns without building dicts.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Not a sample store: {path}")
+        (header_len,) = struct.unpack_from("<I", self._mm, len(MAGIC))
+        start = len(MAGIC) + 4
+        header = json.loads(bytes(self._mm[start:start + header_len]).decode("utf-8"))
+        if header.get("version") != 1:
+            self.close()
+            raise ValueError(f"Unsupported sample store version: {header.get('version')}")
+
+        self._count = header["count"]
+        self._enums: Dict[str, List[str]] = header["enums"]
+        self._native = header["byteorder"] == sys.byteorder
+        self._sections = header["sections"]
+        self._view = memoryview(self._mm)
+
+        self._codes = {col: self._column(col, "B") for col in ENUM_COLUMNS}
+        self._floats = {col: self._column(col, "d") for col in FLOAT_COLUMNS}
+        self._strings = {
+            col: (self._column(col + ".offsets", "I"), self._column(col + ".present", "B"), self._raw(col + ".data"))
+            for col in STRING_COLUMNS + ("extra",)
+        }
+
+    def _raw(self, name: str) -> memoryview:
+        offset, length = self._sections[name]
+        return self._view[offset:offset + length]
+
+    def _column(self, name: str, typecode: str):
+        raw = self._raw(name)
+        if self._native or typecode == "B":
+            return raw.cast(typecode)
+        values = array(typecode, raw.tobytes())
+        values.byteswap()
+        return values
+
+    def close(self) -> None:
+        """Release the memory map (views handed out earlier become invalid)"""
+        for attr in ("_codes", "_floats", "_strings"):
+            self.__dict__.pop(attr, None)
+        view = self.__dict__.pop("_view", None)
+        if view is not None:
+            view.release()
+        self._mm.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _string(self, col: str, i: int) -> Optional[str]:
+        offsets, present, data = self._strings[col]
+        if not present[i]:
+            return None
+        return bytes(data[offsets[i]:offsets[i + 1]]).decode("utf-8")
+
+    def _enum(self, col: str, i: int) -> Optional[str]:
+        code = self._codes[col][i]
+        return None if code == MISSING else self._enums[col][code]
+
+    def _float(self, col: str, i: int) -> Optional[float]:
+        value = self._floats[col][i]
+        return None if value != value else value
+
+    def text(self, i: int) -> str:
+        return self._string("text", i) or ""
+
+    def lang(self, i: int) -> str:
+        return self._enum("lang", i) or ""
+
+    def iter_text_lang(self) -> Iterator[Tuple[str, str]]:
+        for i in range(self._count):
+            yield self.text(i), self.lang(i)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("sample index out of range")
+        sample: Dict[str, Any] = {}
+        for col in STRING_COLUMNS:
+            value = self._string(col, i)
+            if value is not None:
+                sample[col] = value
+        for col in ENUM_COLUMNS:
+            value = self._enum(col, i)
+            if value is not None:
+                sample[col] = value
+        for col in FLOAT_COLUMNS:
+            value = self._float(col, i)
+            if value is not None:
+                sample[col] = value
+        extra = self._string("extra", i)
+        if extra:
+            sample.update(json.loads(extra))
+        return sample
+
+
+def main():
+    # CLI only: the engine imports this module at startup
+    import argparse
+
+    ap = argparse.ArgumentParser(description="MSR-V binary sample store")
+    sub = ap.add_subparsers(dest="command", required=True)
+    b = sub.add_parser("build", help="Compile a JSON sample file into a .msrvbin store")
+    here = os.path.dirname(os.path.abspath(__file__))
+    b.add_argument("--input", default=os.path.join(here, "public_samples.json"))
+    b.add_argument("--output", default=None, help="Default: input path with .msrvbin extension")
+    args = ap.parse_args()
+
+    # Imported here: engine imports this module for loading
+    from engine import MSRVPublicEngine
+
+    output = args.output or os.path.splitext(args.input)[0] + ".msrvbin"
+    samples = MSRVPublicEngine(samples_path=args.input).samples
+    write_sample_store(samples, output)
+    print(f"Wrote {len(samples)} samples to {output} ({os.path.getsize(output)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""sample_table.py
+
+Compact in-memory sample table for MSRVPublicEngine.
+
+Same columns as the binary store (sample_store.py), held in memory:
+
+- enum columns (lang, route, state4, shape): one uint8 code per sample
+  into a per-column table of distinct strings, 255 = missing
+- float columns (zs, theta, need): array("d"), NaN = missing
+- string columns (text, id, notes, category): lists of str; repeated
+  notes/category values share one object
+- anything else, and values whose type does not fit their column (an
+  int id, an explicit None), in a per-sample ``extra`` dict
+
+Indexing returns a fresh dict equal to the sample that was stored, so the
+table can stand in for a list of dicts; ``row(i)`` and ``value(i, key)``
+read fields without building one. Rows can be replaced, appended or
+tombstoned (None) on a ``copy()``, for copy-on-write corpus deltas.
+
+Compare memory against the list-of-dicts representation:
+    python sample_table.py bench [--input public_samples.json] [--repeat 20]
+"""
+
+from __future__ import annotations
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import os
+import sys
+
+from sample_store import ENUM_COLUMNS, FLOAT_COLUMNS, MISSING, STRING_COLUMNS
+
+
+# String columns whose values repeat across samples
+SHARED_STRING_COLUMNS = ("notes", "category")
+
+_KIND = {
+    **{col: "enum" for col in ENUM_COLUMNS},
+    **{col: "float" for col in FLOAT_COLUMNS},
+    **{col: "str" for col in STRING_COLUMNS},
+}
+
+_NAN = float("nan")
+
+
+class SampleRow:
+    """Read-only view of one table row with the dict.get() interface"""
+
+    __slots__ = ("_table", "_i")
+
+    def __init__(self, table: "SampleTable", i: int):
+        self._table = table
+        self._i = i
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._table.value(self._i, key, default)
+
+
+class SampleTable(Sequence):
+    """Column-oriented samples; see the module docstring for the layout"""
+
+    def __init__(self, samples: Iterable[Optional[Dict[str, Any]]] = ()):
+        self._count = 0
+        self._codes = {col: array("B") for col in ENUM_COLUMNS}
+        self._enums: Dict[str, List[str]] = {col: [] for col in ENUM_COLUMNS}
+        self._enum_codes: Dict[str, Dict[str, int]] = {col: {} for col in ENUM_COLUMNS}
+        self._floats = {col: array("d") for col in FLOAT_COLUMNS}
+        self._strings: Dict[str, List[Optional[str]]] = {col: [] for col in STRING_COLUMNS}
+        self._shared: Dict[str, str] = {}
+        self._extra: List[Optional[Dict[str, Any]]] = []
+        # 0 = tombstone
+        self._live = array("B")
+        for s in samples:
+            self.append(s)
+
+    def copy(self) -> "SampleTable":
+        """Independent copy; columns are copied, not shared"""
+        new = SampleTable.__new__(SampleTable)
+        new._count = self._count
+        new._codes = {col: array("B", codes) for col, codes in self._codes.items()}
+        new._enums = {col: list(values) for col, values in self._enums.items()}
+        new._enum_codes = {col: dict(codes) for col, codes in self._enum_codes.items()}
+        new._floats = {col: array("d", values) for col, values in self._floats.items()}
+        new._strings = {col: list(values) for col, values in self._strings.items()}
+        new._shared = dict(self._shared)
+        new._extra = list(self._extra)
+        new._live = array("B", self._live)
+        return new
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, sample: Optional[Dict[str, Any]]) -> None:
+        codes, floats, strings, extra = self._encode(sample)
+        for col, column in self._codes.items():
+            column.append(codes.get(col, MISSING))
+        for col, column in self._floats.items():
+            column.append(floats.get(col, _NAN))
+        for col, column in self._strings.items():
+            column.append(strings.get(col))
+        self._extra.append(extra)
+        self._live.append(sample is not None)
+        self._count += 1
+
+    def __setitem__(self, i: int, sample: Optional[Dict[str, Any]]) -> None:
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("sample index out of range")
+        codes, floats, strings, extra = self._encode(sample)
+        for col, column in self._codes.items():
+            column[i] = codes.get(col, MISSING)
+        for col, column in self._floats.items():
+            column[i] = floats.get(col, _NAN)
+        for col, column in self._strings.items():
+            column[i] = strings.get(col)
+        self._extra[i] = extra
+        self._live[i] = sample is not None
+
+    def _encode(self, sample: Optional[Dict[str, Any]]):
+        """Split a sample into enum codes, floats, strings and extra (None if empty)"""
+        codes: Dict[str, int] = {}
+        floats: Dict[str, float] = {}
+        strings: Dict[str, str] = {}
+        extra: Dict[str, Any] = {}
+        for key, value in (sample or {}).items():
+            kind = _KIND.get(key)
+            if kind == "enum" and type(value) is str:
+                code = self._code(key, value)
+                if code is not None:
+                    codes[key] = code
+                    continue
+            elif kind == "float" and type(value) is float and value == value:
+                floats[key] = value
+                continue
+            elif kind == "str" and type(value) is str:
+                if key in SHARED_STRING_COLUMNS:
+                    value = self._shared.setdefault(value, value)
+                strings[key] = value
+                continue
+            extra[key] = value
+        return codes, floats, strings, extra or None
+
+    def _code(self, col: str, value: str) -> Optional[int]:
+        """Code of an enum value (added if new); None once the table is full"""
+        codes = self._enum_codes[col]
+        code = codes.get(value)
+        if code is None:
+            if len(codes) >= MISSING:
+                return None
+            code = codes[value] = len(codes)
+            self._enums[col].append(value)
+        return code
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._count
+
+    def value(self, i: int, key: str, default: Any = None) -> Any:
+        """sample.get(key, default) for row i, without building the dict"""
+        kind = _KIND.get(key)
+        if kind == "enum":
+            code = self._codes[key][i]
+            if code != MISSING:
+                return self._enums[key][code]
+        elif kind == "float":
+            value = self._floats[key][i]
+            if value == value:
+                return value
+        elif kind == "str":
+            value = self._strings[key][i]
+            if value is not None:
+                return value
+        extra = self._extra[i]
+        if extra is not None and key in extra:
+            return extra[key]
+        return default
+
+    def row(self, i: int) -> Optional[SampleRow]:
+        """Field view of row i (None for a tombstone)"""
+        return SampleRow(self, i) if self._live[i] else None
+
+    def iter_text_lang(self) -> Iterator[Tuple[Any, Any]]:
+        """(text, lang) per row, (None, None) for tombstones"""
+        value = self.value
+        for i in range(self._count):
+            if self._live[i]:
+                yield value(i, "text", ""), value(i, "lang", "")
+            else:
+                yield None, None
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("sample index out of range")
+        if not self._live[i]:
+            return None
+        sample: Dict[str, Any] = {}
+        for col, values in self._strings.items():
+            value = values[i]
+            if value is not None:
+                sample[col] = value
+        for col, codes in self._codes.items():
+            code = codes[i]
+            if code != MISSING:
+                sample[col] = self._enums[col][code]
+        for col, values in self._floats.items():
+            value = values[i]
+            if value == value:
+                sample[col] = value
+        extra = self._extra[i]
+        if extra:
+            sample.update(extra)
+        return sample
+
+
+def _replicated(raw: List[Dict[str, Any]], repeat: int) -> List[Dict[str, Any]]:
+    """raw samples repeated with unique ids and texts (a larger replay corpus)"""
+    out = []
+    for r in range(repeat):
+        for s in raw:
+            s = dict(s)
+            if r:
+                s["id"] = f"{s.get('id')}-r{r}"
+                s["text"] = f"{s.get('text', '')} #{r}"
+            out.append(s)
+    return out
+
+
+def main():
+    import argparse
+    import gc
+    import json
+    import time
+    import tracemalloc
+
+    ap = argparse.ArgumentParser(description="MSR-V in-memory sample table")
+    sub = ap.add_subparsers(dest="command", required=True)
+    b = sub.add_parser("bench", help="Memory of the sample table vs a list of dicts")
+    here = os.path.dirname(os.path.abspath(__file__))
+    b.add_argument("--input", default=os.path.join(here, "public_samples.json"))
+    b.add_argument("--repeat", type=int, default=20, help="Replicate the corpus N times (unique ids/texts)")
+    args = ap.parse_args()
+
+    from engine import MSRVPublicEngine
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    data = json.dumps(_replicated(raw, max(1, args.repeat)), ensure_ascii=False)
+    eng = MSRVPublicEngine(samples_path=args.input)
+
+    def measure(build):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        obj = build()
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return obj, current, peak, elapsed
+
+    def as_dicts():
+        # The former representation: the parsed dicts, normalized in place
+        return [eng._normalize_sample(s) for s in json.loads(data) if "text" in s]
+
+    dicts, dict_bytes, dict_peak, dict_s = measure(as_dicts)
+    table, table_bytes, table_peak, table_s = measure(lambda: eng._normalize_samples(json.loads(data)))
+
+    bad = sum(1 for i, s in enumerate(dicts) if table[i] != s)
+    n = len(table)
+    print(f"samples={n} input={len(data.encode('utf-8')):,} bytes (JSON)")
+    print(f"list[dict]   retained={dict_bytes:>12,} bytes ({dict_bytes / n:7.1f}/sample)")
+    print(f"SampleTable  retained={table_bytes:>12,} bytes ({table_bytes / n:7.1f}/sample) "
+          f"peak={table_peak:,} load={table_s * 1e3:.1f}ms")
+    print(f"ratio={table_bytes / dict_bytes:.2f} mismatches={bad}")
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""stage_profiler.py
+
+Per-stage latency histograms for MSRVPublicEngine.inspect().
+
+When an engine is created with ``profile=True`` every inspect() records
+the time spent in each stage (exact lookup, fuzzy match, fallback
+heuristic), the number of fuzzy candidates that were fully scored or
+pruned by upper bounds and the path that produced the trace. Values go
+into fixed power-of-two buckets, so recording is O(1) and exports from
+several processes can be merged. A StageProfiler may be shared by
+threads; its methods hold an internal lock.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional
+import json
+import threading
+
+
+STAGES = ("exact", "fuzzy", "heuristic", "cache", "total")
+PATHS = ("empty", "exact", "fuzzy", "heuristic", "cache")
+# Bucket i holds values v with int(v).bit_length() == i, i.e. v < 2**i
+# (microseconds for latencies, plain counts for candidates)
+NUM_BUCKETS = 32
+
+
+class Histogram:
+    """Power-of-two bucket histogram with count/sum/max"""
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets: List[int] = [0] * NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        i = int(value).bit_length()
+        self.buckets[i if i < NUM_BUCKETS else NUM_BUCKETS - 1] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, pct: float) -> float:
+        """Upper bucket bound below which pct% of the values fall"""
+        if not self.count:
+            return 0.0
+        rank = pct / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= rank:
+                return min(float(1 << i), self.max)
+        return self.max
+
+    def export(self, scale: float = 1.0) -> Dict[str, Any]:
+        """Plain dict; scale converts the recorded unit (e.g. us -> ms)"""
+        return {
+            "count": self.count,
+            "sum": round(self.total * scale, 6),
+            "max": round(self.max * scale, 6),
+            "p50": round(self.percentile(50) * scale, 6),
+            "p90": round(self.percentile(90) * scale, 6),
+            "p99": round(self.percentile(99) * scale, 6),
+            # [upper bound, count] for non-empty buckets
+            "buckets": [[(1 << i) * scale, n] for i, n in enumerate(self.buckets) if n],
+        }
+
+    def merge_export(self, data: Dict[str, Any], scale: float = 1.0) -> None:
+        """Add an exported histogram (same scale) into this one"""
+        for bound, n in data.get("buckets", ()):
+            i = int(round(bound / scale)).bit_length() - 1
+            self.buckets[min(max(i, 0), NUM_BUCKETS - 1)] += n
+        self.count += data.get("count", 0)
+        self.total += data.get("sum", 0.0) / scale
+        self.max = max(self.max, data.get("max", 0.0) / scale)
+
+
+class StageProfiler:
+    """Aggregates per-call stage timings into exportable histograms"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stages_us: Dict[str, Histogram] = {stage: Histogram() for stage in STAGES}
+            self.fuzzy_scored = Histogram()
+            self.fuzzy_pruned = Histogram()
+            self.paths: Dict[str, int] = {path: 0 for path in PATHS}
+
+    def record(
+        self, path: str, stages_s: Dict[str, float],
+        fuzzy_scored: Optional[int] = None, fuzzy_pruned: Optional[int] = None,
+    ) -> None:
+        """Record one call: stage durations in seconds, candidates scored/pruned"""
+        with self._lock:
+            self.paths[path] = self.paths.get(path, 0) + 1
+            for stage, seconds in stages_s.items():
+                self.stages_us[stage].add(seconds * 1e6)
+            if fuzzy_scored is not None:
+                self.fuzzy_scored.add(fuzzy_scored)
+            if fuzzy_pruned is not None:
+                self.fuzzy_pruned.add(fuzzy_pruned)
+
+    def export(self) -> Dict[str, Any]:
+        """JSON-serializable snapshot (latencies in milliseconds)"""
+        with self._lock:
+            return {
+                "calls": self.stages_us["total"].count,
+                "paths": dict(self.paths),
+                "stages_ms": {stage: h.export(scale=1e-3) for stage, h in self.stages_us.items() if h.count},
+                "fuzzy_candidates_scored": self.fuzzy_scored.export(),
+                "fuzzy_candidates_pruned": self.fuzzy_pruned.export(),
+            }
+
+    def merge(self, exported: Dict[str, Any]) -> None:
+        """Fold another profiler's export() in (e.g. from a worker process)"""
+        with self._lock:
+            for path, n in exported.get("paths", {}).items():
+                self.paths[path] = self.paths.get(path, 0) + n
+            for stage, data in exported.get("stages_ms", {}).items():
+                self.stages_us.setdefault(stage, Histogram()).merge_export(data, scale=1e-3)
+            self.fuzzy_scored.merge_export(exported.get("fuzzy_candidates_scored", {}))
+            self.fuzzy_pruned.merge_export(exported.get("fuzzy_candidates_pruned", {}))
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.export(), f, indent=2)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Cold-start benchmark for the MSR-V demo entry points.
+
+Each run is a fresh interpreter, as on a newly started worker. Per entry
+point it measures the module import, MSRVPublicEngine() construction and
+the first inspect() call, plus the whole process wall time, and lists
+which heavy optional modules (difflib, pandas, numpy, ...) each stage
+pulled in, so a deferred import that creeps back shows up. Medians over
+--repeat runs are reported; the package is byte-compiled first so the
+numbers don't include compiling the sources.
+
+Run:
+    python startup_benchmark.py --repeat 10
+    python startup_benchmark.py --entry engine --text "The speed of light is always infinite"
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional
+import argparse
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+ENTRY_POINTS = ("engine", "demo_cli", "http_service", "web_ui")
+
+# Modules only some code paths need; report where each one gets imported
+HEAVY_MODULES = (
+    "difflib", "dataclasses", "argparse", "asyncio", "concurrent.futures.process",
+    "numpy", "pandas", "pyarrow", "streamlit",
+)
+
+STAGES = ("import_ms", "construct_ms", "first_inspect_ms", "process_ms")
+
+# Runs in the fresh interpreter: argv = entry, text, lang, heavy modules
+_CHILD = r"""
+import importlib, json, sys, time
+entry, text, lang, heavy = sys.argv[1], sys.argv[2], sys.argv[3], sys.argv[4].split(",")
+
+def loaded():
+    return [m for m in heavy if m in sys.modules]
+
+out = {}
+t = time.perf_counter()
+importlib.import_module(entry)
+out["import_ms"] = (time.perf_counter() - t) * 1e3
+out["after_import"] = loaded()
+
+from engine import MSRVPublicEngine
+t = time.perf_counter()
+eng = MSRVPublicEngine()
+out["construct_ms"] = (time.perf_counter() - t) * 1e3
+out["after_construct"] = loaded()
+
+t = time.perf_counter()
+trace = eng.inspect(text, lang)
+out["first_inspect_ms"] = (time.perf_counter() - t) * 1e3
+out["after_inspect"] = loaded()
+out["matched_sample"] = trace["meta"]["notes"] != eng.FALLBACK_NOTES.format(mode=eng.mode)
+print(json.dumps(out))
+"""
+
+
+def run_once(entry: str, text: str, lang: str, cwd: str) -> Dict[str, Any]:
+    """One cold start of ``entry`` in a new interpreter"""
+    t = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", _CHILD, entry, text, lang, ",".join(HEAVY_MODULES)],
+        cwd=cwd, capture_output=True, text=True,
+    )
+    process_ms = (time.perf_counter() - t) * 1e3
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        return {"error": lines[-1] if lines else f"exit code {proc.returncode}"}
+    out = json.loads(proc.stdout.strip().splitlines()[-1])
+    out["process_ms"] = process_ms
+    return out
+
+
+def baseline_ms(cwd: str) -> float:
+    """Wall time of an interpreter that imports nothing"""
+    t = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], cwd=cwd, check=True)
+    return (time.perf_counter() - t) * 1e3
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Median/min per stage plus the heavy modules loaded at each stage"""
+    ok = [r for r in runs if "error" not in r]
+    if not ok:
+        return {"error": runs[0]["error"]}
+    report: Dict[str, Any] = {"runs": len(ok)}
+    for stage in STAGES:
+        values = [r[stage] for r in ok]
+        report[stage] = {"median": round(statistics.median(values), 2), "min": round(min(values), 2)}
+    last = ok[-1]
+    report["loaded"] = {
+        "import": last["after_import"],
+        "construct": [m for m in last["after_construct"] if m not in last["after_import"]],
+        "first_inspect": [m for m in last["after_inspect"] if m not in last["after_construct"]],
+    }
+    report["matched_sample"] = last["matched_sample"]
+    return report
+
+
+def run_benchmark(
+    entries: List[str], text: str, lang: str, repeat: int = 5, cwd: Optional[str] = None,
+) -> Dict[str, Any]:
+    cwd = cwd or os.path.dirname(os.path.abspath(__file__))
+    base = [baseline_ms(cwd) for _ in range(repeat)]
+    report: Dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "text": text,
+        "lang": lang,
+        "interpreter_ms": round(statistics.median(base), 2),
+        "entries": {},
+    }
+    for entry in entries:
+        report["entries"][entry] = summarize([run_once(entry, text, lang, cwd) for _ in range(repeat)])
+    return report
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Cold-start benchmark for the MSR-V demo entry points")
+    ap.add_argument("--entry", action="append", choices=ENTRY_POINTS, help="Entry point (repeatable; default: all)")
+    ap.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per entry point")
+    ap.add_argument("--text", default="The speed of light is always infinite", help="First inspect() input")
+    ap.add_argument("--lang", default="EN")
+    ap.add_argument("--no-compile", action="store_true", help="Don't byte-compile the package first")
+    ap.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = ap.parse_args()
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    if not args.no_compile:
+        compileall.compile_dir(here, maxlevels=0, quiet=1)
+
+    report = run_benchmark(args.entry or list(ENTRY_POINTS), args.text, args.lang, max(1, args.repeat), here)
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+
+    print(f"🚀 Cold start, median of {report['repeat']} runs (Python {report['python']}, "
+          f"bare interpreter {report['interpreter_ms']}ms)")
+    print(f"   {'entry':<14}{'import':>10}{'construct':>11}{'1st inspect':>13}{'process':>10}")
+    for entry, r in report["entries"].items():
+        if "error" in r:
+            print(f"   {entry:<14}skipped: {r['error']}")
+            continue
+        print(f"   {entry:<14}{r['import_ms']['median']:>8.1f}ms{r['construct_ms']['median']:>9.1f}ms"
+              f"{r['first_inspect_ms']['median']:>11.1f}ms{r['process_ms']['median']:>8.1f}ms")
+    print("   Heavy modules loaded per stage:")
+    for entry, r in report["entries"].items():
+        if "error" not in r:
+            stages = ", ".join(f"{stage}={'+'.join(mods) or '-'}" for stage, mods in r["loaded"].items())
+            print(f"   {entry:<14}{stages}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the demo_cli --stream sidecar: engine failures become per-line errors."""
+
+import io
+import json
+import sys
+
+import demo_cli
+from demo_cli import _stream_batch, run_stream
+from engine import MSRVPublicEngine
+
+
+class FailingEngine(MSRVPublicEngine):
+    """Raises while inspect_many() is being consumed, for one mode only"""
+
+    FAIL_MODE = "aggressive"
+
+    def _inspect_batch(self, batch, mode, verbosity):
+        if mode == self.FAIL_MODE:
+            raise RuntimeError("engine exploded")
+        return super()._inspect_batch(batch, mode, verbosity)
+
+
+def _line(**req):
+    return json.dumps(req)
+
+
+def test_stream_batch_engine_failure_gives_error_per_line():
+    lines = [
+        _line(id=1, text="hello", mode="aggressive"),
+        _line(id=2, text="hello", mode="balanced"),
+        _line(id=3, text="world", mode="aggressive"),
+    ]
+    results = _stream_batch(lines, "balanced", FailingEngine())
+
+    assert results[0] == {"id": 1, "error": "RuntimeError: engine exploded"}
+    assert results[2] == {"id": 3, "error": "RuntimeError: engine exploded"}
+    assert results[1]["id"] == 2
+    assert "error" not in results[1]
+
+
+def test_run_stream_keeps_going_after_engine_failure(monkeypatch, capsys):
+    lines = [
+        _line(id="a", text="first", mode="aggressive"),
+        _line(id="b", text="second", mode="balanced"),
+        _line(id="c", text="third", mode="aggressive"),
+        _line(id="d", text="fourth"),
+    ]
+    stdin = io.TextIOWrapper(io.BytesIO(("\n".join(lines) + "\n").encode("utf-8")), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    monkeypatch.setattr(demo_cli, "MSRVPublicEngine", FailingEngine)
+
+    # batch_size=1: each line is its own batch, so later batches must still run
+    run_stream("balanced", batch_size=1)
+
+    out = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["id"] for r in out] == ["a", "b", "c", "d"]
+    assert out[0]["error"] == out[2]["error"] == "RuntimeError: engine exploded"
+    assert "error" not in out[1] and "error" not in out[3]
@@ -5,10 +5,128 @@
 import json
 import glob
 import os
+import sys
 import streamlit as st
 from engine import MSRVPublicEngine
 
 st.set_page_config(page_title="MSR-V Public Demo v2.5.5", layout="wide")
+
+REPORT_DIR = os.path.join(os.path.dirname(__file__), "..", "report_patched")
+TOOLS_DIR = os.path.join(os.path.dirname(__file__), "..", "tools_patched")
+MODES = ["conservative", "balanced", "aggressive"]
+
+
+@st.cache_resource
+def get_engine() -> MSRVPublicEngine:
+    """One engine per server process, shared by all sessions (mode is per call)"""
+    return MSRVPublicEngine()
+
+
+@st.cache_data
+def load_report(path: str, mtime: float) -> str:
+    """Report markdown, re-read only when the file's mtime changes"""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def summary_totals(data: dict):
+    """(routes, route_pcts, cost_savings_pct, fracture_mini) of a mode summary, or None.
+
+    Accepts the bundled summaries (totals under "total") and those written by
+    msrv_benchmark_unified.generate_json_report (top-level "route_counts",
+    no Fracture count, so fracture_mini is None).
+    """
+    if isinstance(data.get("total"), dict):
+        total = data["total"]
+        routes, pcts = total.get("routes"), total.get("route_pcts")
+        savings, fracture_mini = total.get("cost_savings_pct"), total.get("fracture_mini", 0)
+    else:
+        routes, pcts = data.get("route_counts"), data.get("route_pcts")
+        savings, fracture_mini = data.get("cost_savings_pct"), data.get("fracture_mini")
+    if not isinstance(routes, dict) or not isinstance(pcts, dict) or savings is None:
+        return None
+    if any(tier not in routes or tier not in pcts for tier in ("MINI", "STANDARD", "PREMIUM")):
+        return None
+    return routes, pcts, savings, fracture_mini
+
+
+@st.cache_data
+def load_benchmark_table(summaries: tuple):
+    """Benchmark table from (mode, path, mtime) summary files, cached per mtime.
+
+    Files that are not a recognized summary are skipped.
+    """
+    import pandas as pd
+
+    icons = {"conservative": "🔒", "balanced": "⚖️", "aggressive": "🚀"}
+    rows = []
+    for mode, path, _mtime in summaries:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        totals = summary_totals(data) if isinstance(data, dict) else None
+        if totals is None:
+            continue
+        routes, pcts, savings, fracture_mini = totals
+        if fracture_mini is None:
+            fracture_cell = "n/a"
+        else:
+            fracture_cell = f"{fracture_mini} {'✅' if fracture_mini == 0 else '⚠️'}"
+        rows.append({
+            "Mode": f"{icons[mode]} {mode.upper()}",
+            "MINI": f"{routes['MINI']:,} ({pcts['MINI']:.1f}%)",
+            "STANDARD": f"{routes['STANDARD']:,} ({pcts['STANDARD']:.1f}%)",
+            "PREMIUM": f"{routes['PREMIUM']:,} ({pcts['PREMIUM']:.1f}%)",
+            "Cost Savings": f"{savings:.1f}%",
+            "Fracture→MINI": fracture_cell,
+        })
+    return pd.DataFrame(rows)
+
+
+@st.cache_data
+def load_route_mix(details: tuple):
+    """Route counts per mode and dataset, reading only those two detail columns"""
+    import pandas as pd
+    from details_columnar import read_details
+
+    frames = []
+    for mode, path, _mtime in details:
+        cols = read_details(path, ["dataset", "route"])
+        frames.append(pd.DataFrame({"mode": mode, **cols}))
+    df = pd.concat(frames, ignore_index=True)
+    return pd.crosstab([df["mode"], df["dataset"]], df["route"]).reset_index()
+
+
+def detail_files() -> tuple:
+    """(mode, path, mtime) of per-mode details (Parquet preferred), if all are present"""
+    if TOOLS_DIR not in sys.path:
+        sys.path.insert(0, TOOLS_DIR)
+    try:
+        from details_columnar import resolve_details
+    except ImportError:
+        return ()
+    found = []
+    for m in MODES:
+        path = resolve_details(os.path.join(REPORT_DIR, f"benchmark_{m}_details.jsonl"))
+        if not os.path.exists(path):
+            return ()
+        found.append((m, path, os.path.getmtime(path)))
+    return tuple(found)
+
+
+def summary_files() -> tuple:
+    """(mode, path, mtime) of the bundled per-mode summaries, if all are present"""
+    found = []
+    for m in MODES:
+        path = os.path.join(REPORT_DIR, f"benchmark_{m}_summary.json")
+        if not os.path.exists(path):
+            return ()
+        found.append((m, path, os.path.getmtime(path)))
+    return tuple(found)
+
+
 st.title("MSR-V White Engine - Public Demo v2.5.5")
 
 st.info(
@@ -33,11 +151,11 @@ mode_descriptions = {
 }
 st.sidebar.markdown(mode_descriptions[mode])
 
-eng = MSRVPublicEngine(mode=mode)
+eng = get_engine()
 
 # Mode info
 with st.sidebar.expander("📊 Mode Thresholds"):
-    info = eng.get_mode_info()
+    info = eng.get_mode_info(mode)
     st.json(info["thresholds"])
 
 # Governance rules
@@ -87,7 +205,7 @@ if run:
     if not text.strip():
         st.warning("Please enter input text first.")
     else:
-        out = eng.inspect(text, lang=lang)
+        out = eng.inspect(text, lang=lang, mode=mode)
         
         # Route indicator
         route = out["output"]["route"]
@@ -120,36 +238,40 @@ st.divider()
 # Benchmark summary - UPDATED WITH PATCHED RESULTS
 st.subheader("📊 Benchmark Results (4,200 Samples)")
 
-benchmark_data = {
-    "Mode": ["🔒 CONSERVATIVE", "⚖️ BALANCED", "🚀 AGGRESSIVE"],
-    "MINI": ["0 (0.0%)", "961 (22.9%)", "2,444 (58.2%)"],
-    "STANDARD": ["3,817 (90.9%)", "2,856 (68.0%)", "1,374 (32.7%)"],
-    "PREMIUM": ["383 (9.1%)", "383 (9.1%)", "382 (9.1%)"],
-    "Cost Savings": ["63.6%", "70.0%", "79.9%"],
-    "Fracture→MINI": ["0 ✅", "0 ✅", "0 ✅"],
-}
-
-import pandas as pd
-df = pd.DataFrame(benchmark_data)
+summaries = summary_files()
+df = load_benchmark_table(summaries) if summaries else None
+if df is None or df.empty:
+    # No readable summaries: fall back to the published numbers
+    df = {
+        "Mode": ["🔒 CONSERVATIVE", "⚖️ BALANCED", "🚀 AGGRESSIVE"],
+        "MINI": ["0 (0.0%)", "961 (22.9%)", "2,444 (58.2%)"],
+        "STANDARD": ["3,817 (90.9%)", "2,856 (68.0%)", "1,374 (32.7%)"],
+        "PREMIUM": ["383 (9.1%)", "383 (9.1%)", "382 (9.1%)"],
+        "Cost Savings": ["63.6%", "70.0%", "79.9%"],
+        "Fracture→MINI": ["0 ✅", "0 ✅", "0 ✅"],
+    }
 st.dataframe(df, use_container_width=True, hide_index=True)
 
 st.success("✅ **All 382 Fracture samples correctly routed to STANDARD/PREMIUM across all modes.**")
 
+details = detail_files()
+if details:
+    with st.expander("🔎 Route mix by dataset"):
+        st.dataframe(load_route_mix(details), use_container_width=True, hide_index=True)
+
 st.divider()
 st.subheader("📁 Bundled Reports")
 
 # Look for reports in report directory
-report_dir = os.path.join(os.path.dirname(__file__), "..", "report")
-if os.path.exists(report_dir):
-    reports = glob.glob(os.path.join(report_dir, "*.md"))
+if os.path.exists(REPORT_DIR):
+    reports = glob.glob(os.path.join(REPORT_DIR, "*.md"))
     reports = sorted(reports)
     
     if reports:
         choice = st.selectbox("Select Report", [os.path.basename(r) for r in reports], index=0)
         for r in reports:
             if os.path.basename(r) == choice:
-                with open(r, "r", encoding="utf-8") as f:
-                    st.markdown(f.read())
+                st.markdown(load_report(r, os.path.getmtime(r)))
                 break
     else:
         st.info("No report files found in report directory.")
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MSR-V 벤치마크 상세 결과 컬럼 저장소 (Parquet, 선택 사항: pyarrow 필요)
+- benchmark_<mode>_details.jsonl / gateway_<mode>_details.jsonl 과 같은 내용을
+  타입이 지정된 컬럼으로 저장 (white_trace 필드는 wt_<필드> 컬럼으로 평탄화)
+- 실행 중 row group 단위로 기록 → 스트리밍 벤치마크에서도 메모리 일정
+- 스키마에 없는 키 (예: 중첩된 route_reason)는 extra 컬럼에 JSON 으로 보존
+- 리더는 필요한 컬럼만 읽음 (Parquet), JSONL 이 주어지면 같은 형태로 변환해 반환
+
+변환:
+    python details_columnar.py convert ../report_patched/benchmark_balanced_details.jsonl
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from typing import Dict, List, Any, Iterable, Optional
+
+from msrv_benchmark_unified import iter_jsonl_samples
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # 컬럼 출력은 선택 기능
+    pa = None
+    pq = None
+
+# ============================================================================
+# 스키마
+# ============================================================================
+
+# 컬럼 이름 → 타입 ("str" / "cat" (반복 문자열, dictionary 인코딩) / "float" / "bool")
+DETAIL_FIELDS = {
+    "id": "str",
+    "text": "str",
+    "lang": "cat",
+    "dataset": "cat",
+    "route": "cat",
+    "latency_ms": "float",
+    "path": "cat",
+    "wt_Zs": "float",
+    "wt_state4": "cat",
+    "wt_shape": "cat",
+    "wt_theta": "float",
+    "wt_need": "float",
+    "wt_bypass_base": "float",
+    "wt_short_sig": "bool",
+    "wt_short_sig_cap_applied": "bool",
+    "wt_is_fracture": "bool",
+    "wt_high_stakes": "bool",
+    "wt_residual_ratio": "float",
+    "wt_rule": "str",
+    "extra": "str",
+}
+
+GATEWAY_FIELDS = {
+    "id": "str",
+    "dataset": "cat",
+    "path": "cat",
+    "route": "cat",
+    "latency_ms": "float",
+    "api_called": "bool",
+    "is_fracture": "bool",
+    "extra": "str",
+}
+
+WT_PREFIX = "wt_"
+DEFAULT_ROW_GROUP_SIZE = 4096
+
+
+def require_pyarrow():
+    if pa is None:
+        raise ImportError("컬럼 출력에는 pyarrow 가 필요합니다: pip install pyarrow")
+
+
+def _arrow_type(kind: str):
+    return {
+        "str": pa.string(),
+        "cat": pa.dictionary(pa.int32(), pa.string()),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+    }[kind]
+
+
+def arrow_schema(fields: Dict[str, str]):
+    require_pyarrow()
+    return pa.schema([(name, _arrow_type(kind)) for name, kind in fields.items()])
+
+
+def columnar_path(jsonl_path: str) -> str:
+    """상세 JSONL 경로 → 같은 위치의 .parquet 경로"""
+    return os.path.splitext(jsonl_path)[0] + ".parquet"
+
+
+# ============================================================================
+# 평탄화
+# ============================================================================
+
+def _coerce(kind: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if kind == "float":
+        return float(value)
+    if kind == "bool":
+        return bool(value)
+    return str(value)
+
+
+def flatten_detail(row: Dict[str, Any], fields: Dict[str, str] = DETAIL_FIELDS) -> Dict[str, Any]:
+    """상세 한 줄 → {컬럼: 값}; 스키마 밖의 키는 extra(JSON)로"""
+    flat: Dict[str, Any] = {}
+    extra: Dict[str, Any] = {}
+    for key, value in row.items():
+        if key == "white_trace" and isinstance(value, dict):
+            for wk, wv in value.items():
+                name = WT_PREFIX + wk
+                if name in fields and name != "extra":
+                    flat[name] = _coerce(fields[name], wv)
+                else:
+                    extra.setdefault("white_trace", {})[wk] = wv
+        elif key in fields and key != "extra":
+            flat[key] = _coerce(fields[key], value)
+        else:
+            extra[key] = value
+    if "extra" in fields:
+        flat["extra"] = json.dumps(extra, ensure_ascii=False, sort_keys=True) if extra else None
+    return flat
+
+
+def unflatten_detail(flat: Dict[str, Any]) -> Dict[str, Any]:
+    """flatten_detail 의 역변환 (None 컬럼은 생략)"""
+    row: Dict[str, Any] = {}
+    white_trace: Dict[str, Any] = {}
+    for name, value in flat.items():
+        if value is None or name == "extra":
+            continue
+        if name.startswith(WT_PREFIX):
+            white_trace[name[len(WT_PREFIX):]] = value
+        else:
+            row[name] = value
+    extra = json.loads(flat["extra"]) if flat.get("extra") else {}
+    white_trace.update(extra.pop("white_trace", {}))
+    row.update(extra)
+    if white_trace:
+        row["white_trace"] = white_trace
+    return row
+
+
+# ============================================================================
+# 쓰기 (row group 단위 스트리밍)
+# ============================================================================
+
+class ColumnarDetailsWriter:
+    """상세 결과를 row group 단위로 Parquet 에 기록"""
+
+    def __init__(self, path: str, fields: Dict[str, str] = DETAIL_FIELDS,
+                 row_group_size: int = DEFAULT_ROW_GROUP_SIZE):
+        require_pyarrow()
+        self.path = path
+        self.fields = fields
+        self.row_group_size = max(1, row_group_size)
+        self.schema = arrow_schema(fields)
+        self.rows_written = 0
+        self._buffer: Dict[str, List[Any]] = {name: [] for name in fields}
+        self._buffered = 0
+        # 쓰기 도중 중단되어도 이전 파일을 깨뜨리지 않도록 임시 파일에 쓰고 close()에서 교체
+        self._tmp_path = path + ".tmp"
+        self._writer = pq.ParquetWriter(self._tmp_path, self.schema, compression="zstd")
+
+    def write(self, row: Dict[str, Any]):
+        flat = flatten_detail(row, self.fields)
+        for name, column in self._buffer.items():
+            column.append(flat.get(name))
+        self._buffered += 1
+        if self._buffered >= self.row_group_size:
+            self.flush()
+
+    def write_many(self, rows: Iterable[Dict[str, Any]]):
+        for row in rows:
+            self.write(row)
+
+    def flush(self):
+        """버퍼를 row group 하나로 기록"""
+        if not self._buffered:
+            return
+        table = pa.Table.from_pydict(self._buffer, schema=self.schema)
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self.rows_written += self._buffered
+        self._buffer = {name: [] for name in self.fields}
+        self._buffered = 0
+
+    def close(self):
+        if self._writer is None:
+            return
+        self.flush()
+        self._writer.close()
+        self._writer = None
+        os.replace(self._tmp_path, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            os.remove(self._tmp_path)
+
+
+def convert_jsonl(jsonl_path: str, out_path: Optional[str] = None,
+                  fields: Optional[Dict[str, str]] = None,
+                  row_group_size: int = DEFAULT_ROW_GROUP_SIZE) -> str:
+    """기존 상세 JSONL → Parquet (gateway_* 파일은 GATEWAY_FIELDS 자동 선택)"""
+    out_path = out_path or columnar_path(jsonl_path)
+    if fields is None:
+        fields = GATEWAY_FIELDS if os.path.basename(jsonl_path).startswith("gateway_") else DETAIL_FIELDS
+    with ColumnarDetailsWriter(out_path, fields, row_group_size) as writer:
+        writer.write_many(iter_jsonl_samples(jsonl_path))
+    return out_path
+
+
+# ============================================================================
+# 읽기
+# ============================================================================
+
+def read_details(path: str, columns: Optional[List[str]] = None) -> Dict[str, List[Any]]:
+    """상세 결과를 {컬럼: 값 리스트} 로 읽기
+
+    .parquet 는 요청한 컬럼만 읽고 (없는 컬럼은 None 리스트), 그 외 경로는
+    JSONL 로 보고 한 줄씩 평탄화한다. columns=None 이면 파일의 모든 컬럼.
+    """
+    if path.endswith(".parquet"):
+        require_pyarrow()
+        available = pq.read_schema(path).names
+        wanted = available if columns is None else [c for c in columns if c in available]
+        table = pq.read_table(path, columns=wanted)
+        data = {name: table.column(name).to_pylist() for name in wanted}
+        for name in columns or ():
+            data.setdefault(name, [None] * table.num_rows)
+        return data
+
+    fields = DETAIL_FIELDS
+    if os.path.basename(path).startswith("gateway_"):
+        fields = GATEWAY_FIELDS
+    names = list(fields) if columns is None else list(columns)
+    data = {name: [] for name in names}
+    for row in iter_jsonl_samples(path):
+        flat = flatten_detail(row, fields)
+        for name in names:
+            data[name].append(flat.get(name))
+    return data
+
+
+def resolve_details(path: str) -> str:
+    """JSONL 경로에 대해 최신 .parquet 가 옆에 있으면 그 경로, 아니면 그대로"""
+    if path.endswith(".parquet") or pa is None:
+        return path
+    pq_path = columnar_path(path)
+    if os.path.exists(pq_path) and (
+        not os.path.exists(path) or os.path.getmtime(pq_path) >= os.path.getmtime(path)
+    ):
+        return pq_path
+    return path
+
+
+# ============================================================================
+# 메인 실행
+# ============================================================================
+
+def main():
+    ap = argparse.ArgumentParser(description="MSR-V 상세 결과 컬럼 저장소 (Parquet)")
+    sub = ap.add_subparsers(dest="command", required=True)
+    c = sub.add_parser("convert", help="상세 JSONL → Parquet 변환")
+    c.add_argument("paths", nargs="+", help="benchmark_*/gateway_* details JSONL")
+    c.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE)
+    args = ap.parse_args()
+
+    try:
+        require_pyarrow()
+    except ImportError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    for path in args.paths:
+        start = time.perf_counter()
+        out = convert_jsonl(path, row_group_size=args.row_group_size)
+        meta = pq.read_metadata(out)
+        print(f"✅ {out}: {meta.num_rows:,}행, row group {meta.num_row_groups}개, "
+              f"{os.path.getsize(path):,} → {os.path.getsize(out):,} bytes "
+              f"({(time.perf_counter() - start) * 1e3:.0f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MSR-V 벤치마크 지연 통계 (엔진/게이트웨이 벤치마크 공용)
+- 퍼센타일: mean / p50 / p90 / p99 / max (선형 보간, numpy 기본값과 동일)
+- 신뢰구간: 부트스트랩 (리샘플 수, 신뢰수준, 시드 고정 → 재실행해도 같은 값)
+  numpy 가 있으면 벡터화 (같은 환경에서는 재현되지만 난수열이 달라
+  numpy 유무에 따라 CI 경계는 리샘플 오차 범위 안에서 조금 다름)
+- 그룹: 전체 / 데이터셋별 (ko-norm, en-hard, ...) / 경로별 (exact/fuzzy/fallback)
+- 메모리 상한: 그룹마다 count/mean/max 는 정확히 누적, 퍼센타일과 CI 는 크기
+  DEFAULT_RESERVOIR 의 균등 표본 (reservoir sampling, 시드 고정)으로 계산
+  → 스트리밍 벤치마크에서도 모드당 메모리 O(그룹 수 × 표본 크기).
+  표본을 쓴 그룹은 요약에 "sampled": 표본 크기 로 표시
+- numpy 가 없고 (표본 크기 × 리샘플 수)가 크면 부트스트랩 생략 ("ci_skipped")
+- 요약 비교: 두 summary JSON 의 지연을 비교해 허용치를 넘는 회귀 표시
+
+비교:
+    python latency_stats.py compare old/benchmark_balanced_summary.json new/benchmark_balanced_summary.json --tolerance 10
+    python latency_stats.py compare old_dir/ new_dir/ --metrics p50,p99   # 같은 이름의 *_summary.json 끼리
+"""
+
+import os
+import sys
+import json
+import random
+import argparse
+from array import array
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # 부트스트랩 가속은 선택 기능
+    np = None
+
+# ============================================================================
+# 설정
+# ============================================================================
+
+PERCENTILES = {"p50": 50.0, "p90": 90.0, "p99": 99.0}
+CI_STATS = ("mean", "p50", "p90", "p99")   # max 는 부트스트랩 CI 가 의미 없어 제외
+DEFAULT_BOOTSTRAP = 1000
+DEFAULT_CI_LEVEL = 0.95
+DEFAULT_SEED = 0
+
+# 그룹별 퍼센타일/CI 계산용 표본 크기 (이 수까지는 모든 값을 그대로 사용)
+DEFAULT_RESERVOIR = 20_000
+
+# numpy 부트스트랩 한 번에 만드는 리샘플 원소 수 (메모리 상한)
+_BATCH_ELEMENTS = 2_000_000
+# numpy 없이 순수 파이썬 부트스트랩을 돌릴 최대 리샘플 원소 수 (넘으면 CI 생략)
+_PURE_BOOTSTRAP_ELEMENTS = 2_000_000
+
+
+# ============================================================================
+# 퍼센타일 / 부트스트랩
+# ============================================================================
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값의 q 퍼센타일 (선형 보간)"""
+    n = len(sorted_values)
+    if n == 0:
+        return 0.0
+    pos = (n - 1) * q / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, n - 1)
+    frac = pos - lo
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * frac
+
+
+def point_stats(sorted_values: List[float]) -> Dict[str, float]:
+    """mean + 퍼센타일 + max"""
+    n = len(sorted_values)
+    stats = {"mean": sum(sorted_values) / n if n else 0.0}
+    for name, q in PERCENTILES.items():
+        stats[name] = percentile(sorted_values, q)
+    stats["max"] = sorted_values[-1] if n else 0.0
+    return stats
+
+
+def bootstrap_ci(values: List[float], n_boot: int = DEFAULT_BOOTSTRAP, level: float = DEFAULT_CI_LEVEL,
+                 seed: int = DEFAULT_SEED) -> Dict[str, Tuple[float, float]]:
+    """CI_STATS 각각의 부트스트랩 퍼센타일 신뢰구간"""
+    n = len(values)
+    if n < 2 or n_boot <= 0:
+        return {}
+    if np is not None:
+        return _bootstrap_ci_numpy(values, n_boot, level, seed)
+    rng = random.Random(seed)
+    draws: Dict[str, List[float]] = {name: [] for name in CI_STATS}
+    for _ in range(n_boot):
+        resample = rng.choices(values, k=n)
+        resample.sort()
+        stats = point_stats(resample)
+        for name in CI_STATS:
+            draws[name].append(stats[name])
+    alpha = (1.0 - level) / 2 * 100
+    ci = {}
+    for name, dist in draws.items():
+        dist.sort()
+        ci[name] = (percentile(dist, alpha), percentile(dist, 100 - alpha))
+    return ci
+
+
+def _bootstrap_ci_numpy(values: List[float], n_boot: int, level: float, seed: int) -> Dict[str, Tuple[float, float]]:
+    """bootstrap_ci 의 numpy 버전 (리샘플을 배치로 계산)"""
+    arr = np.asarray(values, dtype=np.float64)
+    n = len(arr)
+    rng = np.random.default_rng(seed)
+    qs = list(PERCENTILES.values())
+    draws: Dict[str, List[Any]] = {name: [] for name in CI_STATS}
+    batch = max(1, _BATCH_ELEMENTS // n)
+    for start in range(0, n_boot, batch):
+        b = min(batch, n_boot - start)
+        resample = arr[rng.integers(0, n, size=(b, n))]
+        draws["mean"].append(resample.mean(axis=1))
+        pct = np.percentile(resample, qs, axis=1)
+        for name, row in zip(PERCENTILES, pct):
+            draws[name].append(row)
+    alpha = (1.0 - level) / 2 * 100
+    ci = {}
+    for name, parts in draws.items():
+        lo, hi = np.percentile(np.concatenate(parts), [alpha, 100 - alpha])
+        ci[name] = (float(lo), float(hi))
+    return ci
+
+
+def summarize(values: Iterable[float], n_boot: int = DEFAULT_BOOTSTRAP, level: float = DEFAULT_CI_LEVEL,
+              seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """지연 목록 → {count, mean, p50, p90, p99, max, ci: {stat: [lo, hi]}}
+
+    numpy 가 없고 len × n_boot 가 _PURE_BOOTSTRAP_ELEMENTS 를 넘으면
+    CI 대신 "ci_skipped" 에 사유를 기록.
+    """
+    values = sorted(values)
+    out: Dict[str, Any] = {"count": len(values)}
+    out.update({k: round(v, 4) for k, v in point_stats(values).items()})
+    if np is None and len(values) * n_boot > _PURE_BOOTSTRAP_ELEMENTS:
+        out["ci_skipped"] = f"numpy 없음: 표본 {len(values):,}개 × 리샘플 {n_boot:,}회는 순수 파이썬으로 너무 느림"
+        return out
+    ci = bootstrap_ci(values, n_boot, level, seed)
+    if ci:
+        out["ci"] = {k: [round(lo, 4), round(hi, 4)] for k, (lo, hi) in ci.items()}
+    return out
+
+
+# ============================================================================
+# 경로 분류 / 그룹별 수집
+# ============================================================================
+
+def trace_path(trace: Optional[Dict[str, Any]]) -> str:
+    """엔진 트레이스가 거친 경로: exact / fuzzy / fallback (판단 불가면 unknown)"""
+    if not isinstance(trace, dict):
+        return "unknown"
+    meta = trace.get("meta") or {}
+    output = trace.get("output") or {}
+    match = meta.get("match") or output.get("match") or trace.get("match")
+    notes = str(meta.get("notes") or trace.get("notes") or "")
+    if not match and "match=" in notes:
+        match = notes.split("match=", 1)[1].split("|", 1)[0].strip()
+    if match:
+        return "exact" if str(match).startswith("exact") else "fuzzy"
+    if "fallback" in notes.lower():
+        return "fallback"
+    return "unknown"
+
+
+class LatencyGroup:
+    """한 그룹의 지연: count/합/max 는 정확히, 값은 크기 capacity 의 균등 표본만 보관"""
+
+    def __init__(self, capacity: int = DEFAULT_RESERVOIR, seed: int = DEFAULT_SEED):
+        self.capacity = max(1, capacity)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.values = array("d")
+        self._rng = random.Random(seed)
+
+    def add(self, latency_ms: float):
+        self.count += 1
+        self.total += latency_ms
+        if self.count == 1 or latency_ms > self.max:
+            self.max = latency_ms
+        if len(self.values) < self.capacity:
+            self.values.append(latency_ms)
+        else:
+            # reservoir sampling (Algorithm R): 지금까지의 값 각각이 같은 확률로 표본에 남음
+            j = self._rng.randrange(self.count)
+            if j < self.capacity:
+                self.values[j] = latency_ms
+
+    def __len__(self):
+        return self.count
+
+    def summary(self, n_boot: int = DEFAULT_BOOTSTRAP, level: float = DEFAULT_CI_LEVEL,
+                seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+        """summarize() 결과에 정확한 count/mean/max 반영 (표본이면 "sampled" 표시)"""
+        out = summarize(self.values, n_boot, level, seed)
+        if self.count > len(self.values):
+            out["sampled"] = len(self.values)
+        out["count"] = self.count
+        out["mean"] = round(self.total / self.count, 4) if self.count else 0.0
+        out["max"] = round(self.max, 4)
+        return out
+
+
+class LatencyRecorder:
+    """지연을 전체/데이터셋별/경로별로 모아 요약 (그룹마다 LatencyGroup, 메모리 상한 있음)"""
+
+    def __init__(self, reservoir: int = DEFAULT_RESERVOIR, seed: int = DEFAULT_SEED):
+        self.reservoir = reservoir
+        self.seed = seed
+        self.overall = LatencyGroup(reservoir, seed)
+        self.by_dataset: Dict[str, LatencyGroup] = {}
+        self.by_path: Dict[str, LatencyGroup] = {}
+
+    def _group(self, groups: Dict[str, LatencyGroup], name: str) -> LatencyGroup:
+        group = groups.get(name)
+        if group is None:
+            group = groups[name] = LatencyGroup(self.reservoir, self.seed)
+        return group
+
+    def add(self, latency_ms: float, dataset: Optional[str] = None, path: Optional[str] = None):
+        self.overall.add(latency_ms)
+        if dataset:
+            self._group(self.by_dataset, dataset).add(latency_ms)
+        if path:
+            self._group(self.by_path, path).add(latency_ms)
+
+    def __len__(self):
+        return len(self.overall)
+
+    def report(self, n_boot: int = DEFAULT_BOOTSTRAP, level: float = DEFAULT_CI_LEVEL,
+               seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+        report = {
+            "ci_level": level,
+            "bootstrap": n_boot,
+            "reservoir": self.reservoir,
+            "overall": self.overall.summary(n_boot, level, seed),
+            "by_dataset": {k: g.summary(n_boot, level, seed) for k, g in sorted(self.by_dataset.items())},
+            "by_path": {k: g.summary(n_boot, level, seed) for k, g in sorted(self.by_path.items())},
+        }
+        for note in report_notes(report):
+            print(f"   ⚠️ {note}")
+        return report
+
+
+def report_notes(report: Dict[str, Any]) -> List[str]:
+    """리포트에 함께 적을 주의 사항: 표본 사용 / 부트스트랩 생략 그룹"""
+    groups = [report["overall"], *report["by_dataset"].values(), *report["by_path"].values()]
+    notes = []
+    sampled = sum(1 for g in groups if "sampled" in g)
+    if sampled:
+        notes.append(f"그룹 {sampled}개는 지연 {report.get('reservoir', DEFAULT_RESERVOIR):,}개 균등 표본으로 "
+                     f"퍼센타일/CI 계산 (count/mean/max 는 전체 값 기준)")
+    skipped = sum(1 for g in groups if "ci_skipped" in g)
+    if skipped:
+        notes.append(f"numpy 없음: 그룹 {skipped}개는 부트스트랩 신뢰구간 생략 (numpy 설치 권장)")
+    return notes
+
+
+def median_over_runs(runs: List[List[float]]) -> List[float]:
+    """반복 실행별 샘플 지연 목록 → 샘플별 중앙값"""
+    out = []
+    for per_sample in zip(*runs):
+        s = sorted(per_sample)
+        out.append(percentile(s, 50.0))
+    return out
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    """한 줄 요약: p50 0.81ms [0.79, 0.83] ..."""
+    parts = []
+    ci = stats.get("ci", {})
+    for name in ("p50", "p90", "p99", "max"):
+        part = f"{name} {stats[name]:.3f}ms"
+        if name in ci:
+            part += f" [{ci[name][0]:.3f}, {ci[name][1]:.3f}]"
+        parts.append(part)
+    return " · ".join(parts)
+
+
+# ============================================================================
+# 요약 비교 (회귀 검사)
+# ============================================================================
+
+def _groups(summary: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """summary JSON → {그룹 이름: 통계} (latency 블록이 없으면 avg_latency_ms 만)"""
+    latency = summary.get("latency")
+    if not latency:
+        if "avg_latency_ms" in summary:
+            return {"overall": {"mean": summary["avg_latency_ms"]}}
+        return {}
+    groups = {"overall": latency.get("overall", {})}
+    for kind in ("by_dataset", "by_path"):
+        for name, stats in latency.get(kind, {}).items():
+            groups[f"{kind[3:]}:{name}"] = stats
+    return groups
+
+
+def compare_summaries(old: Dict[str, Any], new: Dict[str, Any], tolerance_pct: float = 10.0,
+                      metrics: Iterable[str] = ("p50", "p90", "p99"),
+                      min_delta_ms: float = 0.0) -> List[Dict[str, Any]]:
+    """두 요약의 공통 그룹/지표 비교 → 행 목록 (regression: 허용치 초과 여부,
+    significant: 신뢰구간이 겹치지 않음)"""
+    rows = []
+    old_groups, new_groups = _groups(old), _groups(new)
+    metrics = list(metrics)
+    for group, new_stats in new_groups.items():
+        old_stats = old_groups.get(group)
+        if old_stats is None:
+            continue
+        # avg_latency_ms 만 있는 예전 요약은 mean 으로 비교
+        names = metrics if any(m in old_stats and m in new_stats for m in metrics) else ["mean"]
+        for metric in names:
+            if metric not in old_stats or metric not in new_stats:
+                continue
+            a, b = float(old_stats[metric]), float(new_stats[metric])
+            delta = b - a
+            change_pct = (delta / a * 100) if a > 0 else (0.0 if delta == 0 else float("inf"))
+            old_ci = old_stats.get("ci", {}).get(metric)
+            new_ci = new_stats.get("ci", {}).get(metric)
+            significant = None
+            if old_ci and new_ci:
+                significant = new_ci[0] > old_ci[1] or new_ci[1] < old_ci[0]
+            rows.append({
+                "group": group,
+                "metric": metric,
+                "old_ms": a,
+                "new_ms": b,
+                "change_pct": round(change_pct, 2),
+                "regression": change_pct > tolerance_pct and delta > min_delta_ms,
+                "significant": significant,
+            })
+    return rows
+
+
+def _summary_pairs(old_path: str, new_path: str) -> List[Tuple[str, str, str]]:
+    """(이름, old 파일, new 파일): 디렉토리면 같은 이름의 *_summary.json 끼리"""
+    if os.path.isdir(old_path) and os.path.isdir(new_path):
+        names = sorted(
+            n for n in os.listdir(new_path)
+            if n.endswith("_summary.json") and os.path.exists(os.path.join(old_path, n))
+        )
+        return [(n, os.path.join(old_path, n), os.path.join(new_path, n)) for n in names]
+    return [(os.path.basename(new_path), old_path, new_path)]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="MSR-V 벤치마크 지연 요약 비교")
+    sub = ap.add_subparsers(dest="command", required=True)
+    c = sub.add_parser("compare", help="두 summary JSON (또는 디렉토리) 의 지연 비교")
+    c.add_argument("old", help="기준 summary JSON 또는 디렉토리")
+    c.add_argument("new", help="비교할 summary JSON 또는 디렉토리")
+    c.add_argument("--tolerance", type=float, default=10.0, help="회귀 허용치 (%%, 기본 10)")
+    c.add_argument("--metrics", default="p50,p90,p99", help="비교 지표 (mean,p50,p90,p99,max)")
+    c.add_argument("--min-delta-ms", type=float, default=0.0, help="이보다 작은 절대 증가는 무시")
+    c.add_argument("--significant-only", action="store_true",
+                   help="신뢰구간이 겹치지 않는 회귀만 실패로 처리")
+    c.add_argument("--json", action="store_true", help="비교 결과를 JSON 으로 출력")
+    args = ap.parse_args()
+
+    pairs = _summary_pairs(args.old, args.new)
+    if not pairs:
+        print("❌ 비교할 summary JSON 이 없습니다", file=sys.stderr)
+        sys.exit(2)
+
+    metrics = [m.strip() for m in args.metrics.split(",") if m.strip()]
+    report = {}
+    failed = 0
+    for name, old_file, new_file in pairs:
+        with open(old_file, "r", encoding="utf-8") as f:
+            old = json.load(f)
+        with open(new_file, "r", encoding="utf-8") as f:
+            new = json.load(f)
+        rows = compare_summaries(old, new, args.tolerance, metrics, args.min_delta_ms)
+        for r in rows:
+            # --significant-only: CI 가 없으면 (significant=None) 판단 불가 → 실패로 처리
+            r["fail"] = r["regression"] and (not args.significant_only or r["significant"] is not False)
+        failed += sum(1 for r in rows if r["fail"])
+        report[name] = rows
+
+    if args.json:
+        print(json.dumps({"tolerance_pct": args.tolerance, "failed": failed, "files": report},
+                         indent=2, ensure_ascii=False))
+    else:
+        for name, rows in report.items():
+            print(f"\n📄 {name}")
+            print(f"   {'그룹':<22}{'지표':>6}{'기준':>11}{'현재':>11}{'변화':>10}  판정")
+            for r in rows:
+                mark = "❌ 회귀" if r["fail"] else ("⚠️ 회귀 (CI 겹침)" if r["regression"] else "✅")
+                if r["significant"] and not r["regression"] and r["change_pct"] < 0:
+                    mark = "✅ 개선"
+                print(f"   {r['group']:<22}{r['metric']:>6}{r['old_ms']:>9.3f}ms{r['new_ms']:>9.3f}ms"
+                      f"{r['change_pct']:>+9.1f}%  {mark}")
+        print(f"\n{'❌' if failed else '✅'} 허용치 {args.tolerance:.1f}% 초과 회귀: {failed}건")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,11 +11,17 @@ import sys
 import os
 import json
 import time
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Any, Optional
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Any, Optional
 from enum import Enum
 
+from latency_stats import LatencyRecorder, DEFAULT_BOOTSTRAP, format_stats, median_over_runs, report_notes, trace_path
+
 # 패치된 엔진 로드
 sys.path.insert(0, './msrv-public-demo')
 
@@ -86,18 +92,28 @@ def calculate_cost_savings(stats: Dict[str, int], total: int) -> float:
 # 데이터셋 로더
 # ============================================================================
 
-def load_jsonl_samples(path: str) -> List[Dict]:
-    """JSONL 파일 로드"""
-    samples = []
+def iter_jsonl_samples(path: str) -> Iterator[Dict]:
+    """JSONL 파일을 한 줄씩 읽는 제너레이터 (메모리 사용량 일정)"""
     try:
         with open(path, 'r', encoding='utf-8') as f:
             for line in f:
                 line = line.strip()
                 if line:
-                    samples.append(json.loads(line))
+                    yield json.loads(line)
     except Exception as e:
         print(f"Error loading {path}: {e}")
-    return samples
+
+def load_jsonl_samples(path: str) -> List[Dict]:
+    """JSONL 파일 로드"""
+    return list(iter_jsonl_samples(path))
+
+def iter_dataset_samples(datasets: List[tuple]) -> Iterator[Dict]:
+    """데이터셋 목록을 순서대로 스트리밍 (lang/dataset 필드 부여)"""
+    for ds_name, path, lang in datasets:
+        for sample in iter_jsonl_samples(path):
+            sample["lang"] = lang
+            sample["dataset"] = ds_name
+            yield sample
 
 # ============================================================================
 # 벤치마크 결과 데이터 구조
@@ -113,6 +129,7 @@ class SampleResult:
     route: str
     latency_ms: float
     white_trace: Dict[str, Any]
+    path: str = "unknown"     # exact / fuzzy / fallback
 
 @dataclass
 class ModeResult:
@@ -125,126 +142,428 @@ class ModeResult:
     avg_latency_ms: float
     total_time_sec: float
     samples: List[SampleResult]
+    latency: Optional[Dict[str, Any]] = None   # 퍼센타일/신뢰구간 (latency_stats)
+
+class ModeAggregator:
+    """모드별 요약 집계를 온라인으로 계산 (SampleResult를 보관하지 않음)
+
+    지연은 LatencyRecorder 가 그룹별 고정 크기 표본으로만 보관한다 (메모리 상한).
+    """
+    
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.total = 0
+        self.route_counts = {"MINI": 0, "STANDARD": 0, "PREMIUM": 0}
+        self.latency_sum = 0.0
+        self.latencies = LatencyRecorder()
+    
+    def add(self, route: str, latency_ms: float, dataset: Optional[str] = None, path: Optional[str] = None):
+        self.total += 1
+        self.route_counts[route] += 1
+        self.latency_sum += latency_ms
+        self.latencies.add(latency_ms, dataset, path)
+    
+    def to_mode_result(self, total_time: float, samples: Optional[List[SampleResult]] = None,
+                       bootstrap: int = DEFAULT_BOOTSTRAP, run_info: Optional[Dict[str, Any]] = None) -> ModeResult:
+        t = self.total
+        latency = self.latencies.report(bootstrap) if t else None
+        if latency is not None and run_info:
+            latency.update(run_info)
+        return ModeResult(
+            mode=self.mode,
+            total_samples=t,
+            route_counts=dict(self.route_counts),
+            route_pcts={k: (v/t*100 if t else 0.0) for k, v in self.route_counts.items()},
+            cost_savings_pct=calculate_cost_savings(self.route_counts, t),
+            avg_latency_ms=self.latency_sum / t if t else 0.0,
+            total_time_sec=total_time,
+            samples=samples if samples is not None else [],
+            latency=latency,
+        )
 
 # ============================================================================
 # 메인 벤치마크 함수
 # ============================================================================
 
-def run_benchmark(engine_path: str, datasets: List[tuple], modes: List[str]) -> Dict[str, ModeResult]:
-    """전체 벤치마크 실행"""
-    
-    # 엔진 코드 로드
+def load_engine_code(engine_path: str):
+    """엔진 코드를 모듈 globals에 로드"""
     with open(engine_path, "r") as f:
         code = f.read().split("if __name__ ==")[0]
         exec(code, globals())
+
+def create_engine(mode: str, warmup: List[Dict] = ()):
+    """엔진 생성 + 모드 설정 (+ warmup 샘플로 예열, 결과는 버림)"""
+    cfg = globals()["ThresholdConfig"]()
+    engine = globals()["MSRVEngineV25"](cfg)
+    engine.set_mode(mode)
+    warm_up(engine, warmup)
+    return engine
+
+def warm_up(engine, samples: List[Dict], modes: Optional[List[str]] = None):
+    """측정 전 예열: 첫 호출의 지연 (import/인덱스 생성 등)이 결과에 섞이지 않게 함"""
+    for sample in samples:
+        text, lang = sample.get("text", ""), sample.get("lang", "EN")
+        if modes:
+            engine.inspect_modes(text, lang=lang, modes=modes)
+        else:
+            engine.inspect(text, lang=lang)
+    # 결과 캐시가 있는 엔진이면 예열 결과가 측정에 캐시 적중으로 잡히지 않게 비움
+    if samples and hasattr(engine, "clear_cache"):
+        engine.clear_cache()
+
+def inspect_sample(engine, i: int, sample: Dict) -> SampleResult:
+    """샘플 1개 분석 → SampleResult"""
+    start = time.perf_counter()
+    result = engine.inspect(sample.get("text", ""), lang=sample.get("lang", "EN"))
+    elapsed = (time.perf_counter() - start) * 1000
+    return build_sample_result(i, sample, result, elapsed)
+
+def inspect_sample_modes(engine, i: int, sample: Dict, modes: List[str]) -> Dict[str, SampleResult]:
+    """샘플 1개를 한 번에 모든 모드로 분석 (single-pass)
+
+    엔진의 inspect_modes()가 매칭/구조 특징을 1회만 계산하므로,
+    측정된 지연은 모드 수로 나눠 각 모드에 분배(amortized)한다.
+    """
+    start = time.perf_counter()
+    traces = engine.inspect_modes(sample.get("text", ""), lang=sample.get("lang", "EN"), modes=modes)
+    elapsed = (time.perf_counter() - start) * 1000 / len(modes)
+    return {mode: build_sample_result(i, sample, traces[mode], elapsed) for mode in modes}
+
+def build_sample_result(i: int, sample: Dict, result: Dict, elapsed: float) -> SampleResult:
+    """엔진 트레이스 → SampleResult"""
+    text = sample.get("text", "")
+    lang = sample.get("lang", "EN")
+    ds_name = sample.get("dataset", "unknown")
+    
+    # 라우트 변환
+    old_route = result["output"]["route"]
+    new_route = map_route(old_route)
+    
+    # 화이트 트레이스 추출
+    output = result.get("output", {})
+    white_trace = {
+        "Zs": output.get("Zs"),
+        "state4": output.get("state4"),
+        "shape": output.get("shape"),
+        "theta": output.get("theta"),
+        "route_reason": output.get("route_reason", {}),
+    }
+    
+    # high_stakes, residual_ratio 추출
+    route_reason = output.get("route_reason", {})
+    if isinstance(route_reason, str):
+        try:
+            route_reason = json.loads(route_reason)
+        except:
+            route_reason = {}
+    
+    white_trace["high_stakes"] = route_reason.get("high_stakes", False)
+    white_trace["residual_ratio"] = route_reason.get("residual_ratio")
+    white_trace["need"] = route_reason.get("need")
+    white_trace["short_sig"] = route_reason.get("short_sig")
+    
+    return SampleResult(
+        id=f"{ds_name}_{i:04d}",
+        text=text[:100] + "..." if len(text) > 100 else text,
+        lang=lang,
+        dataset=ds_name,
+        route=new_route,
+        latency_ms=elapsed,
+        white_trace=white_trace,
+        path=trace_path(result),
+    )
+
+# ----------------------------------------------------------------------------
+# 병렬 실행 (프로세스 풀)
+# ----------------------------------------------------------------------------
+
+_WORKER_ENGINES: Dict[str, Any] = {}
+_WORKER_WARMUP: List[Dict] = []
+
+def _init_worker(engine_path: str, warmup: List[Dict] = ()):
+    """워커 초기화: 워커마다 엔진 코드 1회 로드 (warmup: 엔진 생성 시 예열 샘플)"""
+    load_engine_code(engine_path)
+    _WORKER_WARMUP[:] = warmup
+
+def _run_chunk(mode: str, start: int, chunk: List[Dict]) -> List[SampleResult]:
+    """워커에서 청크 실행 (모드별 엔진은 워커당 1회 생성)"""
+    engine = _WORKER_ENGINES.get(mode)
+    if engine is None:
+        engine = _WORKER_ENGINES[mode] = create_engine(mode, _WORKER_WARMUP)
+    return [inspect_sample(engine, start + j, sample) for j, sample in enumerate(chunk)]
+
+def _run_chunk_modes(modes: List[str], start: int, chunk: List[Dict]) -> List[Dict[str, SampleResult]]:
+    """워커에서 청크 실행 (single-pass: 엔진 1개로 모든 모드)"""
+    engine = _WORKER_ENGINES.get("single-pass")
+    if engine is None:
+        engine = _WORKER_ENGINES["single-pass"] = create_engine(modes[0])
+        warm_up(engine, _WORKER_WARMUP, modes)
+    return [inspect_sample_modes(engine, start + j, sample, modes) for j, sample in enumerate(chunk)]
+
+def _run_parallel(pool: ProcessPoolExecutor, workers: int, fn, key, all_samples: List[Dict]) -> List[Any]:
+    """샘플을 청크로 나눠 실행 후 입력 순서대로 병합"""
+    chunk_size = max(1, -(-len(all_samples) // (workers * 4)))
+    starts = list(range(0, len(all_samples), chunk_size))
+    futures = [pool.submit(fn, key, s, all_samples[s:s + chunk_size]) for s in starts]
+    merged: List[Any] = []
+    for fut in futures:  # 제출 순서 = 입력 순서
+        merged.extend(fut.result())
+    return merged
+
+def _run_single_pass(pool, workers: int, modes: List[str], all_samples: List[Dict],
+                     engine=None) -> Dict[str, List[SampleResult]]:
+    """모든 모드를 한 번의 코퍼스 순회로 실행 → 모드별 SampleResult 목록"""
+    if pool is not None:
+        rows = _run_parallel(pool, workers, _run_chunk_modes, modes, all_samples)
+    else:
+        rows = [inspect_sample_modes(engine, i, sample, modes) for i, sample in enumerate(all_samples)]
+    return {mode: [row[mode] for row in rows] for mode in modes}
+
+def _merge_repeats(runs: List[List[SampleResult]]) -> List[SampleResult]:
+    """반복 실행 결과 병합: 첫 실행의 결과에 샘플별 지연 중앙값을 기록"""
+    if len(runs) == 1:
+        return runs[0]
+    changed = sum(1 for rows in zip(*runs) if len({r.route for r in rows}) > 1)
+    if changed:
+        print(f"   ⚠️ 반복 실행 간 라우트가 다른 샘플: {changed}개 (첫 실행 기준으로 집계)")
+    medians = median_over_runs([[r.latency_ms for r in run] for run in runs])
+    merged = []
+    for r, latency in zip(runs[0], medians):
+        r.latency_ms = latency
+        merged.append(r)
+    return merged
+
+def run_benchmark(engine_path: str, datasets: List[tuple], modes: List[str], workers: int = 1,
+                  single_pass: bool = False, warmup: int = 0, repeat: int = 1,
+                  bootstrap: int = DEFAULT_BOOTSTRAP) -> Dict[str, ModeResult]:
+    """전체 벤치마크 실행
+
+    - workers > 1: 프로세스 풀 병렬 실행
+    - single_pass: 엔진의 inspect_modes()로 코퍼스를 1회만 순회
+      (모드별 결과는 동일, 지연/총 시간은 모드 수로 분배된 값)
+    - warmup: 엔진마다 측정 전에 처음 N개 샘플로 예열 (결과는 버림)
+    - repeat: 전체 순회를 N회 반복, 샘플별 지연은 중앙값, 총 시간은 실행별 중앙값
+    - bootstrap: 퍼센타일 신뢰구간 부트스트랩 리샘플 수 (0 = CI 생략)
+    """
+    
+    # 엔진 코드 로드
+    load_engine_code(engine_path)
+    # single-pass 지원 여부는 풀/직렬 선택 전에 한 번만 확인 (워커 안에서 AttributeError 로 터지지 않게)
+    if single_pass and not hasattr(globals()["MSRVEngineV25"], "inspect_modes"):
+        raise RuntimeError("--single-pass 는 inspect_modes()를 지원하는 엔진이 필요합니다")
     
     # 샘플 로드
-    all_samples = []
-    for ds_name, path, lang in datasets:
-        for sample in load_jsonl_samples(path):
-            sample["lang"] = lang
-            sample["dataset"] = ds_name
-            all_samples.append(sample)
+    all_samples = list(iter_dataset_samples(datasets))
+    warmup_samples = all_samples[:max(0, warmup)]
+    repeat = max(1, repeat)
     
     print(f"\n📁 로드된 샘플: {len(all_samples)}개")
+    if warmup_samples or repeat > 1:
+        print(f"🔥 예열 {len(warmup_samples)}개 샘플 (엔진마다), 반복 {repeat}회")
     
     results = {}
     
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(engine_path, warmup_samples))
+        print(f"⚙️ 병렬 실행: {workers} workers")
+    
+    single_pass_results = None
+    if single_pass:
+        print(f"⚡ single-pass: {len(modes)}개 모드를 1회 순회로 평가")
+        engine = None
+        if pool is None:
+            engine = create_engine(modes[0])
+            warm_up(engine, warmup_samples, modes)
+        runs, run_times = [], []
+        for _ in range(repeat):
+            start_total = time.perf_counter()
+            runs.append(_run_single_pass(pool, workers, modes, all_samples, engine))
+            run_times.append((time.perf_counter() - start_total) / len(modes))
+        single_pass_results = {mode: _merge_repeats([run[mode] for run in runs]) for mode in modes}
+    
     for mode in modes:
         print(f"\n{'='*80}")
         print(f"🔧 모드: {mode.upper()}")
         print("="*80)
         
-        # 엔진 생성 + 모드 설정
-        cfg = globals()["ThresholdConfig"]()
-        engine = globals()["MSRVEngineV25"](cfg)
-        engine.set_mode(mode)
-        
-        # 설정 출력
-        print(f"   T_BYPASS_BASE: {engine.cfg.T_BYPASS_BASE}")
-        print(f"   KO_BYPASS_BASE: {engine.cfg.KO_BYPASS_BASE}")
-        print(f"   EN_BYPASS_BASE: {engine.cfg.EN_BYPASS_BASE}")
-        print(f"   DISABLE_SHORT_SIG_CAP: {engine.cfg.DISABLE_SHORT_SIG_CAP}")
-        
-        stats = {"MINI": 0, "STANDARD": 0, "PREMIUM": 0}
-        latencies = []
-        sample_results = []
-        
-        start_total = time.perf_counter()
-        
-        for i, sample in enumerate(all_samples):
-            text = sample.get("text", "")
-            lang = sample.get("lang", "EN")
-            ds_name = sample.get("dataset", "unknown")
-            
-            start = time.perf_counter()
-            result = engine.inspect(text, lang=lang)
-            elapsed = (time.perf_counter() - start) * 1000
-            latencies.append(elapsed)
-            
-            # 라우트 변환
-            old_route = result["output"]["route"]
-            new_route = map_route(old_route)
-            stats[new_route] += 1
-            
-            # 화이트 트레이스 추출
-            output = result.get("output", {})
-            white_trace = {
-                "Zs": output.get("Zs"),
-                "state4": output.get("state4"),
-                "shape": output.get("shape"),
-                "theta": output.get("theta"),
-                "route_reason": output.get("route_reason", {}),
-            }
+        if single_pass_results is not None:
+            sample_results = single_pass_results[mode]
+        else:
+            # 엔진 생성 + 모드 설정 (+ 예열)
+            engine = create_engine(mode, warmup_samples)
             
-            # high_stakes, residual_ratio 추출
-            route_reason = output.get("route_reason", {})
-            if isinstance(route_reason, str):
-                try:
-                    route_reason = json.loads(route_reason)
-                except:
-                    route_reason = {}
+            # 설정 출력
+            print(f"   T_BYPASS_BASE: {engine.cfg.T_BYPASS_BASE}")
+            print(f"   KO_BYPASS_BASE: {engine.cfg.KO_BYPASS_BASE}")
+            print(f"   EN_BYPASS_BASE: {engine.cfg.EN_BYPASS_BASE}")
+            print(f"   DISABLE_SHORT_SIG_CAP: {engine.cfg.DISABLE_SHORT_SIG_CAP}")
             
-            white_trace["high_stakes"] = route_reason.get("high_stakes", False)
-            white_trace["residual_ratio"] = route_reason.get("residual_ratio")
-            white_trace["need"] = route_reason.get("need")
-            white_trace["short_sig"] = route_reason.get("short_sig")
-            
-            sample_results.append(SampleResult(
-                id=f"{ds_name}_{i:04d}",
-                text=text[:100] + "..." if len(text) > 100 else text,
-                lang=lang,
-                dataset=ds_name,
-                route=new_route,
-                latency_ms=elapsed,
-                white_trace=white_trace
-            ))
+            runs, run_times = [], []
+            for _ in range(repeat):
+                start_total = time.perf_counter()
+                
+                if pool is not None:
+                    runs.append(_run_parallel(pool, workers, _run_chunk, mode, all_samples))
+                else:
+                    runs.append([inspect_sample(engine, i, sample) for i, sample in enumerate(all_samples)])
+                
+                run_times.append(time.perf_counter() - start_total)
+            sample_results = _merge_repeats(runs)
+        total_time = sorted(run_times)[len(run_times) // 2]
         
-        total_time = (time.perf_counter() - start_total)
-        t = len(all_samples)
-        avg_latency = sum(latencies) / len(latencies)
-        cost_savings = calculate_cost_savings(stats, t)
+        # 집계는 항상 입력 순서의 SampleResult 기준 (직렬/병렬 동일)
+        agg = ModeAggregator(mode)
+        for r in sample_results:
+            agg.add(r.route, r.latency_ms, r.dataset, r.path)
+        run_info = {"warmup": len(warmup_samples), "repeat": repeat,
+                    "run_times_sec": [round(t, 3) for t in run_times]}
+        results[mode] = agg.to_mode_result(total_time, sample_results, bootstrap, run_info)
+        print_mode_result(results[mode])
+    
+    if pool is not None:
+        pool.shutdown()
+    
+    return results
+
+def print_mode_result(r: ModeResult):
+    """모드별 결과 출력"""
+    print(f"\n📊 결과:")
+    print(f"   MINI:     {r.route_counts['MINI']:>5} ({r.route_pcts['MINI']:>5.1f}%)")
+    print(f"   STANDARD: {r.route_counts['STANDARD']:>5} ({r.route_pcts['STANDARD']:>5.1f}%)")
+    print(f"   PREMIUM:  {r.route_counts['PREMIUM']:>5} ({r.route_pcts['PREMIUM']:>5.1f}%)")
+    print(f"   비용 절감: {r.cost_savings_pct:.1f}%")
+    print(f"   평균 지연: {r.avg_latency_ms:.2f}ms")
+    print(f"   총 시간: {r.total_time_sec:.1f}s")
+    print_latency_stats(r.latency)
+
+def print_latency_stats(latency: Optional[Dict[str, Any]]):
+    """퍼센타일 (신뢰구간) 출력: 전체 + 데이터셋별 + 경로별"""
+    if not latency:
+        return
+    print(f"   ⏱️  지연 분포 ({latency['ci_level'] * 100:.0f}% CI, 부트스트랩 {latency['bootstrap']}회):")
+    print(f"      {'전체':<12} n={latency['overall']['count']:<5} {format_stats(latency['overall'])}")
+    for kind in ("by_dataset", "by_path"):
+        for name, stats in latency[kind].items():
+            print(f"      {name:<12} n={stats['count']:<5} {format_stats(stats)}")
+
+# ----------------------------------------------------------------------------
+# 스트리밍 실행 (대용량 리플레이 세트)
+# ----------------------------------------------------------------------------
+
+def _iter_chunks(samples: Iterable[Dict], start: int, chunk_size: int) -> Iterator[tuple]:
+    """(시작 인덱스, 청크) 스트림"""
+    it = iter(samples)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+def _stream_results(pool, workers: int, mode: str, samples: Iterable[Dict], start: int,
+                    chunk_size: int = 256, warmup: List[Dict] = ()) -> Iterator[SampleResult]:
+    """SampleResult를 입력 순서대로 스트리밍 (병렬 시 진행 중 청크 수 제한)"""
+    if pool is None:
+        engine = create_engine(mode, warmup)
+        for i, sample in enumerate(samples, start):
+            yield inspect_sample(engine, i, sample)
+        return
+    
+    pending = deque()
+    for s, chunk in _iter_chunks(samples, start, chunk_size):
+        pending.append(pool.submit(_run_chunk, mode, s, chunk))
+        if len(pending) >= workers * 2:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+def _resume_details(path: str, agg: ModeAggregator) -> int:
+    """기존 상세 파일을 집계에 반영하고 완료된 줄 수를 반환.
+
+    마지막 줄이 불완전하면(중단된 쓰기) 해당 부분을 잘라낸다.
+    """
+    if not os.path.exists(path):
+        return 0
+    done = 0
+    good_end = 0
+    with open(path, 'rb') as f:
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            try:
+                line = json.loads(raw)
+            except ValueError:
+                break
+            agg.add(line["route"], line["latency_ms"], line.get("dataset"), line.get("path"))
+            done += 1
+            good_end += len(raw)
+    with open(path, 'ab') as f:
+        f.truncate(good_end)
+    return done
+
+def run_benchmark_streaming(engine_path: str, datasets: List[tuple], modes: List[str], output_dir: str,
+                            workers: int = 1, resume: bool = False, parquet: bool = False,
+                            warmup: int = 0, bootstrap: int = DEFAULT_BOOTSTRAP) -> Dict[str, ModeResult]:
+    """스트리밍 벤치마크: 읽기 → 분석 → 상세 JSONL 쓰기를 한 줄씩 처리.
+
+    SampleResult를 메모리에 쌓지 않고 요약은 온라인으로 계산한다
+    (반환되는 ModeResult.samples는 비어 있음). resume=True이면 기존
+    benchmark_<mode>_details.jsonl의 완료된 줄을 집계에 반영하고 이어서 쓴다.
+    parquet=True이면 같은 내용을 row group 단위로 .parquet 에도 기록한다
+    (Parquet 은 이어쓰기가 안 되므로 resume 시 완료된 줄로 새로 채운 뒤 이어 씀).
+    warmup: 엔진마다 처음 N개 샘플로 예열 (반복 실행은 지원하지 않음).
+    """
+    if parquet:
+        from details_columnar import ColumnarDetailsWriter, columnar_path
+
+    load_engine_code(engine_path)
+    warmup_samples = list(islice(iter_dataset_samples(datasets), max(0, warmup)))
+    
+    results = {}
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(engine_path, warmup_samples))
+        print(f"⚙️ 병렬 실행: {workers} workers")
+    
+    for mode in modes:
+        print(f"\n{'='*80}")
+        print(f"🔧 모드: {mode.upper()} (streaming)")
+        print("="*80)
         
-        route_pcts = {k: v/t*100 for k, v in stats.items()}
+        agg = ModeAggregator(mode)
+        path = os.path.join(output_dir, f"benchmark_{mode}_details.jsonl")
+        done = _resume_details(path, agg) if resume else 0
+        if done:
+            print(f"   ↻ 이어쓰기: {done}개 완료된 샘플 건너뜀")
         
-        results[mode] = ModeResult(
-            mode=mode,
-            total_samples=t,
-            route_counts=stats,
-            route_pcts=route_pcts,
-            cost_savings_pct=cost_savings,
-            avg_latency_ms=avg_latency,
-            total_time_sec=total_time,
-            samples=sample_results
-        )
+        columnar = None
+        if parquet:
+            columnar = ColumnarDetailsWriter(columnar_path(path))
+            if done:
+                columnar.write_many(iter_jsonl_samples(path))
         
-        print(f"\n📊 결과:")
-        print(f"   MINI:     {stats['MINI']:>5} ({route_pcts['MINI']:>5.1f}%)")
-        print(f"   STANDARD: {stats['STANDARD']:>5} ({route_pcts['STANDARD']:>5.1f}%)")
-        print(f"   PREMIUM:  {stats['PREMIUM']:>5} ({route_pcts['PREMIUM']:>5.1f}%)")
-        print(f"   비용 절감: {cost_savings:.1f}%")
-        print(f"   평균 지연: {avg_latency:.2f}ms")
-        print(f"   총 시간: {total_time:.1f}s")
+        start_total = time.perf_counter()
+        samples = islice(iter_dataset_samples(datasets), done, None)
+        with open(path, 'a' if resume else 'w', encoding='utf-8') as f:
+            for r in _stream_results(pool, workers, mode, samples, done, warmup=warmup_samples):
+                record = detail_record(r)
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                if columnar is not None:
+                    columnar.write(record)
+                agg.add(r.route, r.latency_ms, r.dataset, r.path)
+        if columnar is not None:
+            columnar.close()
+        total_time = time.perf_counter() - start_total
+        
+        results[mode] = agg.to_mode_result(total_time, bootstrap=bootstrap,
+                                           run_info={"warmup": len(warmup_samples), "repeat": 1})
+        print_mode_result(results[mode])
+    
+    if pool is not None:
+        pool.shutdown()
     
     return results
 
@@ -264,29 +583,80 @@ def generate_json_report(result: ModeResult, output_dir: str):
         "avg_latency_ms": result.avg_latency_ms,
         "total_time_sec": result.total_time_sec,
     }
+    if result.latency:
+        data["latency"] = result.latency
     
     path = os.path.join(output_dir, f"benchmark_{result.mode}_summary.json")
     with open(path, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
     return path
 
+def detail_record(sample: SampleResult) -> Dict[str, Any]:
+    """상세 결과 한 건 (JSONL 한 줄 / Parquet 한 행)"""
+    return {
+        "id": sample.id,
+        "text": sample.text,
+        "lang": sample.lang,
+        "dataset": sample.dataset,
+        "route": sample.route,
+        "latency_ms": sample.latency_ms,
+        "path": sample.path,
+        "white_trace": sample.white_trace,
+    }
+
+def format_detail_line(sample: SampleResult) -> str:
+    """상세 JSONL 한 줄"""
+    return json.dumps(detail_record(sample), ensure_ascii=False) + "\n"
+
 def generate_jsonl_report(result: ModeResult, output_dir: str):
     """JSONL 상세 리포트 생성"""
     path = os.path.join(output_dir, f"benchmark_{result.mode}_details.jsonl")
     with open(path, 'w', encoding='utf-8') as f:
         for sample in result.samples:
-            line = {
-                "id": sample.id,
-                "text": sample.text,
-                "lang": sample.lang,
-                "dataset": sample.dataset,
-                "route": sample.route,
-                "latency_ms": sample.latency_ms,
-                "white_trace": sample.white_trace,
-            }
-            f.write(json.dumps(line, ensure_ascii=False) + "\n")
+            f.write(format_detail_line(sample))
+    return path
+
+def generate_columnar_report(result: ModeResult, output_dir: str):
+    """Parquet 상세 리포트 생성 (white_trace 평탄화, pyarrow 필요)"""
+    from details_columnar import ColumnarDetailsWriter
+    
+    path = os.path.join(output_dir, f"benchmark_{result.mode}_details.parquet")
+    with ColumnarDetailsWriter(path) as writer:
+        for sample in result.samples:
+            writer.write(detail_record(sample))
     return path
 
+def latency_md_section(results: Dict[str, ModeResult]) -> str:
+    """지연 분포 표 (p50/p90/p99 는 [신뢰구간] 포함)"""
+    rows = [r for r in results.values() if r.latency]
+    if not rows:
+        return ""
+    first = rows[0].latency
+    content = f"""
+---
+
+## ⏱️ 지연 분포
+
+예열 {first.get('warmup', 0)}개 샘플, 반복 {first.get('repeat', 1)}회 (샘플별 중앙값), {first['ci_level'] * 100:.0f}% 부트스트랩 신뢰구간 ({first['bootstrap']}회)
+
+| 모드 | 그룹 | n | p50 (ms) | p90 (ms) | p99 (ms) | max (ms) |
+|------|------|---|----------|----------|----------|----------|
+"""
+    def cell(stats, name):
+        ci = stats.get("ci", {}).get(name)
+        return f"{stats[name]:.3f} [{ci[0]:.3f}, {ci[1]:.3f}]" if ci else f"{stats[name]:.3f}"
+    
+    for r in rows:
+        groups = [("전체", r.latency["overall"])]
+        groups += [(name, stats) for name, stats in r.latency["by_dataset"].items()]
+        groups += [(f"경로: {name}", stats) for name, stats in r.latency["by_path"].items()]
+        for name, stats in groups:
+            content += f"| {r.mode.upper()} | {name} | {stats['count']} | {cell(stats, 'p50')} | {cell(stats, 'p90')} | {cell(stats, 'p99')} | {stats['max']:.3f} |\n"
+    notes = [f"> ⚠️ {r.mode.upper()}: {note}\n" for r in rows for note in report_notes(r.latency)]
+    if notes:
+        content += "\n" + "".join(notes)
+    return content
+
 def generate_md_report(results: Dict[str, ModeResult], output_dir: str):
     """마크다운 리포트 생성"""
     
@@ -329,6 +699,8 @@ def generate_md_report(results: Dict[str, ModeResult], output_dir: str):
     for mode, r in results.items():
         content += f"| **{mode.upper()}** | {r.route_counts['MINI']} ({r.route_pcts['MINI']:.1f}%) | {r.route_counts['STANDARD']} ({r.route_pcts['STANDARD']:.1f}%) | {r.route_counts['PREMIUM']} ({r.route_pcts['PREMIUM']:.1f}%) | {r.cost_savings_pct:.1f}% | {r.avg_latency_ms:.2f}ms | {r.total_time_sec:.1f}s |\n"
     
+    content += latency_md_section(results)
+    
     content += """
 ---
 
@@ -421,6 +793,26 @@ print(result["output"]["route"])  # MINI/STANDARD/PREMIUM
 
 if __name__ == "__main__":
     
+    ap = argparse.ArgumentParser(description="MSR-V v2.5.5 Unified 벤치마크")
+    ap.add_argument("--workers", type=int, default=1, help="병렬 워커 프로세스 수 (기본: 1 = 직렬)")
+    ap.add_argument("--single-pass", action="store_true",
+                    help="inspect_modes()로 모든 모드를 1회 순회로 평가")
+    ap.add_argument("--stream", action="store_true",
+                    help="스트리밍 모드: 상세 JSONL을 한 줄씩 쓰고 요약은 온라인 집계")
+    ap.add_argument("--resume", action="store_true",
+                    help="--stream 과 함께: 기존 상세 파일에서 이어서 실행")
+    ap.add_argument("--parquet", action="store_true",
+                    help="상세 결과를 Parquet 컬럼 파일로도 저장 (pyarrow 필요)")
+    ap.add_argument("--warmup", type=int, default=0,
+                    help="측정 전 엔진마다 처음 N개 샘플로 예열 (기본: 0)")
+    ap.add_argument("--repeat", type=int, default=1,
+                    help="전체 순회 반복 횟수, 샘플별 지연은 중앙값 (--stream 과 함께 사용 불가)")
+    ap.add_argument("--bootstrap", type=int, default=DEFAULT_BOOTSTRAP,
+                    help=f"퍼센타일 신뢰구간 부트스트랩 리샘플 수 (기본: {DEFAULT_BOOTSTRAP}, 0 = CI 생략)")
+    args = ap.parse_args()
+    if args.stream and args.repeat > 1:
+        ap.error("--repeat 는 --stream 과 함께 쓸 수 없습니다")
+    
     # 설정
     ENGINE_PATH = "/home/claude/msrv_v255_unified_final.py"
     OUTPUT_DIR = "/home/claude/benchmark_results"
@@ -445,7 +837,13 @@ if __name__ == "__main__":
     print("=" * 100)
     
     # 벤치마크 실행
-    results = run_benchmark(ENGINE_PATH, DATASETS, MODES)
+    if args.stream:
+        results = run_benchmark_streaming(ENGINE_PATH, DATASETS, MODES, OUTPUT_DIR,
+                                          workers=args.workers, resume=args.resume, parquet=args.parquet,
+                                          warmup=args.warmup, bootstrap=args.bootstrap)
+    else:
+        results = run_benchmark(ENGINE_PATH, DATASETS, MODES, workers=args.workers, single_pass=args.single_pass,
+                                warmup=args.warmup, repeat=args.repeat, bootstrap=args.bootstrap)
     
     # 리포트 생성
     print("\n" + "=" * 100)
@@ -456,9 +854,19 @@ if __name__ == "__main__":
     
     for mode, result in results.items():
         json_path = generate_json_report(result, OUTPUT_DIR)
-        jsonl_path = generate_jsonl_report(result, OUTPUT_DIR)
+        if args.stream:
+            # 상세 JSONL은 실행 중 이미 기록됨
+            jsonl_path = os.path.join(OUTPUT_DIR, f"benchmark_{mode}_details.jsonl")
+        else:
+            jsonl_path = generate_jsonl_report(result, OUTPUT_DIR)
         generated_files.extend([json_path, jsonl_path])
-        print(f"  ✅ {mode}: JSON + JSONL 생성")
+        if args.parquet:
+            if args.stream:
+                # Parquet 도 실행 중 row group 단위로 이미 기록됨
+                generated_files.append(os.path.join(OUTPUT_DIR, f"benchmark_{mode}_details.parquet"))
+            else:
+                generated_files.append(generate_columnar_report(result, OUTPUT_DIR))
+        print(f"  ✅ {mode}: JSON + JSONL{' + Parquet' if args.parquet else ''} 생성")
     
     md_path = generate_md_report(results, OUTPUT_DIR)
     generated_files.append(md_path)
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MSR-V 임계값 스윕 / What-if 시뮬레이터
+- 벤치마크 상세 JSONL의 white_trace (need, is_fracture, high_stakes, short_sig)를 컬럼 배열로 로드
+- (mini_base, standard_base) 그리드 전체를 NumPy 벡터 연산으로 한 번에 평가
+- 그리드 포인트마다 라우트 분포, 비용 절감률, Fracture→MINI 위반 수 리포트
+
+라우팅 규칙 (공개 엔진 _route_features 와 동일):
+- high_stakes (비 Fracture): need = max(need, mini_base + 0.01) → MINI 차단
+- short_sig (비 Fracture, 비 high_stakes): need 를 mini_base 로 캡
+- need <= mini_base → MINI, need <= standard_base → STANDARD, 그 외 PREMIUM
+- conservative: MINI 비활성화 (캡 없음)
+Fracture 행은 기록된 need (0.65 하한 적용 후)로 그대로 라우팅되므로,
+mini_base 를 너무 높이면 Fracture→MINI 위반으로 드러남.
+
+기록된 특성은 기준 모드(--mode)의 트레이스 값을 그대로 사용함 (원본 엔진의
+short_sig / 언어별 bypass_base 는 모드마다 다를 수 있음). 기준 모드 자체를
+기록된 행별 bypass_base 로 재현한 일치율을 함께 출력해 근사 정도를 보여줌.
+
+사용법:
+    python threshold_sweep.py --mode balanced --mini 0.05:0.50:0.01 --standard 0.40:0.70:0.01
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from dataclasses import dataclass
+from typing import Dict, List, Any
+
+import numpy as np
+
+from msrv_benchmark_unified import calculate_cost_savings, map_route
+from details_columnar import read_details, resolve_details
+
+ROUTES = ["MINI", "STANDARD", "PREMIUM"]
+ROUTE_CODES = {r: i for i, r in enumerate(ROUTES)}
+
+MODES = ["conservative", "balanced", "aggressive"]
+
+# 한 번에 평가할 (그리드 포인트 × 샘플) 원소 수 상한 (메모리 제한)
+CHUNK_ELEMENTS = 4_000_000
+
+REPORT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "report_patched")
+ENGINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "demo_patched")
+
+
+def load_engine_thresholds(engine_dir: str = ENGINE_DIR) -> Dict[str, Dict[str, float]]:
+    """공개 엔진의 MODE_THRESHOLDS (현재 설정 표시 및 재현 기준; 사본을 두지 않음)"""
+    sys.path.insert(0, os.path.abspath(engine_dir))
+    from engine import MSRVPublicEngine
+    return MSRVPublicEngine.MODE_THRESHOLDS
+
+
+# ============================================================================
+# 트레이스 컬럼 로드
+# ============================================================================
+
+@dataclass
+class TraceColumns:
+    """white_trace 컬럼 배열 (샘플 1개 = 행 1개)"""
+    need: np.ndarray
+    is_fracture: np.ndarray
+    high_stakes: np.ndarray
+    short_sig: np.ndarray
+    bypass_base: np.ndarray
+    route: np.ndarray  # 기록된 라우트 코드 (ROUTES 인덱스)
+
+    def __len__(self) -> int:
+        return len(self.need)
+
+
+def load_trace_columns(path: str) -> TraceColumns:
+    """상세 결과 (JSONL 또는 Parquet)에서 필요한 컬럼만 읽어 배열 생성"""
+    data = read_details(path, ["wt_need", "wt_is_fracture", "wt_high_stakes", "wt_short_sig",
+                               "wt_bypass_base", "route"])
+    return TraceColumns(
+        need=np.array([v or 0.0 for v in data["wt_need"]], dtype=np.float64),
+        is_fracture=np.array([bool(v) for v in data["wt_is_fracture"]], dtype=bool),
+        high_stakes=np.array([bool(v) for v in data["wt_high_stakes"]], dtype=bool),
+        short_sig=np.array([bool(v) for v in data["wt_short_sig"]], dtype=bool),
+        bypass_base=np.array([v or 0.0 for v in data["wt_bypass_base"]], dtype=np.float64),
+        route=np.array([ROUTE_CODES[map_route(r or "PREMIUM")] for r in data["route"]], dtype=np.uint8),
+    )
+
+
+# ============================================================================
+# 벡터화 라우팅
+# ============================================================================
+
+def _as_column(x) -> np.ndarray:
+    """1차원 임계값 → (G, 1) 열 벡터 (2차원은 그대로)"""
+    x = np.asarray(x, dtype=np.float64)
+    return x.reshape(-1, 1) if x.ndim < 2 else x
+
+
+def simulate_routes(cols: TraceColumns, mini, standard, mini_enabled: bool = True) -> np.ndarray:
+    """(G,) 임계값 쌍 → (G, N) 라우트 코드 배열
+
+    행별 임계값(재현용)은 (1, N) 모양으로 넘기면 됨.
+    """
+    need = cols.need[None, :]
+    mini = _as_column(mini)
+    standard = _as_column(standard)
+
+    if not mini_enabled:
+        return np.where(need <= standard, 1, 2).astype(np.uint8)
+
+    hs = (cols.high_stakes & ~cols.is_fracture)[None, :]
+    cap = (cols.short_sig & ~cols.high_stakes & ~cols.is_fracture)[None, :]
+    adj = np.where(hs, np.maximum(need, mini + 0.01), need)
+    adj = np.where(cap & (adj > mini), mini, adj)
+    return np.where(adj <= mini, 0, np.where(adj <= standard, 1, 2)).astype(np.uint8)
+
+
+def sweep(cols: TraceColumns, minis: np.ndarray, standards: np.ndarray,
+          mini_enabled: bool = True) -> Dict[str, np.ndarray]:
+    """그리드 포인트별 라우트 카운트와 Fracture→MINI 위반 수 (청크 단위 벡터 연산)"""
+    g = len(minis)
+    counts = np.zeros((g, len(ROUTES)), dtype=np.int64)
+    fracture_mini = np.zeros(g, dtype=np.int64)
+    step = max(1, CHUNK_ELEMENTS // max(1, len(cols)))
+    for start in range(0, g, step):
+        sl = slice(start, start + step)
+        routes = simulate_routes(cols, minis[sl], standards[sl], mini_enabled)
+        for code in range(len(ROUTES)):
+            counts[sl, code] = (routes == code).sum(axis=1)
+        fracture_mini[sl] = ((routes == 0) & cols.is_fracture[None, :]).sum(axis=1)
+    return {"counts": counts, "fracture_mini": fracture_mini}
+
+
+def replay_agreement(cols: TraceColumns, standard_base: float, mini_enabled: bool) -> int:
+    """기록된 행별 bypass_base 로 기준 모드를 재현했을 때 일치하는 라우트 수"""
+    routes = simulate_routes(cols, cols.bypass_base[None, :], [standard_base], mini_enabled)
+    return int((routes[0] == cols.route).sum())
+
+
+# ============================================================================
+# 그리드 / 리포트
+# ============================================================================
+
+def parse_grid(spec: str) -> np.ndarray:
+    """'start:stop:step' (stop 포함) 또는 '0.2,0.25,0.3'"""
+    if ":" in spec:
+        start, stop, step = (float(x) for x in spec.split(":"))
+        if step <= 0:
+            raise ValueError(f"step must be > 0: {spec}")
+        n = int(round((stop - start) / step)) + 1
+        return np.round(start + step * np.arange(n), 6)
+    return np.array([float(x) for x in spec.split(",") if x.strip()], dtype=np.float64)
+
+
+def grid_rows(minis: np.ndarray, standards: np.ndarray, result: Dict[str, np.ndarray], total: int) -> List[Dict[str, Any]]:
+    """그리드 포인트별 리포트 행 (calculate_cost_savings 사용)"""
+    rows = []
+    for i in range(len(minis)):
+        stats = {r: int(result["counts"][i, c]) for c, r in enumerate(ROUTES)}
+        rows.append({
+            "mini_base": float(minis[i]),
+            "standard_base": float(standards[i]),
+            "routes": stats,
+            "route_pcts": {r: (n / total * 100 if total else 0.0) for r, n in stats.items()},
+            "cost_savings_pct": calculate_cost_savings(stats, total),
+            "fracture_mini": int(result["fracture_mini"][i]),
+        })
+    return rows
+
+
+def print_rows(title: str, rows: List[Dict[str, Any]]):
+    print(f"\n{title}")
+    print(f"{'mini':>6} {'std':>6} | {'MINI':>12} {'STANDARD':>12} {'PREMIUM':>12} | {'절감률':>7} | Fracture→MINI")
+    print("-" * 86)
+    for r in rows:
+        routes, pcts = r["routes"], r["route_pcts"]
+        cells = " ".join(f"{routes[k]:>5,} ({pcts[k]:4.1f}%)" for k in ROUTES)
+        flag = "✅ 0" if r["fracture_mini"] == 0 else f"⚠️ {r['fracture_mini']}"
+        print(f"{r['mini_base']:>6.3f} {r['standard_base']:>6.3f} | {cells} | {r['cost_savings_pct']:6.1f}% | {flag}")
+
+
+# ============================================================================
+# 메인 실행
+# ============================================================================
+
+def main():
+    ap = argparse.ArgumentParser(description="MSR-V 임계값 스윕 / What-if 시뮬레이터")
+    ap.add_argument("--mode", default="balanced", choices=MODES,
+                    help="기준 모드 (트레이스 파일 및 conservative 규칙 선택)")
+    ap.add_argument("--details", default=None,
+                    help="상세 JSONL/Parquet 경로 (기본: report_patched/benchmark_<mode>_details.jsonl, "
+                         "옆에 최신 .parquet 가 있으면 그것을 사용)")
+    ap.add_argument("--mini", default="0.00:0.60:0.01", help="mini_base 그리드 (start:stop:step 또는 목록)")
+    ap.add_argument("--standard", default="0.40:0.80:0.01", help="standard_base 그리드")
+    ap.add_argument("--top", type=int, default=10, help="안전한 포인트 중 절감률 상위 N개 출력")
+    ap.add_argument("--json", default=None, help="전체 그리드 결과를 JSON 으로 저장")
+    ap.add_argument("--engine-dir", default=ENGINE_DIR, help="MODE_THRESHOLDS 를 읽을 공개 엔진 디렉터리")
+    args = ap.parse_args()
+
+    path = resolve_details(args.details or os.path.join(REPORT_DIR, f"benchmark_{args.mode}_details.jsonl"))
+    mini_enabled = args.mode != "conservative"
+    current = load_engine_thresholds(args.engine_dir)[args.mode]
+
+    print("=" * 86)
+    print("🎛️  MSR-V 임계값 스윕 (What-if)")
+    print("=" * 86)
+
+    t0 = time.perf_counter()
+    cols = load_trace_columns(path)
+    t_load = time.perf_counter() - t0
+    total = len(cols)
+    if not total:
+        print(f"❌ 트레이스 없음: {path}")
+        sys.exit(1)
+
+    m_axis = parse_grid(args.mini) if mini_enabled else np.array([current["mini_base"]])
+    s_axis = parse_grid(args.standard)
+    mm, ss = np.meshgrid(m_axis, s_axis, indexing="ij")
+    minis, standards = mm.ravel(), ss.ravel()
+
+    t0 = time.perf_counter()
+    result = sweep(cols, minis, standards, mini_enabled)
+    t_sweep = time.perf_counter() - t0
+    rows = grid_rows(minis, standards, result, total)
+
+    agree = replay_agreement(cols, current["standard_base"], mini_enabled)
+    print(f"📂 {path}")
+    print(f"   샘플 {total:,}개 로드 {t_load * 1e3:.0f}ms | 그리드 {len(rows):,}포인트 평가 {t_sweep * 1e3:.0f}ms")
+    print(f"   기준 모드 재현 일치율: {agree:,}/{total:,} ({agree / total * 100:.1f}%)"
+          f"{'' if mini_enabled else ' — conservative: MINI 비활성화, mini_base 스윕 생략'}")
+
+    cur = grid_rows(np.array([current["mini_base"]]), np.array([current["standard_base"]]),
+                    sweep(cols, np.array([current["mini_base"]]), np.array([current["standard_base"]]), mini_enabled),
+                    total)
+    print_rows(f"📌 현재 설정 ({args.mode})", cur)
+
+    safe = [r for r in rows if r["fracture_mini"] == 0]
+    best = sorted(safe, key=lambda r: (-r["cost_savings_pct"], r["mini_base"], r["standard_base"]))[:args.top]
+    print_rows(f"🏆 절감률 상위 {len(best)}개 (Fracture→MINI 0)", best)
+
+    unsafe = len(rows) - len(safe)
+    if unsafe:
+        first = min((r for r in rows if r["fracture_mini"]), key=lambda r: r["mini_base"])
+        print(f"\n⚠️  Fracture→MINI 위반 그리드 포인트 {unsafe:,}개 (mini_base >= {first['mini_base']:.3f})")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "details": path,
+                "mode": args.mode,
+                "total_samples": total,
+                "replay_agreement": agree,
+                "grid": rows,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()